@@ -20,6 +20,7 @@ from typing import AsyncGenerator, Optional
 from app.agents.core.graph_manager import GraphManager
 from app.agents.core.messages import construct_langchain_messages
 from app.config.loggers import llm_logger as logger
+from app.core.chat_profiler import timed_stage
 from app.helpers.agent_helpers import (
     build_agent_config,
     build_initial_state,
@@ -70,22 +71,25 @@ async def _core_agent_logic(
 
     # Build langchain messages and get graph concurrently
     history, graph = await asyncio.gather(
-        construct_langchain_messages(
-            messages=request.messages,
-            files_data=request.fileData,
-            currently_uploaded_file_ids=request.fileIds,
-            user_id=user_id,
-            query=request.message,
-            user_name=user.get("name"),
-            user_dict=user,
-            selected_tool=request.selectedTool,
-            tool_category=request.toolCategory,
-            selected_workflow=request.selectedWorkflow,
-            selected_calendar_event=request.selectedCalendarEvent,
-            reply_to_message=request.replyToMessage,
-            trigger_context=trigger_context,
+        timed_stage(
+            "construct_messages",
+            construct_langchain_messages(
+                messages=request.messages,
+                files_data=request.fileData,
+                currently_uploaded_file_ids=request.fileIds,
+                user_id=user_id,
+                query=request.message,
+                user_name=user.get("name"),
+                user_dict=user,
+                selected_tool=request.selectedTool,
+                tool_category=request.toolCategory,
+                selected_workflow=request.selectedWorkflow,
+                selected_calendar_event=request.selectedCalendarEvent,
+                reply_to_message=request.replyToMessage,
+                trigger_context=trigger_context,
+            ),
         ),
-        GraphManager.get_graph("comms_agent"),
+        timed_stage("graph_setup", GraphManager.get_graph("comms_agent")),
     )
     initial_state = build_initial_state(
         request, user_id or "", conversation_id, history, trigger_context
@@ -0,0 +1,177 @@
+"""Pruning of old LangGraph checkpoints from Postgres.
+
+The checkpointer writes a checkpoint for every super-step of every thread
+(conversation) and never deletes any. The app only ever resumes a thread from
+its latest checkpoint, so `prune_checkpoints` keeps the newest `keep_latest`
+checkpoints per thread and namespace and deletes the rest, along with:
+
+- writes whose checkpoint no longer exists, and
+- blobs (channel values) no remaining checkpoint points to. A blob is only
+  deleted if the thread also has a newer version of that channel, so values
+  written just before a checkpoint that isn't committed yet are left alone.
+
+Threads are processed in keyset-paginated batches, each in its own short
+transaction with a lock timeout, so pruning never holds locks for long; a
+batch that can't get its locks is skipped until the next run.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from app.config.loggers import app_logger as logger
+from app.constants.postgres import (
+    CHECKPOINT_KEEP_LATEST,
+    CHECKPOINT_PRUNE_LOCK_TIMEOUT_MS,
+    CHECKPOINT_PRUNE_THREAD_BATCH_SIZE,
+)
+from psycopg import errors
+from psycopg_pool import AsyncConnectionPool
+
+_SELECT_THREADS = """
+SELECT DISTINCT thread_id FROM checkpoints
+WHERE thread_id > %(after)s
+ORDER BY thread_id
+LIMIT %(limit)s
+"""
+
+# checkpoint_id is a UUIDv6, so ordering by it orders by creation time
+# (LangGraph itself reads the latest checkpoint this way)
+_DELETE_OLD_CHECKPOINTS = """
+DELETE FROM checkpoints c
+USING (
+    SELECT thread_id, checkpoint_ns, checkpoint_id
+    FROM (
+        SELECT
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            row_number() OVER (
+                PARTITION BY thread_id, checkpoint_ns
+                ORDER BY checkpoint_id DESC
+            ) AS position
+        FROM checkpoints
+        WHERE thread_id = ANY(%(threads)s)
+    ) ranked
+    WHERE position > %(keep)s
+) old
+WHERE c.thread_id = old.thread_id
+    AND c.checkpoint_ns = old.checkpoint_ns
+    AND c.checkpoint_id = old.checkpoint_id
+"""
+
+_DELETE_ORPHANED_WRITES = """
+DELETE FROM checkpoint_writes w
+WHERE w.thread_id = ANY(%(threads)s)
+    AND NOT EXISTS (
+        SELECT 1 FROM checkpoints c
+        WHERE c.thread_id = w.thread_id
+            AND c.checkpoint_ns = w.checkpoint_ns
+            AND c.checkpoint_id = w.checkpoint_id
+    )
+"""
+
+# Versions are zero-padded strings, so they compare correctly as text
+_DELETE_ORPHANED_BLOBS = """
+DELETE FROM checkpoint_blobs b
+WHERE b.thread_id = ANY(%(threads)s)
+    AND NOT EXISTS (
+        SELECT 1 FROM checkpoints c
+        WHERE c.thread_id = b.thread_id
+            AND c.checkpoint_ns = b.checkpoint_ns
+            AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+    )
+    AND EXISTS (
+        SELECT 1 FROM checkpoints c
+        WHERE c.thread_id = b.thread_id
+            AND c.checkpoint_ns = b.checkpoint_ns
+            AND c.checkpoint -> 'channel_versions' ->> b.channel > b.version
+    )
+"""
+
+
+@dataclass
+class PruneResult:
+    """Rows deleted by one pruning run."""
+
+    threads: int = 0
+    checkpoints: int = 0
+    writes: int = 0
+    blobs: int = 0
+    skipped_batches: int = 0
+
+    @property
+    def rows(self) -> int:
+        return self.checkpoints + self.writes + self.blobs
+
+
+async def _prune_batch(
+    pool: AsyncConnectionPool, threads: List[str], keep_latest: int
+) -> PruneResult:
+    params = {"threads": threads, "keep": keep_latest}
+    async with pool.connection() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                f"SET LOCAL lock_timeout = {int(CHECKPOINT_PRUNE_LOCK_TIMEOUT_MS)}"
+            )
+            checkpoints = await conn.execute(_DELETE_OLD_CHECKPOINTS, params)
+            writes = await conn.execute(_DELETE_ORPHANED_WRITES, params)
+            blobs = await conn.execute(_DELETE_ORPHANED_BLOBS, params)
+            return PruneResult(
+                threads=len(threads),
+                checkpoints=checkpoints.rowcount,
+                writes=writes.rowcount,
+                blobs=blobs.rowcount,
+            )
+
+
+async def prune_checkpoints(
+    pool: AsyncConnectionPool,
+    keep_latest: int = CHECKPOINT_KEEP_LATEST,
+    thread_batch_size: int = CHECKPOINT_PRUNE_THREAD_BATCH_SIZE,
+) -> PruneResult:
+    """
+    Delete all but the newest checkpoints of every thread.
+
+    Args:
+        pool: Pool connected to the checkpointer's database (autocommit)
+        keep_latest: Checkpoints kept per thread and namespace (at least 1)
+        thread_batch_size: Threads pruned per transaction
+
+    Returns:
+        PruneResult with the number of deleted rows per table
+    """
+    if keep_latest < 1:
+        raise ValueError("keep_latest must be at least 1")
+
+    result = PruneResult()
+    after = ""
+    while True:
+        async with pool.connection() as conn:
+            cursor = await conn.execute(
+                _SELECT_THREADS, {"after": after, "limit": thread_batch_size}
+            )
+            threads = [row[0] for row in await cursor.fetchall()]
+        if not threads:
+            break
+        after = threads[-1]
+
+        try:
+            batch = await _prune_batch(pool, threads, keep_latest)
+        except errors.LockNotAvailable:
+            logger.warning(
+                f"Skipped pruning {len(threads)} checkpoint threads: rows are locked"
+            )
+            result.skipped_batches += 1
+            continue
+
+        result.threads += batch.threads
+        result.checkpoints += batch.checkpoints
+        result.writes += batch.writes
+        result.blobs += batch.blobs
+
+    logger.info(
+        f"Pruned checkpoints of {result.threads} threads: deleted "
+        f"{result.checkpoints} checkpoints, {result.writes} writes and "
+        f"{result.blobs} blobs ({result.skipped_batches} batches skipped)"
+    )
+    return result
@@ -8,11 +8,15 @@ Flow
 
 Add/change config
 - Set `POSTGRES_URL` in settings; in dev it can be Optional.
-- To alter pool size, adjust `CheckpointerManager` init params.
+- Pool size depends on the process context (see `app.db.pool_sizing`);
+  override it with `CHECKPOINTER_POOL_MAX_SIZE`.
 """
 
 from app.config.settings import settings
+from app.constants.postgres import POSTGRES_POOL_TIMEOUT
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
+from app.db.pool_metrics import register_psycopg_pool
+from app.db.pool_sizing import get_pool_sizes
 from langgraph.checkpoint.postgres.aio import (
     AsyncPostgresSaver,
 )
@@ -25,9 +29,10 @@ class CheckpointerManager:
     A manager class to handle checkpointer initialization and lifecycle.
     """
 
-    def __init__(self, conninfo: str, max_pool_size: int = 20):
+    def __init__(self, conninfo: str, max_pool_size: int = 20, min_pool_size: int = 4):
         self.conninfo = conninfo
         self.max_pool_size = max_pool_size
+        self.min_pool_size = min(min_pool_size, max_pool_size)
         self.pool = None
         self.checkpointer = None
 
@@ -42,12 +47,15 @@ class CheckpointerManager:
 
         self.pool = AsyncConnectionPool(
             conninfo=self.conninfo,
+            min_size=self.min_pool_size,
             max_size=self.max_pool_size,
             kwargs=connection_kwargs,
             open=False,
-            timeout=5,
+            timeout=POSTGRES_POOL_TIMEOUT,
+            name="checkpointer",
         )
-        await self.pool.open(wait=True, timeout=5)
+        await self.pool.open(wait=True, timeout=POSTGRES_POOL_TIMEOUT)
+        register_psycopg_pool("checkpointer", self.pool)
 
         self.checkpointer = AsyncPostgresSaver(conn=self.pool)  # type: ignore[call-arg]
         await self.checkpointer.setup()
@@ -90,7 +98,12 @@ async def init_checkpointer_manager() -> CheckpointerManager:
         CheckpointerManager: The main checkpointer manager
     """
     conninfo: str = settings.POSTGRES_URL  # type: ignore
-    manager = CheckpointerManager(conninfo=conninfo)
+    pool_sizes = get_pool_sizes()
+    manager = CheckpointerManager(
+        conninfo=conninfo,
+        max_pool_size=pool_sizes.checkpointer_max_size,
+        min_pool_size=pool_sizes.checkpointer_min_size,
+    )
     await manager.setup()
     return manager
 
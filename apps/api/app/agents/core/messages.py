@@ -1,5 +1,6 @@
 from typing import List, Literal, Optional
 
+from app.core.chat_profiler import stage_timer
 from app.helpers.message_helpers import (
     create_system_message,
     format_calendar_event_context,
@@ -70,13 +71,14 @@ async def construct_langchain_messages(
             user_dict.get("onboarding", {}).get("preferences") if user_dict else None
         )
 
-        memory_msg = await get_memory_message(
-            user_id=user_id,
-            query=query,
-            user_name=user_name,
-            user_timezone=user_timezone,
-            user_preferences=user_preferences,
-        )
+        with stage_timer("memory_search"):
+            memory_msg = await get_memory_message(
+                user_id=user_id,
+                query=query,
+                user_name=user_name,
+                user_timezone=user_timezone,
+                user_preferences=user_preferences,
+            )
 
         if memory_msg:
             chain_msgs.append(memory_msg)
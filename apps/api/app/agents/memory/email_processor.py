@@ -48,7 +48,7 @@ from app.agents.memory.profile_extractor import (
 from app.config.loggers import memory_logger as logger
 from app.constants.email import BATCH_SIZE, EMAIL_QUERY, MAX_RESULTS
 from app.db.mongodb.collections import users_collection
-from app.services.mail.mail_service import search_messages
+from app.services.mail.mail_service import iter_search_messages, search_messages
 from app.services.memory_service import memory_service
 from app.services.onboarding.post_onboarding_service import (
     emit_progress,
@@ -130,6 +130,7 @@ async def _search_platform_emails(
             user_id=user_id,
             query=query,
             max_results=max_results,
+            rate_limited=True,
         )
 
         emails = result.get("messages", [])
@@ -173,7 +174,6 @@ async def process_gmail_to_memory(user_id: str) -> Dict:
     total_failed = 0
 
     fetch_start_time = time.time()
-    page_token = None
     batch_count = 0
 
     # Track memory storage tasks to await completion
@@ -213,26 +213,16 @@ async def process_gmail_to_memory(user_id: str) -> Dict:
             current_query = f"{EMAIL_QUERY} after:{timestamp_seconds}"
 
     try:
-        while total_fetched < MAX_RESULTS:
-            remaining = MAX_RESULTS - total_fetched
-            batch_size = min(BATCH_SIZE, remaining)
+        # Pages are yielded as they arrive (next page prefetched in the
+        # background), so cleaning and storage start before the scan finishes
+        async for batch_emails in iter_search_messages(
+            user_id=user_id,
+            query=current_query,
+            max_results=MAX_RESULTS,
+            page_size=BATCH_SIZE,
+        ):
             batch_count += 1
 
-            result = await search_messages(
-                user_id=user_id,
-                query=current_query,
-                max_results=batch_size,
-                page_token=page_token,
-            )
-
-            batch_emails = result.get("messages", [])
-
-            if not batch_emails:
-                break
-
-            # Update page token for next iteration
-            page_token = result.get("nextPageToken")
-
             # Update stats
             total_fetched += len(batch_emails)
 
@@ -267,9 +257,6 @@ async def process_gmail_to_memory(user_id: str) -> Dict:
                 )
                 email_storage_tasks.append(task)
 
-            if not page_token:
-                break
-
     except Exception as e:
         logger.error(f"Error in email processing pipeline: {e}")
 
@@ -13,7 +13,6 @@ import json
 import os
 import re
 import time
-from difflib import SequenceMatcher
 from typing import Dict, List
 
 import ftfy
@@ -26,6 +25,7 @@ from app.constants.general import (
     PROFILE_EXTRACTION_LLM_MODEL,
     PROFILE_EXTRACTION_LLM_PROVIDER,
 )
+from app.utils.near_duplicates import NearDuplicateIndex
 from bs4 import BeautifulSoup  # For HTML cleaning
 from langchain_core.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
@@ -344,7 +344,9 @@ def _deduplicate_emails(emails: List[Dict]) -> List[Dict]:
     Remove duplicate/similar emails based on full content similarity.
 
     Uses Levenshtein-like similarity ratio on entire normalized email bodies
-    to filter out redundant emails before sending to LLM.
+    to filter out redundant emails before sending to LLM. A MinHash LSH index
+    picks which kept emails to compare against, so this runs in roughly
+    linear time instead of comparing every pair.
 
     Args:
         emails: List of email dictionaries
@@ -369,19 +371,8 @@ def _deduplicate_emails(emails: List[Dict]) -> List[Dict]:
         text = re.sub(r"[^\w\s]", "", text)
         return text.strip().lower()
 
-    def calculate_similarity(text1: str, text2: str) -> float:
-        """
-        Calculate similarity ratio between two texts using sequence matching.
-        Returns value between 0 (completely different) and 1 (identical).
-        """
-        if not text1 or not text2:
-            return 0.0
-
-        # Use SequenceMatcher for robust similarity comparison
-        return SequenceMatcher(None, text1, text2).ratio()
-
     unique_emails = []
-    normalized_bodies: List[str] = []
+    index = NearDuplicateIndex(DEDUPLICATION_SIMILARITY_THRESHOLD)
 
     for email in emails:
         # Get full email body (not truncated)
@@ -396,18 +387,8 @@ def _deduplicate_emails(emails: List[Dict]) -> List[Dict]:
         if not normalized:
             continue
 
-        # Check similarity against all existing unique emails
-        is_duplicate = False
-        for existing_normalized in normalized_bodies:
-            similarity = calculate_similarity(normalized, existing_normalized)
-
-            # If similarity exceeds threshold, consider it a duplicate
-            if similarity >= DEDUPLICATION_SIMILARITY_THRESHOLD:
-                is_duplicate = True
-                break
-
-        if not is_duplicate:
-            normalized_bodies.append(normalized)
+        # Keep it unless it's similar enough to an existing unique email
+        if index.add_if_unique(normalized):
             unique_emails.append(email)
             # NO LIMIT - just remove duplicates
 
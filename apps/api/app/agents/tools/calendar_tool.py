@@ -79,6 +79,15 @@ def _auth_headers(access_token: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {access_token}"}
 
 
+def _invalidate_sync_cache(auth_credentials: Dict[str, Any]) -> None:
+    """Drop the user's synced calendar events after changing them."""
+    user_id = _get_user_id(auth_credentials)
+    if user_id:
+        calendar_service.run_sync(
+            calendar_service.invalidate_calendar_sync_cache(user_id)
+        )
+
+
 def register_calendar_custom_tools(composio: Composio) -> List[str]:
     """Register calendar tools as Composio custom tools."""
 
@@ -90,7 +99,9 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
         auth_credentials: Dict[str, Any],
     ) -> Dict[str, Any]:
         access_token = _get_access_token(auth_credentials)
-        calendars = calendar_service.list_calendars(access_token, short=request.short)
+        calendars = calendar_service.run_sync(
+            calendar_service.list_calendars(access_token, short=request.short)
+        )
         return {"calendars": calendars}
 
     @composio.tools.custom_tool(toolkit="GOOGLECALENDAR")
@@ -152,20 +163,22 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
         day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
 
-        result = calendar_service.get_calendar_events(
-            user_id=user_id,
-            access_token=access_token,
-            selected_calendars=None,
-            time_min=day_start.isoformat(),
-            time_max=day_end.isoformat(),
-            max_results=100,
+        result = calendar_service.run_sync(
+            calendar_service.get_calendar_events(
+                user_id=user_id,
+                access_token=access_token,
+                selected_calendars=None,
+                time_min=day_start.isoformat(),
+                time_max=day_end.isoformat(),
+                max_results=100,
+            )
         )
 
         events = result.get("events", [])
 
         try:
-            color_map, name_map = calendar_service.get_calendar_metadata_map(
-                access_token
+            color_map, name_map = calendar_service.run_sync(
+                calendar_service.get_calendar_metadata_map(access_token)
             )
             formatted_events = [
                 calendar_service.format_event_for_frontend(event, color_map, name_map)
@@ -227,21 +240,25 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
 
         time_min = request.time_min or datetime.now(timezone.utc).isoformat()
 
-        result = calendar_service.get_calendar_events(
-            user_id=user_id,
-            access_token=access_token,
-            selected_calendars=request.calendar_ids if request.calendar_ids else None,
-            time_min=time_min,
-            time_max=request.time_max,
-            max_results=request.max_results,
+        result = calendar_service.run_sync(
+            calendar_service.get_calendar_events(
+                user_id=user_id,
+                access_token=access_token,
+                selected_calendars=request.calendar_ids
+                if request.calendar_ids
+                else None,
+                time_min=time_min,
+                time_max=request.time_max,
+                max_results=request.max_results,
+            )
         )
 
         events = result.get("events", [])
 
         # Format events for frontend
         try:
-            color_map, name_map = calendar_service.get_calendar_metadata_map(
-                access_token
+            color_map, name_map = calendar_service.run_sync(
+                calendar_service.get_calendar_metadata_map(access_token)
             )
             calendar_fetch_data = [
                 calendar_service.format_event_for_frontend(event, color_map, name_map)
@@ -265,20 +282,22 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
         access_token = _get_access_token(auth_credentials)
         user_id = _get_user_id(auth_credentials)
 
-        result = calendar_service.search_calendar_events_native(
-            query=request.query,
-            user_id=user_id,
-            access_token=access_token,
-            time_min=request.time_min,
-            time_max=request.time_max,
+        result = calendar_service.run_sync(
+            calendar_service.search_calendar_events_native(
+                query=request.query,
+                user_id=user_id,
+                access_token=access_token,
+                time_min=request.time_min,
+                time_max=request.time_max,
+            )
         )
 
         events = result.get("matching_events", [])
 
         # Format events for frontend
         try:
-            color_map, name_map = calendar_service.get_calendar_metadata_map(
-                access_token
+            color_map, name_map = calendar_service.run_sync(
+                calendar_service.get_calendar_metadata_map(access_token)
             )
             calendar_search_data = [
                 calendar_service.format_event_for_frontend(event, color_map, name_map)
@@ -368,6 +387,9 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
                     }
                 )
 
+        if deleted:
+            _invalidate_sync_cache(auth_credentials)
+
         # If all deletions failed, raise an exception
         if errors and not deleted:
             raise RuntimeError(f"Failed to delete events: {errors}")
@@ -406,6 +428,7 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
 
         resp = _http_client.patch(url, headers=headers, json=body, params=params)
         resp.raise_for_status()
+        _invalidate_sync_cache(auth_credentials)
         return {"event": resp.json()}
 
     @composio.tools.custom_tool(toolkit="GOOGLECALENDAR")
@@ -442,6 +465,7 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
         headers["Content-Type"] = "application/json"
         put_resp = _http_client.put(url, headers=headers, json=event)
         put_resp.raise_for_status()
+        _invalidate_sync_cache(auth_credentials)
 
         return {
             "event": put_resp.json(),
@@ -461,8 +485,8 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
 
         # Get calendar metadata for enrichment
         try:
-            color_map, name_map = calendar_service.get_calendar_metadata_map(
-                access_token
+            color_map, name_map = calendar_service.run_sync(
+                calendar_service.get_calendar_metadata_map(access_token)
             )
         except Exception:
             color_map, name_map = {}, {}
@@ -552,6 +576,9 @@ def register_calendar_custom_tools(composio: Composio) -> List[str]:
                     calendar_option["attendees"] = event.attendees
                 calendar_options.append(calendar_option)
 
+        if created_events:
+            _invalidate_sync_cache(auth_credentials)
+
         # If all events failed with validation errors, raise
         if errors and not created_events and not calendar_options:
             raise ValueError(f"All events failed validation: {errors}")
@@ -46,7 +46,7 @@ async def get_calendar_list(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return calendar_service.list_calendars(access_token)
+        return await calendar_service.list_calendars(access_token)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -110,7 +110,7 @@ async def query_events(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return calendar_service.get_calendar_events(
+        return await calendar_service.get_calendar_events(
             user_id=user_id,
             access_token=access_token,
             page_token=None,
@@ -189,7 +189,7 @@ async def get_events(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return calendar_service.get_calendar_events(
+        return await calendar_service.get_calendar_events(
             user_id=user_id,
             access_token=access_token,
             page_token=page_token,
@@ -264,7 +264,7 @@ async def get_events_by_calendar(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return calendar_service.get_calendar_events_by_id(
+        return await calendar_service.get_calendar_events_by_id(
             calendar_id=calendar_id,
             access_token=access_token,
             page_token=page_token,
@@ -302,7 +302,9 @@ async def create_event(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return calendar_service.create_calendar_event(event, access_token, user_id)
+        return await calendar_service.create_calendar_event(
+            event, access_token, user_id
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -321,7 +323,7 @@ async def get_calendar_preferences(
         HTTPException: If the user is not authenticated or preferences are not found.
     """
     try:
-        return calendar_service.get_user_calendar_preferences(
+        return await calendar_service.get_user_calendar_preferences(
             str(current_user.get("user_id", ""))
         )
     except HTTPException as e:
@@ -349,7 +351,7 @@ async def update_calendar_preferences(
         HTTPException: If the user is not authenticated.
     """
     try:
-        return calendar_service.update_user_calendar_preferences(
+        return await calendar_service.update_user_calendar_preferences(
             current_user["user_id"], preferences.selected_calendars
         )
     except Exception as e:
@@ -382,7 +384,7 @@ async def delete_event(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return delete_calendar_event(event, access_token, user_id)
+        return await delete_calendar_event(event, access_token, user_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -414,7 +416,7 @@ async def update_event(
         # Get token from Composio
         access_token = get_google_calendar_token(str(user_id))
 
-        return update_calendar_event(event, access_token, user_id)
+        return await update_calendar_event(event, access_token, user_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -449,7 +451,7 @@ async def create_events_batch(
 
         for event in batch_request.events:
             try:
-                created_event = calendar_service.create_calendar_event(
+                created_event = await calendar_service.create_calendar_event(
                     event, access_token, user_id
                 )
                 results["successful"].append(created_event)
@@ -496,7 +498,9 @@ async def update_events_batch(
 
         for event in batch_request.events:
             try:
-                updated_event = update_calendar_event(event, access_token, user_id)
+                updated_event = await update_calendar_event(
+                    event, access_token, user_id
+                )
                 results["successful"].append(updated_event)
             except Exception as e:
                 results["failed"].append(
@@ -541,7 +545,7 @@ async def delete_events_batch(
 
         for event in batch_request.events:
             try:
-                delete_calendar_event(event, access_token, user_id)
+                await delete_calendar_event(event, access_token, user_id)
                 results["successful"].append(
                     {
                         "event_id": event.event_id,
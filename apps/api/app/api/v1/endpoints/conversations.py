@@ -1,3 +1,5 @@
+from typing import Optional
+
 from app.api.v1.dependencies.oauth_dependencies import get_current_user
 from app.models.chat_models import (
     BatchSyncRequest,
@@ -74,12 +76,24 @@ async def batch_sync_conversations_endpoint(
 
 @router.get("/conversations/{conversation_id}")
 async def get_conversation_endpoint(
-    conversation_id: str, user: dict = Depends(get_current_user)
+    conversation_id: str,
+    user: dict = Depends(get_current_user),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=200,
+        description="Return only this many messages (latest first page); omit for all",
+    ),
+    before: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Return messages preceding this index (messages_offset of the previous page)",
+    ),
 ) -> JSONResponse:
     """
     Retrieve a specific conversation by its ID.
     """
-    response = await get_conversation(conversation_id, user)
+    response = await get_conversation(conversation_id, user, limit=limit, before=before)
     return JSONResponse(content=response)
 
 
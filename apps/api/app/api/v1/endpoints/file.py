@@ -4,9 +4,11 @@ Router module for file upload functionality with RAG integration.
 
 from app.api.v1.dependencies.oauth_dependencies import get_current_user
 from app.decorators import tiered_rate_limit
+from app.models.files_models import FileStatusResponse
 from app.models.message_models import FileData
 from app.services.file_service import (
     delete_file_service,
+    get_file_status_service,
     update_file_service,
     upload_file_service,
 )
@@ -23,10 +25,15 @@ async def upload_file_endpoint(
     user: dict = Depends(get_current_user),
 ):
     """
-    Upload a file to the server and generate embeddings for image files.
+    Upload a file to the server and queue it for indexing.
 
-    This endpoint uploads files to Cloudinary and stores metadata in MongoDB.
-    For image files, it also generates vector embeddings to enable semantic search.
+    This endpoint uploads files to Cloudinary and stores metadata in MongoDB,
+    then returns with the file's status ("processing"). The file is parsed,
+    summarized and embedded in the background; it's available to chat once
+    its status is "indexed". Clients follow it by polling
+    GET /{file_id}/status until the status is "indexed" or "failed".
+    Progress is also sent over the WebSocket as file_ingestion_progress
+    messages.
 
     Args:
         file: The file to upload
@@ -34,7 +41,7 @@ async def upload_file_endpoint(
         user: The authenticated user information
 
     Returns:
-        File metadata including ID, URL, and auto-generated description
+        File metadata including ID, URL and ingestion status
     """
     user_id = user.get("user_id", None)
     if not user_id:
@@ -52,9 +59,39 @@ async def upload_file_endpoint(
         filename=result["filename"],
         message="File uploaded successfully",
         type=result.get("type", "file"),
+        status=result.get("status"),
     )
 
 
+@router.get(
+    "/{file_id}/status",
+    response_model=FileStatusResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_file_status_endpoint(
+    file_id: str,
+    user: dict = Depends(get_current_user),
+):
+    """
+    Get the ingestion status of an uploaded file.
+
+    Clients poll this after uploading until the status is "indexed", when the
+    file's description is included, or "failed", when the error is included.
+
+    Args:
+        file_id: The ID of the file
+        user: The authenticated user information
+
+    Returns:
+        The file's ingestion status
+    """
+    user_id = user.get("user_id", None)
+    if not user_id:
+        return {"error": "User ID is required"}
+
+    return await get_file_status_service(file_id=file_id, user_id=user_id)
+
+
 @router.put("/{file_id}", status_code=status.HTTP_200_OK)
 async def update_file_endpoint(
     file_id: str,
@@ -1,4 +1,5 @@
 import asyncio
+from datetime import datetime
 from typing import Optional
 
 from app.api.v1.dependencies.oauth_dependencies import get_current_user
@@ -18,6 +19,7 @@ from app.models.notification.request_models import (
 )
 from app.services.device_token_service import get_device_token_service
 from app.services.notification_service import notification_service
+from app.utils.notification.storage import encode_notification_cursor
 from fastapi import (
     APIRouter,
     Body,
@@ -38,6 +40,9 @@ async def get_notifications(
         50, ge=1, le=100, description="Number of notifications to return"
     ),
     offset: int = Query(default=0, ge=0, description="Number of notifications to skip"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (overrides offset)"
+    ),
     channel_type: Optional[str] = Query(
         None, description="Filter by channel type (e.g., email, sms)"
     ),
@@ -52,22 +57,34 @@ async def get_notifications(
         )
 
     try:
+        # Fetch one extra row to know whether another page exists
         notifications, notification_count = await asyncio.gather(
             notification_service.get_user_notifications(
-                user_id, status, limit + 1, offset, channel_type
+                user_id, status, limit + 1, offset, channel_type, cursor=cursor
             ),
             notification_service.get_user_notifications_count(
                 user_id, status, channel_type
             ),
         )
 
+        next_cursor = None
+        if len(notifications) > limit:
+            notifications = notifications[:limit]
+            last = notifications[-1]
+            next_cursor = encode_notification_cursor(
+                datetime.fromisoformat(last["created_at"]), last["id"]
+            )
+
         return PaginatedNotificationsResponse(
             notifications=notifications,
             total=notification_count,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor,
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Failed to get notifications: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -3,6 +3,8 @@ Profiling middleware for performance monitoring using pyinstrument.
 
 This module provides middleware for profiling HTTP requests with detailed call stack analysis.
 Profiling is completely optional and must be explicitly enabled via environment variables.
+When the event-loop monitor is running, every request is also attributed the
+worst loop lag seen while it was in flight, keyed by route template.
 """
 
 import random
@@ -13,6 +15,7 @@ from fastapi.responses import HTMLResponse
 
 from app.config.loggers import profiler_logger as logger
 from app.config.settings import settings
+from app.core.loop_monitor import loop_monitor
 
 # Import pyinstrument with fallback
 PYINSTRUMENT_AVAILABLE = False
@@ -38,9 +41,13 @@ class ProfilingMiddleware(BaseHTTPMiddleware):
 
     The profiling report is returned as HTML when profiling is active.
 
+    Independently, when ENABLE_LOOP_MONITOR=true each request is tracked by
+    the event-loop monitor so lag histograms are broken down per endpoint.
+
     Environment Variables:
         ENABLE_PROFILING: bool = False (must be explicitly enabled)
         PROFILING_SAMPLE_RATE: float = 0.1 (10% sampling rate)
+        ENABLE_LOOP_MONITOR: bool = False (event-loop lag per endpoint)
 
     Usage:
         Add ?profile=1 to any request URL to get a profiling report (when enabled).
@@ -67,6 +74,19 @@ class ProfilingMiddleware(BaseHTTPMiddleware):
             logger.info("PyInstrument profiling disabled (ENABLE_PROFILING=false)")
 
     async def dispatch(self, request: Request, call_next) -> Response:
+        if not loop_monitor.running:
+            return await self._profile(request, call_next)
+
+        with loop_monitor.track(f"{request.method} <unmatched>") as scope:
+            response = await self._profile(request, call_next)
+            # The router stores the matched route in the shared scope; use its
+            # template so path parameters don't explode the label space
+            route = request.scope.get("route")
+            if route is not None and hasattr(route, "path"):
+                scope.label = f"{request.method} {route.path}"
+            return response
+
+    async def _profile(self, request: Request, call_next) -> Response:
         # Check if profiling is available and enabled
         if (
             not settings.ENABLE_PROFILING
@@ -89,6 +89,20 @@ class CommonSettings(BaseAppSettings):
     # ----------------------------------------------
     ENABLE_PROFILING: bool = False  # Must be explicitly enabled via .env
     PROFILING_SAMPLE_RATE: float = 1.0  # 100% of requests by default
+    ENABLE_LOOP_MONITOR: bool = False  # Event-loop lag + blocking-call detection
+    LOOP_BLOCK_THRESHOLD_MS: float = 100.0  # Log the stack of longer stalls
+    CHAT_PROFILE_SAMPLE_RATE: float = 0.0  # Fraction of chat streams to profile
+    CHAT_PROFILE_DIR: str = "profiles/chat"  # Where sampled HTML profiles go
+
+    # ----------------------------------------------
+    # Postgres Connection Pools (defaults per context in constants/postgres.py)
+    # ----------------------------------------------
+    POSTGRES_POOL_SIZE: Optional[int] = None  # SQLAlchemy pool for this process
+    POSTGRES_MAX_OVERFLOW: Optional[int] = None
+    CHECKPOINTER_POOL_MAX_SIZE: Optional[int] = None  # LangGraph checkpointer pool
+    POSTGRES_MAX_CONNECTIONS: Optional[int] = None  # Server limit; enables budget check
+    API_PROCESS_COUNT: int = 1  # API processes sharing the server
+    ARQ_WORKER_COUNT: int = 1  # ARQ worker processes sharing the server
 
     # ----------------------------------------------
     # Skill Learning (Agent Memory)
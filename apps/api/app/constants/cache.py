@@ -27,10 +27,32 @@ MCP_TOOLS_CACHE_TTL = ONE_DAY_TTL
 GLOBAL_TOOLS_CACHE_TTL = SIX_HOUR_TTL
 COMMUNITY_CACHE_TTL = FIVE_MINUTES_TTL
 FAVICON_CACHE_TTL = SIX_MONTH_TTL
+FAVICON_NEGATIVE_CACHE_TTL = THIRTY_MINUTES_TTL
+URL_METADATA_CACHE_TTL = 864_000
+URL_METADATA_NEGATIVE_CACHE_TTL = TEN_MINUTES_TTL
 SEARCH_CACHE_TTL = ONE_DAY_TTL
 STREAM_TTL = FIVE_MINUTES_TTL
 STATE_TOKEN_TTL = TEN_MINUTES_TTL
 MOBILE_REDIRECT_TTL = FIVE_MINUTES_TTL
+COMPOSIO_TOOL_CACHE_TTL = THIRTY_MINUTES_TTL
+COMPOSIO_TOOLKIT_SCHEMA_TTL = ONE_DAY_TTL
+COMPOSIO_TOOLKIT_SCHEMA_VERSIONED_TTL = SIX_MONTH_TTL
+CALENDAR_SYNC_CACHE_TTL = ONE_DAY_TTL
+NOTIFICATION_COUNTS_CACHE_TTL = ONE_DAY_TTL
+MCP_TOOL_SCHEMA_CACHE_TTL = ONE_DAY_TTL
+
+# Single-flight cache fills (see Cacheable): how long one fill may hold its
+# Redis lock, and how often other processes poll for its result meanwhile
+CACHE_FILL_LOCK_TTL = 60
+CACHE_FILL_POLL_INTERVAL = 0.1
+
+# Process-local cache of Mem0 searches; short enough that memories written
+# by other processes show up within a few seconds
+MEMORY_SEARCH_CACHE_TTL = 30
+
+# Cache sizes
+COMPOSIO_TOOL_CACHE_MAX_SIZE = 2_000
+MEMORY_SEARCH_CACHE_MAX_SIZE = 1_000
 
 # Cache key prefixes
 TEAM_CACHE_PREFIX = "team"
@@ -46,3 +68,7 @@ STREAM_CHANNEL_PREFIX = "stream:channel:"
 STREAM_SIGNAL_PREFIX = "stream:signal:"
 STREAM_PROGRESS_PREFIX = "stream:progress:"
 STATE_KEY_PREFIX = "oauth_state"
+COMPOSIO_TOOLKIT_SCHEMA_CACHE_PREFIX = "composio:toolkit_schemas"
+CALENDAR_SYNC_CACHE_PREFIX = "calendar:sync"
+NOTIFICATION_COUNTS_CACHE_PREFIX = "notification:counts"
+MCP_TOOL_SCHEMA_CACHE_PREFIX = "mcp:tool_schemas:v2"
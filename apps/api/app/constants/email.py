@@ -12,3 +12,13 @@ NO_SUBJECT = "[No Subject]"
 EMAIL_QUERY = "in:inbox"
 MAX_RESULTS = 100
 BATCH_SIZE = 50
+
+# Gmail API per-user quota (https://developers.google.com/gmail/api/reference/quota)
+GMAIL_USER_QUOTA_UNITS_PER_SECOND = 250
+GMAIL_MAX_TRACKED_USERS = 1000
+
+# Concurrent detail fetching
+GMAIL_FETCH_CONCURRENCY = 10
+GMAIL_FETCH_MAX_RETRIES = 4
+GMAIL_BACKOFF_BASE_SECONDS = 1.0
+GMAIL_BACKOFF_MAX_SECONDS = 32.0
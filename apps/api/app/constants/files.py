@@ -0,0 +1,38 @@
+"""
+File Constants
+"""
+
+# Background ingestion of uploads (see services/file_ingestion_service.py).
+# A failing stage is retried FILE_INGESTION_STAGE_MAX_ATTEMPTS times in all,
+# waiting FILE_INGESTION_RETRY_DELAY seconds and doubling after each failure.
+FILE_INGESTION_STAGE_MAX_ATTEMPTS = 3
+FILE_INGESTION_RETRY_DELAY = 5
+
+# One ingestion job may run this long; parsing and summarizing a large PDF
+# takes far longer than the worker's default job timeout
+FILE_INGESTION_JOB_TIMEOUT = 900
+
+# Files whose ingestion made no progress for this long (the job crashed, timed
+# out or was never queued) are re-queued, resuming at their last finished
+# stage, at most FILE_INGESTION_MAX_RESUMES times
+FILE_INGESTION_STALE_MINUTES = 20
+FILE_INGESTION_MAX_RESUMES = 3
+FILE_INGESTION_RESUME_LIMIT = 50
+
+# Stand-ins for the description of an attached file that isn't indexed, so the
+# model can tell the user instead of silently ignoring the attachment
+FILE_PROCESSING_DESCRIPTION = (
+    "This file is still being processed, so its contents aren't available yet. "
+    "Let the user know and suggest asking again in a moment."
+)
+FILE_FAILED_DESCRIPTION = (
+    "This file could not be processed, so its contents aren't available. "
+    "Let the user know they may need to upload it again."
+)
+
+# Seconds allowed for the worker to download a stored upload
+FILE_DOWNLOAD_TIMEOUT = 60.0
+
+# Largest accepted upload, and the chunk size uploads are hashed in
+FILE_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
@@ -9,5 +9,9 @@ NEW_MESSAGE_BREAKER = "<NEW_MESSAGE_BREAK>"
 
 MAX_EMAILS_PER_PLATFORM = 20
 DEDUPLICATION_SIMILARITY_THRESHOLD = 0.9
+# MinHash LSH banding for near-duplicate candidates (see utils/near_duplicates.py)
+DEDUPLICATION_LSH_BANDS = 32
+DEDUPLICATION_LSH_ROWS = 2
+DEDUPLICATION_MAX_CANDIDATES = 8
 PROFILE_EXTRACTION_LLM_PROVIDER = "gemini"
 PROFILE_EXTRACTION_LLM_MODEL = "gemini-2.0-flash"
@@ -0,0 +1,13 @@
+"""
+HTTP Client Constants
+"""
+
+# Shared outbound client (see utils/http_client.py)
+HTTP_CLIENT_TIMEOUT = 10.0
+HTTP_CLIENT_MAX_CONNECTIONS = 200
+HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_CLIENT_KEEPALIVE_EXPIRY = 30.0
+
+# Concurrent requests allowed to a single host, so unfurling a message full
+# of links to one site doesn't open a burst of connections to it
+HTTP_CLIENT_MAX_PER_HOST = 8
@@ -4,5 +4,8 @@ MCP and Integration Constants.
 Centralized constants for MCP services.
 """
 
+# Per-server limit for session handshake + tool discovery during bulk reconnects
+MCP_CONNECT_TIMEOUT_SECONDS = 20
+
 YELP_MCP_SERVER_URL = "https://backend.composio.dev/v3/mcp/8e1efded-6b08-4346-a657-92d0b94399e5/mcp?user_id=pg-test-15a6d21a-2a4b-4be5-98c9-d92f55b3ccc3"
 INSTACART_MCP_SERVER_URL = "https://backend.composio.dev/v3/mcp/6bb2556a-57ef-4daa-81ad-bd1e3f9e443d/mcp?user_id=pg-test-15a6d21a-2a4b-4be5-98c9-d92f55b3ccc3"
@@ -0,0 +1,32 @@
+"""
+Memory Constants
+"""
+
+# Write-behind buffer for per-turn memories (see services/memory_buffer_service.py).
+# A conversation's buffer is flushed as one Mem0 batch once it holds
+# MEMORY_BUFFER_MAX_MESSAGES messages, MEMORY_BUFFER_MAX_AGE seconds after its
+# first message, or when the user moves on to another conversation.
+MEMORY_BUFFER_MAX_MESSAGES = 10
+MEMORY_BUFFER_MAX_AGE = 120
+MEMORY_BUFFER_MAX_BATCH = 50
+
+# Messages kept per conversation while Mem0 is unavailable; older ones are
+# dropped past this so an outage can't grow Redis without bound
+MEMORY_BUFFER_MAX_BACKLOG = 500
+
+# Flushes running at once per process. When all are busy, size-triggered
+# flushes are deferred so a slow backend receives fewer, larger batches.
+MEMORY_BUFFER_MAX_CONCURRENT_FLUSHES = 4
+
+# One flush may take at most MEMORY_BUFFER_FLUSH_TIMEOUT; its Redis lease
+# outlives that so two processes never drain the same buffer at once
+MEMORY_BUFFER_FLUSH_TIMEOUT = 60
+MEMORY_BUFFER_LEASE_TTL = 2 * MEMORY_BUFFER_FLUSH_TIMEOUT
+
+# Failed flushes are retried after MEMORY_BUFFER_RETRY_DELAY seconds; a batch
+# that fails MEMORY_BUFFER_MAX_ATTEMPTS times in a row is dropped
+MEMORY_BUFFER_RETRY_DELAY = 60
+MEMORY_BUFFER_MAX_ATTEMPTS = 10
+
+# Due buffers flushed per sweep
+MEMORY_BUFFER_SWEEP_LIMIT = 200
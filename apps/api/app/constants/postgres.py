@@ -0,0 +1,46 @@
+"""
+PostgreSQL Constants
+"""
+
+# Default per-process pool sizes by startup context (see db/pool_sizing.py).
+# The API serves many concurrent chat streams that read and write LangGraph
+# checkpoints; an ARQ worker runs at most WorkerSettings.max_jobs (10) jobs
+# at once, so it never needs more checkpointer connections than that.
+POSTGRES_POOL_SIZES = {
+    "main_app": {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "checkpointer_min_size": 4,
+        "checkpointer_max_size": 20,
+    },
+    "arq_worker": {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "checkpointer_min_size": 2,
+        "checkpointer_max_size": 10,
+    },
+}
+
+# Seconds the LangGraph checkpointer pool waits for a connection before
+# failing. The SQLAlchemy engine keeps its default pool_timeout (30s).
+POSTGRES_POOL_TIMEOUT = 5
+
+# Server connections left for the LangGraph store setup, migrations and psql
+POSTGRES_RESERVED_CONNECTIONS = 10
+
+# Warn when waiting for a connection takes more than this share of the checkout
+# (the wait plus the time the connection is held), and at least
+# POOL_WAIT_WARNING_MIN_MS. This is pool-level: it says nothing about how much
+# of a request's latency was spent waiting.
+POOL_WAIT_WARNING_RATIO = 0.5
+POOL_WAIT_WARNING_MIN_MS = 50
+
+# How often pool metrics and wait warnings are logged
+POOL_METRICS_REPORT_INTERVAL_SECONDS = 300
+
+# LangGraph checkpoint pruning (see graph_builder/checkpoint_pruning.py): the
+# newest checkpoints kept per thread and namespace, threads pruned per
+# transaction, and how long a batch may wait for a row lock before it's skipped
+CHECKPOINT_KEEP_LATEST = 10
+CHECKPOINT_PRUNE_THREAD_BATCH_SIZE = 100
+CHECKPOINT_PRUNE_LOCK_TIMEOUT_MS = 5_000
@@ -0,0 +1,31 @@
+"""
+Profiling Constants.
+
+Constants for event-loop monitoring and latency histograms.
+"""
+
+# Upper bounds (ms) of latency histogram buckets; larger values land in +Inf
+LATENCY_BUCKETS_MS = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+)
+
+# How often the heartbeat task wakes up to measure event-loop lag
+LOOP_MONITOR_INTERVAL_SECONDS = 0.05
+
+# How often the loop monitor logs a summary of its lag histograms
+LOOP_MONITOR_REPORT_INTERVAL_SECONDS = 60
+
+# How often chat pipeline stage histograms are logged (checked per stream)
+CHAT_METRICS_REPORT_INTERVAL_SECONDS = 300
@@ -0,0 +1,20 @@
+"""
+Scheduler Constants
+"""
+
+from datetime import timedelta
+
+# Only tasks due within this window are enqueued in ARQ. Tasks further out
+# stay in MongoDB and are picked up by the periodic enqueue scan.
+SCHEDULER_LOOKAHEAD_WINDOW = timedelta(minutes=30)
+
+# Minutes past the hour at which the enqueue scan runs; must be well inside
+# the lookahead window so no task is missed between two scans
+SCHEDULER_ENQUEUE_SCAN_MINUTES = set(range(0, 60, 5))
+
+# Number of enqueue_job calls issued concurrently during a scan
+SCHEDULER_ENQUEUE_BATCH_SIZE = 50
+
+# A claimed task due later than this is a stale job left behind by a
+# reschedule and is released instead of executed
+SCHEDULER_EARLY_EXECUTION_TOLERANCE = timedelta(seconds=60)
@@ -10,3 +10,13 @@ MAX_TOTAL_CONTENT = 20000  # Max total characters for all webpages combined
 
 # Request timeouts (seconds)
 URL_TIMEOUT = 20.0
+
+# Provider SDK calls run on bounded thread pools (see utils/executor_utils.py)
+TAVILY_MAX_CONCURRENCY = 8
+TAVILY_TIMEOUT = 30.0
+FIRECRAWL_MAX_CONCURRENCY = 8
+FIRECRAWL_TIMEOUT = 60.0
+
+# Cached search and scrape results are served this long past their TTL while
+# being refreshed in the background
+SEARCH_CACHE_STALE_TTL = 3_600
@@ -0,0 +1,20 @@
+"""
+WebSocket Constants
+"""
+
+# Fanout exchange every API replica binds to for live WebSocket broadcasts
+WEBSOCKET_BROADCAST_EXCHANGE = "websocket-broadcast"
+
+# Legacy point-to-point queue; still drained so in-flight messages from
+# older workers are delivered during rolling deploys
+WEBSOCKET_LEGACY_QUEUE = "websocket-events"
+
+# Per-connection outbound queue size. A client that falls this far behind is
+# treated as a slow consumer and disconnected so it can reconnect and resync.
+WEBSOCKET_SEND_QUEUE_SIZE = 256
+
+# Seconds a single send may take before the connection is considered stalled
+WEBSOCKET_SEND_TIMEOUT = 10.0
+
+# Close code sent to slow consumers (1013: Try Again Later)
+WEBSOCKET_SLOW_CONSUMER_CLOSE_CODE = 1013
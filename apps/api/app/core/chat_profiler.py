@@ -0,0 +1,142 @@
+"""
+Always-on stage timing for the chat pipeline.
+
+Chat responses are produced by ``run_chat_stream_background`` after the HTTP
+request has returned, so ``ProfilingMiddleware`` never sees that work. Instead
+each pipeline stage is wrapped in ``stage_timer`` and recorded into a
+per-stage latency histogram:
+
+- ``model_selection``, ``construct_messages``, ``memory_search``,
+  ``graph_setup``, ``time_to_first_token``, ``redis_publish``, ``mongo_save``
+- ``tool:<name>`` - from the tool call being emitted to its result arriving
+
+Timing costs two ``perf_counter`` calls per stage. Histograms are logged
+periodically and available via ``get_chat_metrics()``.
+
+Optionally, a fraction of whole streams (``CHAT_PROFILE_SAMPLE_RATE``) is
+profiled with pyinstrument and written as HTML to ``CHAT_PROFILE_DIR``.
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Iterator, Optional, TypeVar
+
+from app.config.loggers import profiler_logger as logger
+from app.config.settings import settings
+from app.constants.profiling import CHAT_METRICS_REPORT_INTERVAL_SECONDS
+from app.utils.metrics_utils import Histogram, snapshot_histograms
+
+# Import pyinstrument with fallback
+Profiler: type | None = None
+try:
+    from pyinstrument import Profiler as _Profiler
+
+    Profiler = _Profiler
+except ImportError:
+    pass
+
+T = TypeVar("T")
+
+_stage_histograms: Dict[str, Histogram] = {}
+_next_report = time.monotonic() + CHAT_METRICS_REPORT_INTERVAL_SECONDS
+
+# Only one sampled stream profile at a time per process
+_profile_active = False
+
+
+def record_stage(stage: str, duration_ms: float) -> None:
+    """Record one observation of a pipeline stage."""
+    histogram = _stage_histograms.get(stage)
+    if histogram is None:
+        histogram = _stage_histograms[stage] = Histogram()
+    histogram.observe(duration_ms)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Time the enclosed block as one observation of ``stage``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, (time.perf_counter() - start) * 1000)
+
+
+async def timed_stage(stage: str, awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable`` under ``stage_timer``, e.g. inside asyncio.gather."""
+    with stage_timer(stage):
+        return await awaitable
+
+
+def get_chat_metrics() -> Dict[str, Any]:
+    """Snapshot of all chat stage histograms."""
+    return snapshot_histograms(_stage_histograms)
+
+
+def maybe_report_chat_metrics() -> None:
+    """Log the stage histograms at most once per report interval."""
+    global _next_report
+
+    now = time.monotonic()
+    if now < _next_report or not _stage_histograms:
+        return
+    _next_report = now + CHAT_METRICS_REPORT_INTERVAL_SECONDS
+    logger.info(f"Chat stage latency: {get_chat_metrics()}")
+
+
+def start_stream_profile() -> Optional[Any]:
+    """
+    Start a pyinstrument profile for the current stream if it is sampled.
+
+    Must be called from the stream's own task; async mode restricts the
+    profile to that task's context. Returns the profiler or None.
+    """
+    global _profile_active
+
+    if (
+        Profiler is None
+        or _profile_active
+        or settings.CHAT_PROFILE_SAMPLE_RATE <= 0
+        or random.random() >= settings.CHAT_PROFILE_SAMPLE_RATE  # nosec: B311
+    ):
+        return None
+
+    profiler = Profiler(async_mode="enabled")
+    try:
+        profiler.start()
+    except RuntimeError as e:
+        # Another profiler (e.g. ProfilingMiddleware) owns this context
+        logger.debug(f"Skipping chat stream profile: {e}")
+        return None
+
+    _profile_active = True
+    return profiler
+
+
+async def finish_stream_profile(profiler: Optional[Any], stream_id: str) -> None:
+    """Stop a sampled profile and write its HTML report to disk."""
+    global _profile_active
+
+    if profiler is None:
+        return
+
+    try:
+        profiler.stop()
+        html = profiler.output_html()
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = Path(settings.CHAT_PROFILE_DIR) / f"{timestamp}_{stream_id}.html"
+        await asyncio.to_thread(_write_profile, path, html)
+        logger.info(f"Wrote chat stream profile to {path}")
+    except Exception as e:
+        logger.warning(f"Failed to write chat stream profile for {stream_id}: {e}")
+    finally:
+        _profile_active = False
+
+
+def _write_profile(path: Path, html: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html, encoding="utf-8")
@@ -0,0 +1,192 @@
+"""
+Event-loop lag monitoring and blocking-call detection.
+
+Opt-in via ``ENABLE_LOOP_MONITOR``. A heartbeat task sleeps for a short
+interval and records how late it wakes up; that delay is the event-loop lag
+every coroutine in the process experienced at that moment. A watchdog thread
+watches the heartbeat and, when it is overdue by more than
+``LOOP_BLOCK_THRESHOLD_MS``, logs the event-loop thread's current stack - i.e.
+the synchronous call that is blocking the loop.
+
+Lag is recorded globally and per scope. HTTP requests (via
+``ProfilingMiddleware``) and ARQ jobs (via ``track_loop_lag``) open a scope,
+and each scope records the worst lag observed while it was in flight into a
+histogram keyed by route template or task name.
+"""
+
+import asyncio
+import functools
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+from app.config.loggers import profiler_logger as logger
+from app.config.settings import settings
+from app.constants.profiling import (
+    LOOP_MONITOR_INTERVAL_SECONDS,
+    LOOP_MONITOR_REPORT_INTERVAL_SECONDS,
+)
+from app.utils.metrics_utils import Histogram, snapshot_histograms
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class LoopLagScope:
+    """An in-flight request or job; tracks the worst lag seen while it runs."""
+
+    __slots__ = ("label", "max_lag_ms")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.max_lag_ms = 0.0
+
+
+class LoopMonitor:
+    """Measures event-loop lag and reports callbacks that block the loop."""
+
+    def __init__(self) -> None:
+        self.lag = Histogram()
+        self.scope_lag: Dict[str, Histogram] = {}
+        self.blocked_calls = 0
+        self._active: Dict[int, LoopLagScope] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._reported_beat = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None
+
+    def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog thread."""
+        if self.running:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog_thread = threading.Thread(
+            target=self._watchdog, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog_thread.start()
+        logger.info(
+            f"Event loop monitor started: "
+            f"block_threshold={settings.LOOP_BLOCK_THRESHOLD_MS}ms"
+        )
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+
+        self._stop_event.set()
+        task, self._heartbeat_task = self._heartbeat_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info(f"Event loop monitor stopped: {self.get_metrics()['lag']}")
+
+    @contextmanager
+    def track(self, label: str) -> Iterator[LoopLagScope]:
+        """
+        Attribute lag observed while the block runs to ``label``.
+
+        The label may be changed on the yielded scope before the block exits,
+        e.g. once the route template is known.
+        """
+        scope = LoopLagScope(label)
+        key = id(scope)
+        self._active[key] = scope
+        try:
+            yield scope
+        finally:
+            del self._active[key]
+            histogram = self.scope_lag.get(scope.label)
+            if histogram is None:
+                histogram = self.scope_lag[scope.label] = Histogram()
+            histogram.observe(scope.max_lag_ms)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "lag": self.lag.snapshot(),
+            "blocked_calls": self.blocked_calls,
+            "scopes": snapshot_histograms(self.scope_lag),
+        }
+
+    async def _heartbeat(self) -> None:
+        next_report = time.monotonic() + LOOP_MONITOR_REPORT_INTERVAL_SECONDS
+        while True:
+            beat = time.monotonic()
+            self._last_beat = beat
+            await asyncio.sleep(LOOP_MONITOR_INTERVAL_SECONDS)
+
+            now = time.monotonic()
+            lag_ms = max(0.0, (now - beat - LOOP_MONITOR_INTERVAL_SECONDS) * 1000)
+            self.lag.observe(lag_ms)
+            for scope in self._active.values():
+                if lag_ms > scope.max_lag_ms:
+                    scope.max_lag_ms = lag_ms
+
+            if now >= next_report:
+                next_report = now + LOOP_MONITOR_REPORT_INTERVAL_SECONDS
+                logger.info(f"Event loop lag: {self.get_metrics()}")
+
+    def _watchdog(self) -> None:
+        threshold = settings.LOOP_BLOCK_THRESHOLD_MS / 1000
+        while not self._stop_event.wait(threshold / 2):
+            beat = self._last_beat
+            blocked_for = time.monotonic() - beat - LOOP_MONITOR_INTERVAL_SECONDS
+            if blocked_for < threshold or beat == self._reported_beat:
+                continue
+
+            # Report each stall once, with the stack the loop is stuck in
+            self._reported_beat = beat
+            self.blocked_calls += 1
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            try:
+                active = sorted({scope.label for scope in self._active.values()})
+            except RuntimeError:
+                # Mutated by the loop thread while we read it
+                active = []
+            logger.warning(
+                f"Event loop blocked for {blocked_for * 1000:.0f}ms "
+                f"(active: {', '.join(active) or 'none'})\n{stack}"
+            )
+
+
+loop_monitor = LoopMonitor()
+
+
+def track_loop_lag(func: F) -> F:
+    """Attribute event-loop lag to an ARQ task while it runs."""
+    label = f"task:{func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not loop_monitor.running:
+            return await func(*args, **kwargs)
+        with loop_monitor.track(label):
+            return await func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+async def init_loop_monitor() -> None:
+    """Start the loop monitor if enabled."""
+    if settings.ENABLE_LOOP_MONITOR:
+        loop_monitor.start()
+
+
+async def close_loop_monitor() -> None:
+    """Stop the loop monitor."""
+    await loop_monitor.stop()
@@ -31,8 +31,10 @@ from app.config.loggers import app_logger as logger
 from app.config.opik import init_opik
 from app.config.posthog import init_posthog
 from app.core.lazy_loader import providers
+from app.core.loop_monitor import close_loop_monitor, init_loop_monitor
 from app.db.chroma.chroma_tools_store import initialize_chroma_tools_store
 from app.db.chroma.chromadb import init_chroma
+from app.db.pool_sizing import check_connection_budget, set_pool_context
 from app.db.postgresql import init_postgresql_engine
 from app.db.rabbitmq import init_rabbitmq_publisher
 from app.helpers.lifespan_helpers import (
@@ -50,10 +52,16 @@ from app.helpers.lifespan_helpers import (
     init_workflow_service,
     # setup_event_loop_policy,
 )
+from app.services.calendar_service import (
+    close_calendar_http_client,
+    init_calendar_http_client,
+)
 from app.services.composio.composio_service import init_composio_service
 from app.services.mcp.mcp_client_pool import init_mcp_client_pool
+from app.services.memory_buffer_service import close_memory_write_buffer
 from app.services.startup_validation import validate_startup_requirements
 from app.services.tools.tools_warmup import warmup_tools_cache
+from app.utils.http_client import close_http_client, init_http_client
 from pydantic import PydanticDeprecatedSince20
 
 
@@ -84,6 +92,10 @@ async def unified_startup(context: Literal["main_app", "arq_worker"]) -> None:
     """
     logger.info(f"Starting {context} with unified provider system...")
 
+    # Postgres pools are sized per context; must precede provider creation
+    set_pool_context(context)
+    check_connection_budget()
+
     # Register lazy providers (dormant until first access)
     # These set up factory functions but don't connect to services yet
     logger.info(f"Registering lazy providers for {context}...")
@@ -108,9 +120,12 @@ async def unified_startup(context: Literal["main_app", "arq_worker"]) -> None:
     # Define eager services (must be ready before processing requests/tasks)
     # Base services needed by both FastAPI and ARQ worker
     eager_services = [
+        (init_loop_monitor, "loop_monitor"),
         (init_mongodb_async, "mongodb"),
         (init_reminder_service, "reminder_service"),
         (init_workflow_service, "workflow_service"),
+        (init_calendar_http_client, "calendar_http_client"),
+        (init_http_client, "http_client"),
     ]
 
     # Context-specific services: WebSocket only needed for web interface
@@ -164,6 +179,10 @@ async def unified_shutdown(context: Literal["main_app", "arq_worker"]) -> None:
         (close_workflow_scheduler, "workflow_scheduler"),
         (close_checkpointer_manager, "checkpointer_manager"),
         (close_mcp_client_pool, "mcp_client_pool"),
+        (close_calendar_http_client, "calendar_http_client"),
+        (close_http_client, "http_client"),
+        (close_memory_write_buffer, "memory_write_buffer"),
+        (close_loop_monitor, "loop_monitor"),
     ]
 
     # Context-specific cleanup: additional services only for FastAPI
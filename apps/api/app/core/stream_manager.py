@@ -54,6 +54,7 @@ from app.constants.streaming import (
     STREAM_DONE_SIGNAL,
     STREAM_ERROR_SIGNAL,
 )
+from app.core.chat_profiler import stage_timer
 from app.db.redis import redis_cache
 
 
@@ -164,7 +165,8 @@ class StreamManager:
             stream_id: Stream identifier
             chunk: SSE-formatted chunk to publish
         """
-        await cls._publish(stream_id, chunk)
+        with stage_timer("redis_publish"):
+            await cls._publish(stream_id, chunk)
 
     @classmethod
     async def subscribe_stream(cls, stream_id: str) -> AsyncGenerator[str, None]:
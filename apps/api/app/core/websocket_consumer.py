@@ -1,15 +1,23 @@
 """
 WebSocket event consumer for processing RabbitMQ messages in the main app.
+
+Each API replica binds its own exclusive queue to the broadcast fanout
+exchange, so every replica sees every broadcast and delivers it to the sockets
+it holds.
 """
 
 import json
 from typing import Optional
 
-from aio_pika import connect_robust
-from aio_pika.abc import AbstractIncomingMessage
+from aio_pika import ExchangeType, connect_robust
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueue
 
 from app.config.loggers import app_logger as logger
 from app.config.settings import settings
+from app.constants.websocket import (
+    WEBSOCKET_BROADCAST_EXCHANGE,
+    WEBSOCKET_LEGACY_QUEUE,
+)
 from app.core.websocket_manager import websocket_manager
 
 
@@ -19,25 +27,38 @@ class WebSocketEventConsumer:
     def __init__(self):
         self.connection = None
         self.channel = None
-        self.queue = None
-        self.consumer_tag = None
+        self.consumers: list[tuple[AbstractQueue, str]] = []
 
     async def start(self) -> None:
         """Start the WebSocket event consumer"""
         try:
             self.connection = await connect_robust(settings.RABBITMQ_URL, timeout=10)
             self.channel = await self.connection.channel()
-            await self.channel.set_qos(prefetch_count=10)
+            await self.channel.set_qos(prefetch_count=100)
+
+            # Per-replica queue bound to the fanout exchange: every replica
+            # receives every broadcast. Exclusive + auto-delete so the queue
+            # disappears with this process.
+            exchange = await self.channel.declare_exchange(
+                WEBSOCKET_BROADCAST_EXCHANGE, ExchangeType.FANOUT, durable=True
+            )
+            broadcast_queue = await self.channel.declare_queue(
+                exclusive=True, auto_delete=True
+            )
+            await broadcast_queue.bind(exchange)
 
-            # Declare the websocket-events queue
-            self.queue = await self.channel.declare_queue(
-                "websocket-events", durable=True
+            # Legacy shared queue, kept for messages published by older workers
+            legacy_queue = await self.channel.declare_queue(
+                WEBSOCKET_LEGACY_QUEUE, durable=True
             )
 
-            # Start consuming
-            await self.queue.consume(self._handle_websocket_message)
+            for queue in (broadcast_queue, legacy_queue):
+                consumer_tag = await queue.consume(self._handle_websocket_message)
+                self.consumers.append((queue, consumer_tag))
 
-            logger.info("WebSocket event consumer started on queue: websocket-events")
+            logger.info(
+                f"WebSocket event consumer started on exchange: {WEBSOCKET_BROADCAST_EXCHANGE}"
+            )
 
         except Exception as e:
             logger.error(f"Failed to start WebSocket event consumer: {e}")
@@ -46,8 +67,9 @@ class WebSocketEventConsumer:
     async def stop(self) -> None:
         """Stop the WebSocket event consumer"""
         try:
-            if self.consumer_tag and self.queue:
-                await self.queue.cancel(self.consumer_tag)
+            for queue, consumer_tag in self.consumers:
+                await queue.cancel(consumer_tag)
+            self.consumers.clear()
 
             if self.channel:
                 await self.channel.close()
@@ -82,22 +104,14 @@ class WebSocketEventConsumer:
                     )
                     return
 
-                # Broadcast to WebSocket connections in the main app
-                if user_id in websocket_manager.connections:
-                    disconnected = set()
-                    for websocket in websocket_manager.connections[user_id]:
-                        try:
-                            await websocket.send_json(ws_message)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to send WebSocket message to user {user_id}: {e}"
-                            )
-                            disconnected.add(websocket)
-
-                    # Remove disconnected websockets
-                    for ws in disconnected:
-                        websocket_manager.connections[user_id].discard(ws)
+                # Already delivered locally by the replica that published it
+                if data.get("origin") == websocket_manager.instance_id:
+                    return
 
+                # Queue on this replica's connections; writers do the sending
+                delivered = websocket_manager.deliver_local(user_id, ws_message)
+                if delivered:
+                    websocket_manager.metrics.remote_messages_delivered += 1
                     logger.debug(f"Broadcasted WebSocket message to user {user_id}")
                 else:
                     logger.debug(f"No WebSocket connections found for user {user_id}")
@@ -1,7 +1,32 @@
+"""
+WebSocket connection management and cross-replica broadcasting.
+
+Every API replica holds only its own sockets. Broadcasts are delivered to the
+local sockets immediately and published to a RabbitMQ fanout exchange; each
+replica consumes that exchange (see ``websocket_consumer``) and delivers to its
+own sockets, skipping messages it published itself. ARQ workers have no
+sockets and only publish.
+
+Each connection has a bounded outbound queue drained by a dedicated writer
+task, so a slow client never stalls delivery to a user's other sockets. A
+client whose queue fills up or whose send stalls is disconnected and is
+expected to reconnect and refetch state.
+"""
+
+import asyncio
 import json
-from typing import Any, ClassVar, Dict, Set, TypeVar, cast
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, ClassVar, Dict, Optional, TypeVar, cast
 
 from app.config.loggers import common_logger as logger
+from app.config.settings import settings
+from app.constants.websocket import (
+    WEBSOCKET_BROADCAST_EXCHANGE,
+    WEBSOCKET_SEND_QUEUE_SIZE,
+    WEBSOCKET_SEND_TIMEOUT,
+    WEBSOCKET_SLOW_CONSUMER_CLOSE_CODE,
+)
 from app.db.rabbitmq import get_rabbitmq_publisher
 from app.utils.worker_detection import is_main_app
 from fastapi import WebSocket
@@ -9,6 +34,86 @@ from fastapi import WebSocket
 T = TypeVar("T", bound="WebSocketManager")
 
 
+@dataclass
+class WebSocketMetrics:
+    """Process-local counters for WebSocket delivery."""
+
+    messages_enqueued: int = 0
+    messages_sent: int = 0
+    send_failures: int = 0
+    send_timeouts: int = 0
+    slow_consumer_closes: int = 0
+    published: int = 0
+    publish_failures: int = 0
+    remote_messages_delivered: int = 0
+    max_queue_depth: int = 0
+
+
+class WebSocketConnection:
+    """A single client socket with its own bounded send queue and writer task."""
+
+    def __init__(
+        self, manager: "WebSocketManager", user_id: str, websocket: WebSocket
+    ) -> None:
+        self.manager = manager
+        self.user_id = user_id
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=WEBSOCKET_SEND_QUEUE_SIZE
+        )
+        self.writer_task = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, payload: str) -> bool:
+        """Queue an encoded message; returns False if the queue is full."""
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+
+        metrics = self.manager.metrics
+        metrics.messages_enqueued += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, self.queue.qsize())
+        return True
+
+    async def _write_loop(self) -> None:
+        metrics = self.manager.metrics
+        while True:
+            payload = await self.queue.get()
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(payload), timeout=WEBSOCKET_SEND_TIMEOUT
+                )
+                metrics.messages_sent += 1
+            except asyncio.TimeoutError:
+                metrics.send_timeouts += 1
+                logger.warning(
+                    f"WebSocket send timed out for user {self.user_id}, disconnecting"
+                )
+                self.manager._drop_connection(
+                    self, close_code=WEBSOCKET_SLOW_CONSUMER_CLOSE_CODE
+                )
+                return
+            except Exception as e:
+                metrics.send_failures += 1
+                logger.warning(f"Failed to send to WebSocket: {e}")
+                self.manager._drop_connection(self)
+                return
+
+    def stop(self, close_code: Optional[int] = None) -> None:
+        """Cancel the writer and optionally close the socket in the background."""
+        if not self.writer_task.done():
+            self.writer_task.cancel()
+        if close_code is not None:
+            asyncio.create_task(self._close(close_code))
+
+    async def _close(self, close_code: int) -> None:
+        try:
+            await self.websocket.close(code=close_code)
+        except Exception:
+            # Socket may already be closed by the client
+            pass  # nosec B110
+
+
 class WebSocketManager:
     """Manages WebSocket connections for real-time notifications"""
 
@@ -25,49 +130,103 @@ class WebSocketManager:
     def __init__(self) -> None:
         # Only initialize once
         if not hasattr(self, "initialized") or not self.initialized:
-            self.connections: Dict[str, Set[WebSocket]] = {}
+            self.connections: Dict[str, Dict[WebSocket, WebSocketConnection]] = {}
+            self.metrics = WebSocketMetrics()
+            # Identifies broadcasts this replica published so the fanout
+            # consumer doesn't deliver them twice
+            self.instance_id: str = uuid.uuid4().hex
             self.initialized: bool = True
 
     def add_connection(self, user_id: str, websocket: WebSocket) -> None:
         """Add a WebSocket connection for a user"""
-        if user_id not in self.connections:
-            self.connections[user_id] = set()
-        self.connections[user_id].add(websocket)
+        user_connections = self.connections.setdefault(user_id, {})
+        if websocket not in user_connections:
+            user_connections[websocket] = WebSocketConnection(self, user_id, websocket)
         logger.info(f"Added WebSocket connection for user {user_id}")
 
     def remove_connection(self, user_id: str, websocket: WebSocket) -> None:
         """Remove a WebSocket connection for a user"""
-        if user_id in self.connections:
-            self.connections[user_id].discard(websocket)
-            if not self.connections[user_id]:
+        user_connections = self.connections.get(user_id)
+        if user_connections is not None:
+            connection = user_connections.pop(websocket, None)
+            if connection is not None:
+                connection.stop()
+            if not user_connections:
                 del self.connections[user_id]
         logger.info(f"Removed WebSocket connection for user {user_id}")
 
+    def _drop_connection(
+        self, connection: WebSocketConnection, close_code: Optional[int] = None
+    ) -> None:
+        """Remove a failed or slow connection and optionally close its socket."""
+        user_connections = self.connections.get(connection.user_id)
+        if user_connections is not None:
+            if user_connections.get(connection.websocket) is connection:
+                del user_connections[connection.websocket]
+            if not user_connections:
+                del self.connections[connection.user_id]
+        connection.stop(close_code)
+
     async def broadcast_to_user(self, user_id: str, message: Dict[str, Any]) -> None:
-        """Broadcast message to all connections for a user"""
+        """Broadcast message to all of a user's connections across every replica"""
 
-        # If we don't have websocket pool (not main app), publish to RabbitMQ
+        # Processes without a websocket pool (e.g. ARQ workers) only publish
         if not is_main_app():
             await self._publish_to_rabbitmq(user_id, message)
             return
 
-        if user_id not in self.connections:
-            return
+        self.deliver_local(user_id, message)
+        if settings.RABBITMQ_URL:
+            await self._publish_to_rabbitmq(user_id, message, origin=self.instance_id)
 
-        disconnected = set()
-        for websocket in self.connections[user_id]:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
-                disconnected.add(websocket)
+    def deliver_local(self, user_id: str, message: Dict[str, Any]) -> int:
+        """
+        Queue a message on this replica's connections for a user.
+
+        Never blocks on the network: each connection's writer task performs
+        the actual send. Returns the number of connections the message was
+        queued on.
+        """
+        user_connections = self.connections.get(user_id)
+        if not user_connections:
+            return 0
+
+        payload = json.dumps(message)
+        delivered = 0
+        for connection in list(user_connections.values()):
+            if connection.enqueue(payload):
+                delivered += 1
+                continue
+
+            self.metrics.slow_consumer_closes += 1
+            logger.warning(
+                f"WebSocket send queue full for user {user_id}, disconnecting slow client"
+            )
+            self._drop_connection(
+                connection, close_code=WEBSOCKET_SLOW_CONSUMER_CLOSE_CODE
+            )
+
+        return delivered
 
-        # Remove disconnected websockets
-        for ws in disconnected:
-            self.connections[user_id].discard(ws)
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of delivery counters and current queue depths"""
+        queue_depths = [
+            connection.queue.qsize()
+            for user_connections in self.connections.values()
+            for connection in user_connections.values()
+        ]
+        return {
+            **asdict(self.metrics),
+            "users": len(self.connections),
+            "connections": len(queue_depths),
+            "queued_messages": sum(queue_depths),
+            "current_max_queue_depth": max(queue_depths, default=0),
+        }
 
-    async def _publish_to_rabbitmq(self, user_id: str, message: Dict[str, Any]) -> None:
-        """Publish WebSocket message to RabbitMQ for main app to broadcast."""
+    async def _publish_to_rabbitmq(
+        self, user_id: str, message: Dict[str, Any], origin: Optional[str] = None
+    ) -> None:
+        """Publish a WebSocket message to the fanout exchange for all replicas."""
         try:
             publisher = await get_rabbitmq_publisher()
 
@@ -76,15 +235,18 @@ class WebSocketManager:
                 "type": "websocket_broadcast",
                 "user_id": user_id,
                 "message": message,
+                "origin": origin,
             }
 
             message_body = json.dumps(rabbitmq_message).encode("utf-8")
             # Publisher now handles connection health automatically
-            await publisher.publish("websocket-events", message_body)
+            await publisher.publish_fanout(WEBSOCKET_BROADCAST_EXCHANGE, message_body)
+            self.metrics.published += 1
 
             logger.debug(f"Published WebSocket message for user {user_id} to RabbitMQ")
 
         except Exception as e:
+            self.metrics.publish_failures += 1
             logger.error(
                 f"Failed to publish WebSocket message to RabbitMQ: {e}", exc_info=True
             )
@@ -106,6 +106,7 @@ _COLLECTION_MAPPINGS = {
     "team_collection": "team",
     "search_urls_collection": "search_urls",
     "files_collection": "files",
+    "file_contents_collection": "file_contents",
     "notifications_collection": "notifications",
     "todos_collection": "todos",
     "projects_collection": "projects",
@@ -176,9 +176,11 @@ async def create_conversation_indexes():
             conversations_collection.create_index(
                 [("user_id", 1), ("messages.message_id", 1)]
             ),
-            # For message pinning aggregations
+            # For starred messages (only conversations with pins). The filter
+            # matches get_starred_messages so the planner can use this index
             conversations_collection.create_index(
-                [("user_id", 1), ("messages.pinned", 1)]
+                [("user_id", 1), ("pinned_message_ids", 1)],
+                partialFilterExpression={"pinned_message_ids.0": {"$exists": True}},
             ),
         )
 
@@ -299,6 +301,10 @@ async def create_file_indexes():
             files_collection.create_index([("user_id", 1), ("conversation_id", 1)]),
             # For file type filtering
             files_collection.create_index([("user_id", 1), ("content_type", 1)]),
+            # For resuming stalled ingestions
+            files_collection.create_index([("status", 1), ("updated_at", 1)]),
+            # For finding the files referencing a stored content
+            files_collection.create_index([("content_hash", 1)], sparse=True),
         )
 
     except Exception as e:
@@ -380,6 +386,13 @@ async def create_notification_indexes():
         await asyncio.gather(
             # For user-specific notifications
             notifications_collection.create_index([("user_id", 1), ("created_at", -1)]),
+            # For keyset pagination on (created_at, id)
+            notifications_collection.create_index(
+                [("user_id", 1), ("created_at", -1), ("id", -1)]
+            ),
+            notifications_collection.create_index(
+                [("user_id", 1), ("status", 1), ("created_at", -1), ("id", -1)]
+            ),
             # For unread notifications
             notifications_collection.create_index(
                 [("user_id", 1), ("read", 1), ("created_at", -1)]
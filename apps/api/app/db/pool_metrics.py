@@ -0,0 +1,158 @@
+"""
+Wait-time and checkout metrics for the Postgres connection pools.
+
+- SQLAlchemy: ``TimedAsyncAdaptedQueuePool`` times every connection checkout
+  (queueing plus connecting) and a checkin listener times how long the
+  connection was held. Both feed per-pool histograms.
+- LangGraph checkpointer: psycopg_pool keeps its own counters
+  (``get_stats()``); they are diffed at every report.
+
+At most every POOL_METRICS_REPORT_INTERVAL_SECONDS (checked on SQLAlchemy
+checkins) the metrics are logged, with a warning for each pool where waiting
+for a connection took more than POOL_WAIT_WARNING_RATIO of the checkout (wait
+plus hold time): the pool, or the server behind it, is too small for the
+load. Request latency is not measured here.
+``get_pool_metrics()`` returns the same data.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from app.config.loggers import app_logger as logger
+from app.constants.postgres import (
+    POOL_METRICS_REPORT_INTERVAL_SECONDS,
+    POOL_WAIT_WARNING_MIN_MS,
+    POOL_WAIT_WARNING_RATIO,
+)
+from app.utils.metrics_utils import Histogram, snapshot_histograms
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+SQLALCHEMY_POOL = "sqlalchemy"
+
+_wait_histograms: Dict[str, Histogram] = {}
+_held_histograms: Dict[str, Histogram] = {}
+# Checkouts per pool where the wait exceeded POOL_WAIT_WARNING_RATIO
+_slow_checkouts: Dict[str, int] = {}
+
+_engine: Optional[AsyncEngine] = None
+_psycopg_pools: Dict[str, Any] = {}
+_psycopg_last_stats: Dict[str, Dict[str, int]] = {}
+
+_next_report = time.monotonic() + POOL_METRICS_REPORT_INTERVAL_SECONDS
+
+
+def _histogram(histograms: Dict[str, Histogram], pool: str) -> Histogram:
+    histogram = histograms.get(pool)
+    if histogram is None:
+        histogram = histograms[pool] = Histogram()
+    return histogram
+
+
+def record_checkout(pool: str, wait_ms: float, held_ms: float) -> None:
+    """Record one checkout: time spent waiting for it and holding it."""
+    _histogram(_wait_histograms, pool).observe(wait_ms)
+    _histogram(_held_histograms, pool).observe(held_ms)
+    if wait_ms >= POOL_WAIT_WARNING_MIN_MS and wait_ms > POOL_WAIT_WARNING_RATIO * (
+        wait_ms + held_ms
+    ):
+        _slow_checkouts[pool] = _slow_checkouts.get(pool, 0) + 1
+    maybe_report_pool_metrics()
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waited."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        record = super()._do_get()
+        now = time.perf_counter()
+        record.info["pool_wait_ms"] = (now - start) * 1000
+        record.info["checked_out_at"] = now
+        return record
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record checkouts of an engine created with TimedAsyncAdaptedQueuePool."""
+    global _engine
+    _engine = engine
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is None:
+            return
+        record_checkout(
+            SQLALCHEMY_POOL,
+            connection_record.info.pop("pool_wait_ms", 0.0),
+            (time.perf_counter() - checked_out_at) * 1000,
+        )
+
+
+def register_psycopg_pool(name: str, pool: Any) -> None:
+    """Include a psycopg_pool pool's statistics in the pool metrics."""
+    _psycopg_pools[name] = pool
+    _psycopg_last_stats[name] = dict(pool.get_stats())
+
+
+def _sqlalchemy_status() -> Dict[str, Any]:
+    if _engine is None:
+        return {}
+    pool = _engine.sync_engine.pool
+    return {
+        "size": pool.size(),  # type: ignore[attr-defined]
+        "checked_out": pool.checkedout(),  # type: ignore[attr-defined]
+        "overflow": pool.overflow(),  # type: ignore[attr-defined]
+    }
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Snapshot of pool status, wait and hold times for every pool."""
+    metrics: Dict[str, Any] = {}
+    if _engine is not None:
+        metrics[SQLALCHEMY_POOL] = {
+            **_sqlalchemy_status(),
+            "slow_checkouts": _slow_checkouts.get(SQLALCHEMY_POOL, 0),
+            "wait": snapshot_histograms(_wait_histograms).get(SQLALCHEMY_POOL, {}),
+            "held": snapshot_histograms(_held_histograms).get(SQLALCHEMY_POOL, {}),
+        }
+    for name, pool in _psycopg_pools.items():
+        metrics[name] = pool.get_stats()
+    return metrics
+
+
+def maybe_report_pool_metrics() -> None:
+    """Log pool metrics and wait warnings at most once per report interval."""
+    global _next_report
+
+    now = time.monotonic()
+    if now < _next_report:
+        return
+    _next_report = now + POOL_METRICS_REPORT_INTERVAL_SECONDS
+    logger.info(f"Postgres pools: {get_pool_metrics()}")
+
+    for pool, count in _slow_checkouts.items():
+        if count:
+            logger.warning(
+                f"Postgres pool '{pool}': {count} checkouts spent over "
+                f"{POOL_WAIT_WARNING_RATIO:.0%} of the checkout (wait plus hold "
+                f"time) waiting for a connection; consider a larger pool"
+            )
+    _slow_checkouts.clear()
+
+    for name, pool in _psycopg_pools.items():
+        stats = pool.get_stats()
+        last = _psycopg_last_stats.get(name, {})
+        _psycopg_last_stats[name] = dict(stats)
+
+        wait_ms = stats.get("requests_wait_ms", 0) - last.get("requests_wait_ms", 0)
+        usage_ms = stats.get("usage_ms", 0) - last.get("usage_ms", 0)
+        if wait_ms >= POOL_WAIT_WARNING_MIN_MS and wait_ms > POOL_WAIT_WARNING_RATIO * (
+            wait_ms + usage_ms
+        ):
+            logger.warning(
+                f"Postgres pool '{name}': waited {wait_ms}ms for connections vs "
+                f"{usage_ms}ms holding them since the last report; consider a "
+                f"larger pool"
+            )
@@ -0,0 +1,99 @@
+"""
+Per-process sizing of the Postgres connection pools.
+
+Each API and ARQ worker process opens two pools against the same server: the
+SQLAlchemy engine (db/postgresql.py) and the psycopg pool behind the LangGraph
+checkpointer. Their sizes depend on the startup context, set by
+``unified_startup`` through ``set_pool_context``, and can be overridden per
+process via settings. ``check_connection_budget`` warns when all processes
+together could open more connections than the server allows.
+"""
+
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from app.config.loggers import app_logger as logger
+from app.config.settings import settings
+from app.constants.postgres import (
+    POSTGRES_POOL_SIZES,
+    POSTGRES_RESERVED_CONNECTIONS,
+)
+
+PoolContext = Literal["main_app", "arq_worker"]
+
+_context: PoolContext = "main_app"
+
+
+@dataclass(frozen=True)
+class PoolSizes:
+    """Connection limits for one process."""
+
+    pool_size: int
+    max_overflow: int
+    checkpointer_min_size: int
+    checkpointer_max_size: int
+
+    @property
+    def max_connections(self) -> int:
+        return self.pool_size + self.max_overflow + self.checkpointer_max_size
+
+
+def set_pool_context(context: PoolContext) -> None:
+    """Select the pool sizes used by pools created after this call."""
+    global _context
+    _context = context
+
+
+def get_pool_sizes(context: Optional[PoolContext] = None) -> PoolSizes:
+    """
+    Pool sizes for ``context`` (default: this process's context).
+
+    Settings overrides only apply to this process's own context.
+    """
+    own_context = context is None or context == _context
+    defaults = POSTGRES_POOL_SIZES[context or _context]
+
+    def pick(override: Optional[int], key: str) -> int:
+        return override if own_context and override is not None else defaults[key]
+
+    checkpointer_max_size = pick(
+        settings.CHECKPOINTER_POOL_MAX_SIZE, "checkpointer_max_size"
+    )
+    return PoolSizes(
+        pool_size=pick(settings.POSTGRES_POOL_SIZE, "pool_size"),
+        max_overflow=pick(settings.POSTGRES_MAX_OVERFLOW, "max_overflow"),
+        checkpointer_min_size=min(
+            defaults["checkpointer_min_size"], checkpointer_max_size
+        ),
+        checkpointer_max_size=checkpointer_max_size,
+    )
+
+
+def check_connection_budget() -> None:
+    """Log the connection budget and warn if it exceeds POSTGRES_MAX_CONNECTIONS."""
+    api = get_pool_sizes("main_app")
+    worker = get_pool_sizes("arq_worker")
+    total = (
+        settings.API_PROCESS_COUNT * api.max_connections
+        + settings.ARQ_WORKER_COUNT * worker.max_connections
+    )
+    summary = (
+        f"{settings.API_PROCESS_COUNT} API x {api.max_connections} + "
+        f"{settings.ARQ_WORKER_COUNT} worker x {worker.max_connections} "
+        f"= {total} Postgres connections at peak"
+    )
+
+    limit = settings.POSTGRES_MAX_CONNECTIONS
+    if limit is None:
+        logger.info(f"Postgres pools ({_context}): {summary}")
+        return
+
+    available = limit - POSTGRES_RESERVED_CONNECTIONS
+    if total > available:
+        logger.warning(
+            f"Postgres pools may exhaust the server: {summary}, but only "
+            f"{available} of {limit} are available. Lower POSTGRES_POOL_SIZE, "
+            f"POSTGRES_MAX_OVERFLOW or CHECKPOINTER_POOL_MAX_SIZE."
+        )
+    else:
+        logger.info(f"Postgres pools ({_context}): {summary} of {available}")
@@ -10,6 +10,8 @@ from typing import AsyncGenerator
 from app.config.loggers import app_logger as logger
 from app.config.settings import settings
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
+from app.db.pool_metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+from app.db.pool_sizing import get_pool_sizes
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -27,6 +29,9 @@ async def init_postgresql_engine() -> AsyncEngine:
     """
     Initialize PostgreSQL async engine with proper connection pooling.
 
+    Pool sizes depend on the process context (see db/pool_sizing.py) and
+    checkouts are timed for the pool metrics.
+
     Returns:
         AsyncEngine: The SQLAlchemy async engine
     """
@@ -35,18 +40,24 @@ async def init_postgresql_engine() -> AsyncEngine:
     postgres_url: str = settings.POSTGRES_URL  # type: ignore
     url = postgres_url.replace("postgresql://", "postgresql+asyncpg://")
 
+    pool_sizes = get_pool_sizes()
     engine = create_async_engine(
         url=url,
         future=True,
+        poolclass=TimedAsyncAdaptedQueuePool,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=pool_sizes.pool_size,
+        max_overflow=pool_sizes.max_overflow,
     )
+    instrument_engine(engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    logger.info("PostgreSQL engine initialized for database")
+    logger.info(
+        f"PostgreSQL engine initialized for database "
+        f"(pool_size={pool_sizes.pool_size}, max_overflow={pool_sizes.max_overflow})"
+    )
     return engine
 
 
@@ -2,7 +2,7 @@ from typing import Optional
 
 import aio_pika
 from aio_pika import Message
-from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractRobustConnection
 from app.config.loggers import app_logger as logger
 from app.config.settings import settings
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
@@ -14,6 +14,7 @@ class RabbitMQPublisher:
         self.connection: Optional[AbstractRobustConnection] = None
         self.channel: Optional[AbstractChannel] = None
         self.declared_queues: set[str] = set()
+        self.declared_exchanges: dict[str, AbstractExchange] = {}
 
     async def connect(self):
         """Connect to RabbitMQ and create channel."""
@@ -30,6 +31,19 @@ class RabbitMQPublisher:
             self.declared_queues.add(queue_name)
             logger.debug(f"RabbitMQ queue '{queue_name}' declared")
 
+    async def declare_fanout_exchange(self, exchange_name: str) -> AbstractExchange:
+        """Declare a fanout exchange if not already declared."""
+        exchange = self.declared_exchanges.get(exchange_name)
+        if exchange is None:
+            if not self.channel:
+                raise RuntimeError("RabbitMQ channel not available")
+            exchange = await self.channel.declare_exchange(
+                exchange_name, aio_pika.ExchangeType.FANOUT, durable=True
+            )
+            self.declared_exchanges[exchange_name] = exchange
+            logger.debug(f"RabbitMQ fanout exchange '{exchange_name}' declared")
+        return exchange
+
     async def is_connected(self) -> bool:
         """Check if the RabbitMQ connection is still active."""
         try:
@@ -55,6 +69,7 @@ class RabbitMQPublisher:
             self.connection = None
             self.channel = None
             self.declared_queues.clear()
+            self.declared_exchanges.clear()
             # Reconnect
             await self.connect()
             logger.info("RabbitMQ reconnected successfully")
@@ -82,6 +97,28 @@ class RabbitMQPublisher:
             await self.channel.default_exchange.publish(message, routing_key=queue_name)
             logger.info("Successfully published after reconnection")
 
+    async def publish_fanout(self, exchange_name: str, body: bytes):
+        """
+        Publish a transient message to every queue bound to a fanout exchange.
+
+        Used for live events (e.g. WebSocket broadcasts) that every consumer
+        should see and that are worthless once stale, so messages are not
+        persisted.
+        """
+        await self.ensure_connected()
+
+        message = Message(body, delivery_mode=aio_pika.DeliveryMode.NOT_PERSISTENT)
+        try:
+            exchange = await self.declare_fanout_exchange(exchange_name)
+            await exchange.publish(message, routing_key="")
+        except Exception as e:
+            logger.error(f"Failed to publish to RabbitMQ: {e}. Attempting recovery...")
+            self.declared_exchanges.clear()
+            await self.ensure_connected()
+            exchange = await self.declare_fanout_exchange(exchange_name)
+            await exchange.publish(message, routing_key="")
+            logger.info("Successfully published after reconnection")
+
     async def close(self):
         """Close RabbitMQ connection and channel."""
         if self.channel:
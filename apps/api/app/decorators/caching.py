@@ -12,6 +12,7 @@ Advanced Usage:
     @Cacheable(key_pattern="user:{user_id}", model=User)  # Type-safe
     @Cacheable(key_generator=custom_key_func, ttl=1800)
     @Cacheable(smart_hash=True, ttl=300, namespace="metrics")  # Custom namespace
+    @Cacheable(key_pattern="search:{query}", single_flight=True, stale_ttl=3600)
 
 Cache Invalidation:
     @CacheInvalidator(key_patterns=["user:{user_id}:*"])
@@ -22,19 +23,40 @@ Key Features:
 - Type-safe caching with Pydantic models
 - Automatic cache invalidation
 - Custom serialization/deserialization
+- Single-flight fills and stale-while-revalidate for expensive upstreams
 """
 
 import asyncio
 import functools
 import inspect
+import time
+import uuid
 from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
 
 from app.config.loggers import redis_logger as logger
-from app.db.redis import ONE_YEAR_TTL, delete_cache, get_cache, set_cache
+from app.constants.cache import CACHE_FILL_LOCK_TTL, CACHE_FILL_POLL_INTERVAL
+from app.db.redis import (
+    ONE_YEAR_TTL,
+    delete_cache,
+    deserialize_any,
+    get_cache,
+    redis_cache,
+    serialize_any,
+    set_cache,
+)
 from app.utils.cache_utils import create_cache_key_hash
+from langchain_core.runnables.config import var_child_runnable_config
 
 T = TypeVar("T")
 
+# Delete a fill lock only if this caller still owns it
+_RELEASE_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class Cacheable(Generic[T]):
     """
@@ -45,6 +67,15 @@ class Cacheable(Generic[T]):
     - Type-safe caching with Pydantic model support
     - Custom serialization/deserialization hooks
     - Flexible TTL management
+    - Single-flight fills and stale-while-revalidate
+
+    Stampede Protection:
+        single_flight: On a miss, only one caller per key runs the function;
+            concurrent callers in the same process await its task, callers in
+            other processes wait on a Redis lock and read the value it caches.
+        stale_ttl: Entries are kept for ``stale_ttl`` seconds past ``ttl``. A
+            hit in that window returns the stale value immediately and refreshes
+            it in the background, at most once per key across processes.
 
     Key Generation Strategies:
         1. Smart hash: Automatic hash-based keys using function name and arguments
@@ -96,6 +127,13 @@ class Cacheable(Generic[T]):
         )
         async def get_processed_data(data_id: str):
             return CustomObject(process_data(data_id))
+
+        # Paid upstream: one fetch per key, serve stale for an hour while refreshing
+        @Cacheable(
+            key_pattern="search:{query}", ttl=3600, single_flight=True, stale_ttl=3600
+        )
+        async def search(query: str):
+            return await upstream.search(query)
     """
 
     def __init__(
@@ -110,6 +148,8 @@ class Cacheable(Generic[T]):
         smart_hash: bool = False,
         namespace: str = "api",
         ignore_none: bool = False,
+        single_flight: bool = False,
+        stale_ttl: int = 0,
     ):
         """
         Initialize the cache decorator.
@@ -140,6 +180,9 @@ class Cacheable(Generic[T]):
                    - Use with List[Model] for paginated endpoints
             smart_hash: Use automatic hash-based key generation with function name and arguments
             namespace: Namespace prefix for smart hash keys (default: "api")
+            single_flight: Let only one caller per key run the function on a miss
+            stale_ttl: Seconds past ttl during which a stale value is served while
+                       it is refreshed in the background (0 disables)
         """
         self.key_pattern = key_pattern
         self.key_generator = key_generator
@@ -156,6 +199,12 @@ class Cacheable(Generic[T]):
         self.serializer = serializer
         self.deserializer = deserializer
         self.model = model
+        self.single_flight = single_flight
+        self.stale_ttl = stale_ttl
+        # In-flight fills and background refreshes in this process, by cache key.
+        # Kept apart because a refresh returns nothing for a caller to await.
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
 
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
         """
@@ -198,37 +247,135 @@ class Cacheable(Generic[T]):
                 )
 
             # Check if the value is already cached
-            cached_value = await get_cache(cache_key, self.model)
+            if self.stale_ttl:
+                cached_value, fresh = await _get_with_freshness(cache_key, self.model)
+            else:
+                cached_value, fresh = await get_cache(cache_key, self.model), True
+
             if cached_value is not None:
-                logger.debug(f"Cache hit for key: {cache_key}")
+                if fresh:
+                    logger.debug(f"Cache hit for key: {cache_key}")
+                else:
+                    logger.debug(f"Serving stale value for key: {cache_key}")
+                    self._refresh(cache_key, func, args, kwargs)
                 if self.deserializer:
                     cached_value = self.deserializer(cached_value)
                 return cached_value
 
-            # Call the original function - handle both sync and async
-            if asyncio.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
+            logger.debug(f"Cache miss for key: {cache_key}")
 
-            if result is None and self.ignore_none:
-                return result
+            if not self.single_flight:
+                return await self._fill(cache_key, func, args, kwargs)
 
-            serialized_result = result
-            if self.serializer:
-                serialized_result = self.serializer(result)
+            task = self._inflight.get(cache_key)
+            if task is None:
+                task = self._spawn(
+                    self._inflight,
+                    cache_key,
+                    self._fill_once(cache_key, func, args, kwargs),
+                )
+            # Shielded so a cancelled caller doesn't cancel the fill for the others
+            return await asyncio.shield(task)
 
-            logger.debug(f"Cache miss for key: {cache_key}")
-            logger.debug(f"Setting cache for key: {cache_key}")
+        return wrapper
+
+    async def _fill(
+        self, cache_key: str, func: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Any:
+        """Call the original function and cache its result."""
+        # Call the original function - handle both sync and async
+        if asyncio.iscoroutinefunction(func):
+            result = await func(*args, **kwargs)
+        else:
+            result = func(*args, **kwargs)
+
+        if result is None and self.ignore_none:
+            return result
 
+        serialized_result = result
+        if self.serializer:
+            serialized_result = self.serializer(result)
+
+        logger.debug(f"Setting cache for key: {cache_key}")
+
+        if self.stale_ttl:
+            await _set_with_freshness(
+                cache_key, serialized_result, self.ttl, self.stale_ttl, self.model
+            )
+        else:
             # Let set_cache handle Pydantic serialization
             await set_cache(
                 key=cache_key, value=serialized_result, ttl=self.ttl, model=self.model
             )
 
-            return result
+        return result
 
-        return wrapper
+    async def _fill_once(
+        self,
+        cache_key: str,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+        wait: bool = True,
+    ) -> Any:
+        """
+        Fill the cache under the key's Redis lock.
+
+        If another process holds the lock, wait for the value it caches
+        (``wait=True``) or give up and return None (``wait=False``). Falls back
+        to calling the function directly if that process produced no value.
+        """
+        token = await _acquire_fill_lock(cache_key)
+        if token is None:
+            if not wait:
+                return None
+
+            cached_value = await _wait_for_fill(cache_key, self.model)
+            if cached_value is not None:
+                if self.deserializer:
+                    cached_value = self.deserializer(cached_value)
+                return cached_value
+
+        try:
+            return await self._fill(cache_key, func, args, kwargs)
+        finally:
+            if token:
+                await _release_fill_lock(cache_key, token)
+
+    def _refresh(
+        self, cache_key: str, func: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> None:
+        """Refresh a stale entry in the background unless already in progress."""
+        if cache_key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            # Detach from the caller's graph run: the refresh can outlive the
+            # request, so it must not write progress into its stream. This only
+            # affects the task's own copy of the context.
+            var_child_runnable_config.set(None)
+            try:
+                await self._fill_once(cache_key, func, args, kwargs, wait=False)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for key {cache_key}: {e}")
+
+        self._spawn(self._refreshing, cache_key, refresh())
+
+    def _spawn(
+        self, tasks: Dict[str, asyncio.Task], cache_key: str, coro: Awaitable[Any]
+    ) -> asyncio.Task:
+        task = asyncio.create_task(coro)  # type: ignore[arg-type]
+        tasks[cache_key] = task
+
+        def done(finished: asyncio.Task) -> None:
+            if tasks.get(cache_key) is finished:
+                del tasks[cache_key]
+            # Retrieve the exception so an unawaited failure isn't reported twice
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(done)
+        return task
 
 
 class CacheInvalidator:
@@ -351,6 +498,110 @@ class CacheInvalidator:
         return wrapper
 
 
+def _fresh_key(cache_key: str) -> str:
+    return f"{cache_key}:fresh"
+
+
+def _lock_key(cache_key: str) -> str:
+    return f"{cache_key}:lock"
+
+
+async def _get_with_freshness(
+    cache_key: str, model: Optional[type] = None
+) -> tuple[Any, bool]:
+    """
+    Read a stale-while-revalidate entry in one round-trip.
+
+    The value outlives its ``:fresh`` marker by the stale window, so a value
+    without a marker is stale. Returns ``(value, fresh)``; value is None on a
+    miss.
+    """
+    if not redis_cache.redis:
+        return None, False
+
+    try:
+        value, fresh = await redis_cache.redis.mget(cache_key, _fresh_key(cache_key))
+        if not value:
+            return None, False
+        return deserialize_any(value, model), fresh is not None
+    except Exception as e:
+        logger.error(f"Error accessing Redis for key {cache_key}: {e}")
+        return None, False
+
+
+async def _set_with_freshness(
+    cache_key: str, value: Any, ttl: int, stale_ttl: int, model: Optional[type] = None
+) -> None:
+    """Store a value for ``ttl + stale_ttl`` with a ``:fresh`` marker for ``ttl``."""
+    if not redis_cache.redis:
+        return
+
+    try:
+        json_str = serialize_any(value, model)
+        async with redis_cache.redis.pipeline(transaction=True) as pipe:
+            pipe.setex(cache_key, ttl + stale_ttl, json_str)
+            pipe.setex(_fresh_key(cache_key), ttl, 1)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Error setting Redis key {cache_key}: {e}")
+
+
+async def _acquire_fill_lock(cache_key: str) -> Optional[str]:
+    """
+    Try to take the cross-process fill lock for a key.
+
+    Returns the lock token, or None if another process holds it. Without a
+    working Redis every caller gets a token and fills on its own.
+    """
+    token = uuid.uuid4().hex
+    if not redis_cache.redis:
+        return token
+
+    try:
+        acquired = await redis_cache.redis.set(
+            _lock_key(cache_key), token, nx=True, ex=CACHE_FILL_LOCK_TTL
+        )
+    except Exception as e:
+        logger.warning(f"Failed to acquire fill lock for key {cache_key}: {e}")
+        return token
+    return token if acquired else None
+
+
+async def _release_fill_lock(cache_key: str, token: str) -> None:
+    if not redis_cache.redis:
+        return
+
+    try:
+        await redis_cache.redis.eval(_RELEASE_LOCK, 1, _lock_key(cache_key), token)
+    except Exception as e:
+        # The lock expires on its own
+        logger.warning(f"Failed to release fill lock for key {cache_key}: {e}")
+
+
+async def _wait_for_fill(cache_key: str, model: Optional[type] = None) -> Any:
+    """
+    Wait for another process's fill of ``cache_key`` to land.
+
+    Returns the cached value, or None once the lock is gone without a value
+    (the fill failed or its result wasn't cacheable) or it expired.
+    """
+    lock_key = _lock_key(cache_key)
+    deadline = time.monotonic() + CACHE_FILL_LOCK_TTL
+    while time.monotonic() < deadline:
+        await asyncio.sleep(CACHE_FILL_POLL_INTERVAL)
+        try:
+            value, lock = await redis_cache.redis.mget(cache_key, lock_key)  # type: ignore[union-attr]
+        except Exception as e:
+            logger.warning(f"Failed to poll fill of key {cache_key}: {e}")
+            return None
+
+        if value:
+            return deserialize_any(value, model)
+        if lock is None:
+            return None
+    return None
+
+
 def _pattern_to_key(pattern: str, arguments: Dict[str, Any]) -> str:
     """
     Convert key pattern template to actual cache key using function arguments.
@@ -8,6 +8,7 @@ These functions are tightly coupled to agent-specific logic and LangGraph execut
 
 import json
 import re
+import time
 from datetime import datetime, timezone
 from typing import AsyncGenerator, Optional
 
@@ -31,6 +32,7 @@ from app.constants.llm import (
     DEFAULT_MAX_TOKENS,
     DEFAULT_MODEL_NAME,
 )
+from app.core.chat_profiler import record_stage
 from app.core.lazy_loader import providers
 from app.core.stream_manager import stream_manager
 from app.db.mongodb.collections import integrations_collection
@@ -470,6 +472,8 @@ async def execute_graph_streaming(
 
     # Track tool calls to avoid duplicate emissions
     emitted_tool_calls: set[str] = set()
+    # tool_call_id -> (tool name, start time) for per-tool latency
+    pending_tool_calls: dict[str, tuple[str, float]] = {}
 
     async for event in graph.astream(
         initial_state,
@@ -506,6 +510,9 @@ async def execute_graph_streaming(
                             # Look up metadata based on tool type
                             tool_name = tc.get("name")
                             tool_metadata = {}
+                            pending_tool_calls.setdefault(
+                                tc_id, (tool_name or "unknown", time.perf_counter())
+                            )
 
                             if tool_name == "handoff":
                                 args = tc.get("args", {})
@@ -545,6 +552,11 @@ async def execute_graph_streaming(
 
             # Emit tool_output when ToolMessage arrives
             elif chunk and isinstance(chunk, ToolMessage):
+                started = pending_tool_calls.pop(chunk.tool_call_id, None)
+                if started:
+                    record_stage(
+                        f"tool:{started[0]}", (time.perf_counter() - started[1]) * 1000
+                    )
                 output = (
                     chunk.content[:3000]
                     if isinstance(chunk.content, str)
@@ -109,6 +109,9 @@ class UpdateDescriptionRequest(BaseModel):
 class ConversationSyncItem(BaseModel):
     conversation_id: str
     last_updated: Optional[str] = None
+    # ID of the newest message the client already has; only messages after it
+    # are returned. Unknown IDs fall back to the full message list.
+    last_message_id: Optional[str] = None
 
 
 class BatchSyncRequest(BaseModel):
@@ -1,6 +1,36 @@
+from enum import Enum
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
+class FileStatus(str, Enum):
+    """Tracks whether an uploaded file has been indexed for chat"""
+
+    PROCESSING = "processing"  # Stored, ingestion pending or running
+    INDEXED = "indexed"  # Summarized and embedded, visible to chat
+    FAILED = "failed"  # A stage kept failing after its retries
+
+
+class FileIngestionStage(str, Enum):
+    """Ingestion stages in order; a file records the next one to run"""
+
+    PARSE = "parse"  # Extract the file's pages
+    SUMMARIZE = "summarize"  # Summarize the extracted pages
+    EMBED = "embed"  # Index the summaries in ChromaDB
+    DONE = "done"
+
+
+class FileStatusResponse(BaseModel):
+    """Ingestion status of an uploaded file, for clients to poll"""
+
+    file_id: str
+    filename: Optional[str] = None
+    status: FileStatus
+    description: Optional[str] = None  # Set once indexed
+    error: Optional[str] = None  # Set when ingestion failed
+
+
 class DocumentPageModel(BaseModel):
     page_number: int = Field(
         ...,
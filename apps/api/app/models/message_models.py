@@ -15,6 +15,7 @@ class FileData(BaseModel):
     filename: str
     type: Optional[str] = "file"
     message: Optional[str] = "File uploaded successfully"
+    status: Optional[str] = None  # Ingestion status, see GET /{fileId}/status
 
 
 class SelectedWorkflowData(BaseModel):
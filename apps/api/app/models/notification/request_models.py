@@ -45,3 +45,4 @@ class PaginatedNotificationsResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
@@ -1,9 +1,23 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import httpx
 from app.config.loggers import calendar_logger as logger
-from app.db.mongodb.collections import get_sync_collection
+from app.constants.cache import CALENDAR_SYNC_CACHE_PREFIX, CALENDAR_SYNC_CACHE_TTL
+from app.db.mongodb.collections import calendars_collection
+from app.db.redis import delete_cache, get_cache, set_cache
 from app.models.calendar_models import (
     EventCreateRequest,
     EventDeleteRequest,
@@ -12,14 +26,75 @@ from app.models.calendar_models import (
 )
 from fastapi import HTTPException
 
-# Sync HTTP client for all calendar operations
-http_client = httpx.Client(timeout=30)
+T = TypeVar("T")
+
+# Concurrent per-calendar requests for a single user query
+CALENDAR_FETCH_CONCURRENCY = 5
+
+# Window kept current through incremental (syncToken) sync, relative to now
+CALENDAR_SYNC_LOOKBACK = timedelta(days=30)
+CALENDAR_SYNC_LOOKAHEAD = timedelta(days=365)
+# Re-run the full sync once the cached window start drifts this far behind now
+CALENDAR_SYNC_MAX_WINDOW_DRIFT = timedelta(days=7)
+CALENDAR_SYNC_MAX_PAGES = 20
+
+# One pooled AsyncClient per event loop. The API and ARQ worker each run a
+# single loop; Composio custom tools run in worker threads and are bridged
+# onto that loop with run_sync, so they share the same pool.
+_http_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_main_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled calendar HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def init_calendar_http_client() -> None:
+    """Create the pooled client and register the loop used by run_sync."""
+    global _main_loop
+    _main_loop = asyncio.get_running_loop()
+    get_http_client()
+
+
+async def close_calendar_http_client() -> None:
+    """Close the pooled client for the running event loop."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
-# Sync MongoDB collection for calendar preferences
-calendars_collection = get_sync_collection("calendar")
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a calendar coroutine from synchronous code.
+
+    Composio custom tools are synchronous and execute in worker threads; this
+    schedules the coroutine on the application loop (so it reuses the pooled
+    client, Redis and Mongo connections) and blocks the calling thread until
+    it completes. Falls back to a private loop when no app loop is running.
+    """
+    loop = _main_loop
+    if loop is not None and loop.is_running():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not loop:
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    return asyncio.run(coro)
 
 
-def fetch_calendar_list(access_token: str, short: bool = False) -> Any:
+async def fetch_calendar_list(access_token: str, short: bool = False) -> Any:
     """
     Fetch the list of calendars for the authenticated user.
 
@@ -34,7 +109,7 @@ def fetch_calendar_list(access_token: str, short: bool = False) -> Any:
     headers = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        response = http_client.get(url, headers=headers)
+        response = await get_http_client().get(url, headers=headers)
         response.raise_for_status()
         data = response.json()
 
@@ -89,7 +164,7 @@ def filter_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     ]
 
 
-def fetch_calendar_events(
+async def fetch_calendar_events(
     calendar_id: str,
     access_token: str,
     page_token: Optional[str] = None,
@@ -127,7 +202,7 @@ def fetch_calendar_events(
         params["pageToken"] = page_token
 
     try:
-        response = http_client.get(url, headers=headers, params=params)
+        response = await get_http_client().get(url, headers=headers, params=params)
         if response.status_code == 200:
             return response.json()
         else:
@@ -139,16 +214,16 @@ def fetch_calendar_events(
         raise HTTPException(status_code=500, detail=f"HTTP request failed: {e}")
 
 
-def fetch_all_calendar_events(
+async def iter_calendar_event_pages(
     calendar_id: str,
     access_token: str,
     time_min: Optional[str] = None,
     time_max: Optional[str] = None,
     max_per_page: int = 250,  # Google's max per request
-) -> Dict[str, Any]:
+    max_pages: int = 20,
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Fetch ALL events from a calendar within a date range by internally handling pagination.
-    This is useful for calendar page views where you want to show all events in a month/range.
+    Page through a calendar's events, yielding each page as it arrives.
 
     Args:
         calendar_id (str): Calendar identifier.
@@ -156,17 +231,14 @@ def fetch_all_calendar_events(
         time_min (Optional[str]): Start time filter.
         time_max (Optional[str]): End time filter.
         max_per_page (int): Events per API request (max 250 per Google's limits).
+        max_pages (int): Safety limit on the number of pages fetched.
 
-    Returns:
-        dict: Combined events data with 'items' array and 'truncated' boolean.
+    Yields:
+        dict: Raw page data, including 'items' and 'nextPageToken'.
     """
-    all_items = []
     next_page_token = None
-    page_count = 0
-    max_pages = 20  # Safety limit: 20 pages * 250 events = 5000 events max
-
-    while page_count < max_pages:
-        page_data = fetch_calendar_events(
+    for _ in range(max_pages):
+        page_data = await fetch_calendar_events(
             calendar_id=calendar_id,
             access_token=access_token,
             page_token=next_page_token,
@@ -174,16 +246,45 @@ def fetch_all_calendar_events(
             time_max=time_max,
             max_results=max_per_page,
         )
-
-        items = page_data.get("items", [])
-        all_items.extend(items)
+        yield page_data
 
         next_page_token = page_data.get("nextPageToken")
-        page_count += 1
-
-        # Stop if no more pages
         if not next_page_token:
-            break
+            return
+
+
+async def fetch_all_calendar_events(
+    calendar_id: str,
+    access_token: str,
+    time_min: Optional[str] = None,
+    time_max: Optional[str] = None,
+    max_per_page: int = 250,  # Google's max per request
+) -> Dict[str, Any]:
+    """
+    Fetch ALL events from a calendar within a date range by internally handling pagination.
+    This is useful for calendar page views where you want to show all events in a month/range.
+
+    Args:
+        calendar_id (str): Calendar identifier.
+        access_token (str): Access token.
+        time_min (Optional[str]): Start time filter.
+        time_max (Optional[str]): End time filter.
+        max_per_page (int): Events per API request (max 250 per Google's limits).
+
+    Returns:
+        dict: Combined events data with 'items' array and 'truncated' boolean.
+    """
+    all_items = []
+    page_count = 0
+    max_pages = 20  # Safety limit: 20 pages * 250 events = 5000 events max
+    truncated = False
+
+    async for page_data in iter_calendar_event_pages(
+        calendar_id, access_token, time_min, time_max, max_per_page, max_pages
+    ):
+        all_items.extend(page_data.get("items", []))
+        page_count += 1
+        truncated = page_data.get("nextPageToken") is not None
 
         # Log if we're fetching many pages
         if page_count > 5:
@@ -192,7 +293,7 @@ def fetch_all_calendar_events(
             )
 
     # Check if we hit the safety limit
-    truncated = page_count >= max_pages and next_page_token is not None
+    truncated = truncated and page_count >= max_pages
     if truncated:
         logger.warning(
             f"Calendar {calendar_id} truncated at {len(all_items)} events (hit max pages limit)"
@@ -205,7 +306,227 @@ def fetch_all_calendar_events(
     }
 
 
-def list_calendars(access_token: str, short=False) -> Optional[Dict[str, Any]]:
+def _parse_event_time(value: Dict[str, Any]) -> Optional[datetime]:
+    """Parse an event start/end object (dateTime or all-day date) as aware UTC."""
+    raw = value.get("dateTime") or value.get("date")
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _parse_query_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a timeMin/timeMax query value as aware UTC."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _event_in_range(
+    event: Dict[str, Any],
+    range_min: Optional[datetime],
+    range_max: Optional[datetime],
+) -> bool:
+    """Mirror Google's timeMin (end > min) / timeMax (start < max) filtering."""
+    start = _parse_event_time(event.get("start", {}))
+    end = _parse_event_time(event.get("end", {})) or start
+    if start is None:
+        return False
+    if range_min and end and end <= range_min:
+        return False
+    if range_max and start >= range_max:
+        return False
+    return True
+
+
+def _sync_cache_key(user_id: str, calendar_id: str) -> str:
+    return f"{CALENDAR_SYNC_CACHE_PREFIX}:{user_id}:{calendar_id}"
+
+
+async def _full_calendar_sync(
+    calendar_id: str, access_token: str, window_min: datetime, window_max: datetime
+) -> Optional[Dict[str, Any]]:
+    """Run an initial sync over the window; returns None if Google gave no syncToken."""
+    url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params: Dict[str, Union[str, int, bool]] = {
+        "maxResults": 2500,
+        "singleEvents": True,
+        "timeMin": window_min.isoformat(),
+        "timeMax": window_max.isoformat(),
+    }
+
+    events: Dict[str, Dict[str, Any]] = {}
+    for _ in range(CALENDAR_SYNC_MAX_PAGES):
+        response = await get_http_client().get(url, headers=headers, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        for event in data.get("items", []):
+            if event.get("id") and event.get("status") != "cancelled":
+                events[event["id"]] = event
+
+        if data.get("nextPageToken"):
+            params["pageToken"] = data["nextPageToken"]
+            continue
+
+        sync_token = data.get("nextSyncToken")
+        if not sync_token:
+            return None
+        return {
+            "sync_token": sync_token,
+            "window_min": window_min.isoformat(),
+            "window_max": window_max.isoformat(),
+            "events": events,
+        }
+
+    logger.info(f"Calendar {calendar_id} too large for sync cache, using live fetch")
+    return None
+
+
+async def _incremental_calendar_sync(
+    calendar_id: str, access_token: str, state: Dict[str, Any]
+) -> Optional[int]:
+    """
+    Apply changes since the stored syncToken to the cached events in place.
+
+    Returns the number of changed events, or None when the token has expired
+    (HTTP 410) and a full sync is required.
+    """
+    url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params: Dict[str, Union[str, int, bool]] = {
+        "maxResults": 2500,
+        "singleEvents": True,
+        "syncToken": state["sync_token"],
+    }
+
+    events: Dict[str, Dict[str, Any]] = state["events"]
+    changes = 0
+    for _ in range(CALENDAR_SYNC_MAX_PAGES):
+        response = await get_http_client().get(url, headers=headers, params=params)
+        if response.status_code == 410:
+            return None
+        response.raise_for_status()
+        data = response.json()
+
+        for event in data.get("items", []):
+            event_id = event.get("id")
+            if not event_id:
+                continue
+            changes += 1
+            if event.get("status") == "cancelled":
+                events.pop(event_id, None)
+            else:
+                events[event_id] = event
+
+        if data.get("nextPageToken"):
+            params["pageToken"] = data["nextPageToken"]
+            continue
+
+        # An unchanged calendar isn't written back, which keeps the old token;
+        # it stays valid and returns the same (empty) delta
+        state["sync_token"] = data.get("nextSyncToken", state["sync_token"])
+        return changes
+
+    return None
+
+
+async def get_synced_calendar_events(
+    user_id: str,
+    calendar_id: str,
+    access_token: str,
+    time_min: Optional[str] = None,
+    time_max: Optional[str] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Serve a calendar's events for a range from the per-user sync cache.
+
+    The cache holds every event in a rolling window around now and is kept
+    current with Google's incremental sync (``syncToken``), so repeated reads
+    only transfer changed events. Returns None when the requested range is
+    outside the cached window or the calendar can't be synced, in which case
+    the caller should fall back to a live fetch.
+
+    Args:
+        user_id (str): User identifier.
+        calendar_id (str): Calendar identifier.
+        access_token (str): Access token.
+        time_min (Optional[str]): Start time filter (ISO format).
+        time_max (Optional[str]): End time filter (ISO format).
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: Events in the range sorted by start time.
+    """
+    try:
+        range_min = _parse_query_time(time_min)
+        range_max = _parse_query_time(time_max)
+    except ValueError:
+        return None
+
+    now = datetime.now(timezone.utc)
+    cache_key = _sync_cache_key(user_id, calendar_id)
+
+    try:
+        state = await get_cache(cache_key)
+        if state and (
+            datetime.fromisoformat(state["window_min"])
+            < now - CALENDAR_SYNC_LOOKBACK - CALENDAR_SYNC_MAX_WINDOW_DRIFT
+        ):
+            state = None
+        changes = None
+        if state:
+            changes = await _incremental_calendar_sync(calendar_id, access_token, state)
+        if changes is None:
+            state = await _full_calendar_sync(
+                calendar_id,
+                access_token,
+                now - CALENDAR_SYNC_LOOKBACK,
+                now + CALENDAR_SYNC_LOOKAHEAD,
+            )
+            if not state:
+                await delete_cache(cache_key)
+                return None
+        if changes != 0:
+            await set_cache(cache_key, state, ttl=CALENDAR_SYNC_CACHE_TTL)
+    except httpx.HTTPError as e:
+        logger.warning(f"Calendar sync failed for {calendar_id}: {e}")
+        return None
+
+    window_min = datetime.fromisoformat(state["window_min"])
+    window_max = datetime.fromisoformat(state["window_max"])
+    if (range_min is None or range_min < window_min) or (
+        range_max is None or range_max > window_max
+    ):
+        return None
+
+    events = [
+        event
+        for event in state["events"].values()
+        if _event_in_range(event, range_min, range_max)
+    ]
+    events.sort(
+        key=lambda e: (
+            e.get("start", {}).get("dateTime") or e.get("start", {}).get("date") or ""
+        )
+    )
+    return events
+
+
+async def invalidate_calendar_sync_cache(user_id: str) -> None:
+    """Drop all synced calendar caches for a user after changing their events."""
+    await delete_cache(f"{CALENDAR_SYNC_CACHE_PREFIX}:{user_id}:*")
+
+
+async def list_calendars(access_token: str, short=False) -> Optional[Dict[str, Any]]:
     """
     Retrieve the user's calendar list. If the access token is invalid,
     it will get a new token from the token repository.
@@ -219,10 +540,10 @@ def list_calendars(access_token: str, short=False) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: Calendar list data or None if retrieval fails.
     """
     # Token refresh will be handled by the decorator if needed
-    return fetch_calendar_list(access_token, short)
+    return await fetch_calendar_list(access_token, short)
 
 
-def initialize_calendar_preferences(
+async def initialize_calendar_preferences(
     user_id: str,
     access_token: str,
 ) -> None:
@@ -236,7 +557,7 @@ def initialize_calendar_preferences(
     """
     try:
         # Check if user already has calendar preferences
-        existing_preferences = calendars_collection.find_one({"user_id": user_id})
+        existing_preferences = await calendars_collection.find_one({"user_id": user_id})
         if existing_preferences and existing_preferences.get("selected_calendars"):
             logger.info(
                 f"User {user_id} already has calendar preferences, skipping initialization"
@@ -244,7 +565,7 @@ def initialize_calendar_preferences(
             return
 
         # Fetch all available calendars
-        calendar_data = fetch_calendar_list(access_token)
+        calendar_data = await fetch_calendar_list(access_token)
         calendars = calendar_data.get("items", [])
 
         if not calendars:
@@ -255,7 +576,7 @@ def initialize_calendar_preferences(
         all_calendar_ids = [cal["id"] for cal in calendars]
 
         # Save preferences to database
-        calendars_collection.update_one(
+        await calendars_collection.update_one(
             {"user_id": user_id},
             {"$set": {"selected_calendars": all_calendar_ids}},
             upsert=True,
@@ -273,7 +594,7 @@ def initialize_calendar_preferences(
         )
 
 
-def get_calendar_metadata_map(
+async def get_calendar_metadata_map(
     access_token: str,
 ) -> tuple[Dict[str, str], Dict[str, str]]:
     """
@@ -285,7 +606,7 @@ def get_calendar_metadata_map(
     Returns:
         tuple: (calendar_color_map, calendar_name_map)
     """
-    calendars = list_calendars(access_token=access_token, short=True)
+    calendars = await list_calendars(access_token=access_token, short=True)
 
     color_map: Dict[str, str] = {}
     name_map: Dict[str, str] = {}
@@ -371,7 +692,7 @@ def extract_unique_dates(calendar_options: List[Dict[str, Any]]) -> Dict[str, st
     return event_dates_info
 
 
-def fetch_same_day_events(
+async def fetch_same_day_events(
     event_dates_info: Dict[str, str],
     access_token: str,
     user_id: str,
@@ -387,26 +708,38 @@ def fetch_same_day_events(
     Returns:
         List of events across all specified dates
     """
-    same_day_events = []
-    for event_date, tz_offset in event_dates_info.items():
+
+    async def _fetch_day(event_date: str, tz_offset: str) -> List[Dict[str, Any]]:
         time_min = f"{event_date}T00:00:00{tz_offset}"
         time_max = f"{event_date}T23:59:59{tz_offset}"
         try:
-            result = get_calendar_events(
+            result = await get_calendar_events(
                 access_token=access_token,
                 user_id=user_id,
                 time_min=time_min,
                 time_max=time_max,
             )
             if isinstance(result, dict) and "events" in result:
-                same_day_events.extend(result["events"])
+                return result["events"]
         except Exception as e:
             logger.error(f"Error fetching events for {event_date}: {e}")
+        return []
+
+    day_results = await asyncio.gather(
+        *[
+            _fetch_day(event_date, tz_offset)
+            for event_date, tz_offset in event_dates_info.items()
+        ]
+    )
+
+    same_day_events = []
+    for events in day_results:
+        same_day_events.extend(events)
 
     return same_day_events
 
 
-def enrich_calendar_options_with_metadata(
+async def enrich_calendar_options_with_metadata(
     calendar_options: List[Dict[str, Any]],
     access_token: str,
     user_id: str,
@@ -422,7 +755,7 @@ def enrich_calendar_options_with_metadata(
     Returns:
         Enriched calendar options with metadata
     """
-    color_map, name_map = get_calendar_metadata_map(access_token)
+    color_map, name_map = await get_calendar_metadata_map(access_token)
 
     for option in calendar_options:
         calendar_id = option.get("calendar_id", "primary")
@@ -430,7 +763,9 @@ def enrich_calendar_options_with_metadata(
         option["calendar_name"] = name_map.get(calendar_id, "Calendar")
 
     event_dates_info = extract_unique_dates(calendar_options)
-    same_day_events = fetch_same_day_events(event_dates_info, access_token, user_id)
+    same_day_events = await fetch_same_day_events(
+        event_dates_info, access_token, user_id
+    )
 
     for event in same_day_events:
         calendar_id = event.get("calendarId") or ""
@@ -442,7 +777,7 @@ def enrich_calendar_options_with_metadata(
     return calendar_options
 
 
-def get_calendar_events(
+async def get_calendar_events(
     user_id: str,
     access_token: str,
     page_token: Optional[str] = None,
@@ -474,7 +809,7 @@ def get_calendar_events(
             - calendars_truncated: List of calendar IDs that hit limits
     """
     # Fetch the calendar list - token refresh will be handled by the decorator if needed
-    calendar_data = fetch_calendar_list(access_token)
+    calendar_data = await fetch_calendar_list(access_token)
 
     calendars = calendar_data.get("items", [])
 
@@ -483,19 +818,19 @@ def get_calendar_events(
     user_selected_calendars: List[str] = []
     if selected_calendars is not None:
         user_selected_calendars = selected_calendars
-        calendars_collection.update_one(
+        await calendars_collection.update_one(
             {"user_id": user_id},
             {"$set": {"selected_calendars": user_selected_calendars}},
             upsert=True,
         )
     else:
-        preferences = calendars_collection.find_one({"user_id": user_id})
+        preferences = await calendars_collection.find_one({"user_id": user_id})
         if preferences and preferences.get("selected_calendars"):
             user_selected_calendars = preferences["selected_calendars"]
         else:
             # Default: select all available calendars
             user_selected_calendars = [cal["id"] for cal in calendars]
-            calendars_collection.update_one(
+            await calendars_collection.update_one(
                 {"user_id": user_id},
                 {"$set": {"selected_calendars": user_selected_calendars}},
                 upsert=True,
@@ -509,68 +844,78 @@ def get_calendar_events(
     # Determine fetch strategy based on parameters
     # If fetch_all=True or max_results is None/0, fetch ALL events in date range
     # Otherwise, fetch up to max_results per calendar
-    token_str = access_token
+    fetch_all_mode = fetch_all or not max_results
+    if fetch_all_mode:
+        logger.info(
+            f"Fetching ALL events for {len(selected_cal_objs)} calendars in date range"
+        )
+
+    semaphore = asyncio.Semaphore(CALENDAR_FETCH_CONCURRENCY)
+
+    async def _fetch_calendar(cal: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+        """Fetch one calendar's events; returns (events, truncated)."""
+        async with semaphore:
+            # Prefer the incrementally-synced cache; falls back when the range
+            # is outside the synced window or the calendar can't be synced
+            cached_events = await get_synced_calendar_events(
+                user_id, cal["id"], access_token, time_min, time_max
+            )
+            if cached_events is not None:
+                if fetch_all_mode:
+                    return cached_events, False
+                return cached_events[:max_results], False
+
+            if fetch_all_mode:
+                result = await fetch_all_calendar_events(
+                    cal["id"], access_token, time_min, time_max
+                )
+                return result.get("items", []), result.get("truncated", False)
+
+            result = await fetch_calendar_events(
+                cal["id"], access_token, None, time_min, time_max, max_results
+            )
+            return result.get("items", []), False
+
+    # Fetch all selected calendars concurrently (bounded by the semaphore)
+    results = await asyncio.gather(
+        *[_fetch_calendar(cal) for cal in selected_cal_objs], return_exceptions=True
+    )
 
     all_events = []
     seen_event_ids = set()  # Track unique event IDs for deduplication
     calendars_truncated = []  # Track which calendars hit limits
 
-    if fetch_all or not max_results:
-        # Full fetch mode: Get ALL events in date range for each calendar
-        logger.info(
-            f"Fetching ALL events for {len(selected_cal_objs)} calendars in date range"
-        )
-        for cal in selected_cal_objs:
-            try:
-                result = fetch_all_calendar_events(
-                    cal["id"], token_str, time_min, time_max
-                )
-                events = result.get("items", [])
+    for cal, result in zip(selected_cal_objs, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(f"Error fetching events for calendar {cal['id']}: {result}")
+            continue
 
-                # Track if this calendar was truncated
-                if result.get("truncated", False):
-                    calendars_truncated.append(cal["id"])
-                    logger.warning(
-                        f"Calendar {cal['id']} ({cal.get('summary', 'Unknown')}) was truncated"
-                    )
+        events, truncated = result
 
-                for event in events:
-                    event_id = event.get("id")
-                    if event_id and event_id in seen_event_ids:
-                        continue
-                    if event_id:
-                        seen_event_ids.add(event_id)
-                    event["calendarId"] = cal["id"]
-                    event["calendarTitle"] = cal.get("summary", "")
-                all_events.extend(filter_events(events))
-            except Exception as e:
-                logger.error(f"Error fetching events for calendar {cal['id']}: {e}")
-    else:
-        # Limited fetch mode: Get up to max_results per calendar
-        for cal in selected_cal_objs:
-            try:
-                result = fetch_calendar_events(
-                    cal["id"], token_str, None, time_min, time_max, max_results
-                )
-                events = result.get("items", [])
-
-                for event in events:
-                    event_id = event.get("id")
-                    if event_id and event_id in seen_event_ids:
-                        continue
-                    if event_id:
-                        seen_event_ids.add(event_id)
-                    event["calendarId"] = cal["id"]
-                    event["calendarTitle"] = cal.get("summary", "")
-                all_events.extend(filter_events(events))
-            except Exception as e:
-                logger.error(f"Error fetching events for calendar {cal['id']}: {e}")
+        # Track if this calendar was truncated
+        if truncated:
+            calendars_truncated.append(cal["id"])
+            logger.warning(
+                f"Calendar {cal['id']} ({cal.get('summary', 'Unknown')}) was truncated"
+            )
+
+        unique_events = []
+        for event in events:
+            event_id = event.get("id")
+            if event_id and event_id in seen_event_ids:
+                continue
+            if event_id:
+                seen_event_ids.add(event_id)
+            event["calendarId"] = cal["id"]
+            event["calendarTitle"] = cal.get("summary", "")
+            unique_events.append(event)
+        all_events.extend(filter_events(unique_events))
 
     # Sort all events by start time for consistent ordering
     all_events.sort(
-        key=lambda e: e.get("start", {}).get("dateTime")
-        or e.get("start", {}).get("date")
-        or ""
+        key=lambda e: (
+            e.get("start", {}).get("dateTime") or e.get("start", {}).get("date") or ""
+        )
     )
 
     logger.info(
@@ -585,7 +930,7 @@ def get_calendar_events(
     }
 
 
-def get_calendar_events_by_id(
+async def get_calendar_events_by_id(
     calendar_id: str,
     access_token: str,
     page_token: Optional[str] = None,
@@ -606,7 +951,7 @@ def get_calendar_events_by_id(
     Returns:
         dict: A dictionary containing the events and a nextPageToken if available.
     """
-    events_data = fetch_calendar_events(
+    events_data = await fetch_calendar_events(
         calendar_id, access_token, page_token, time_min, time_max
     )
 
@@ -617,7 +962,7 @@ def get_calendar_events_by_id(
     }
 
 
-def find_event_for_action(
+async def find_event_for_action(
     access_token: str,
     event_lookup_data: EventLookupRequest,
     user_id: str,
@@ -630,7 +975,7 @@ def find_event_for_action(
     Raises HTTPException for invalid input.
     """
     if event_lookup_data.query:
-        search_results = search_calendar_events_native(
+        search_results = await search_calendar_events_native(
             query=event_lookup_data.query,
             user_id=user_id,
             access_token=access_token,
@@ -642,13 +987,13 @@ def find_event_for_action(
     else:
         url = f"https://www.googleapis.com/calendar/v3/calendars/{event_lookup_data.calendar_id}/events/{event_lookup_data.event_id}"
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = http_client.get(url, headers=headers)
+        response = await get_http_client().get(url, headers=headers)
         if response.status_code == 200:
             return response.json()
         return None
 
 
-def create_calendar_event(
+async def create_calendar_event(
     event: EventCreateRequest,
     access_token: str,
     user_id: Optional[str] = None,
@@ -778,11 +1123,15 @@ def create_calendar_event(
 
     # Send request to create the event
     try:
-        response = http_client.post(url, headers=headers, json=event_payload)
+        response = await get_http_client().post(
+            url, headers=headers, json=event_payload
+        )
 
         # Handle response
         if response.status_code in (200, 201):
             response_data = response.json()
+            if user_id:
+                await invalidate_calendar_sync_cache(user_id)
             return response_data
         elif response.status_code == 403:
             raise HTTPException(
@@ -813,7 +1162,7 @@ def create_calendar_event(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
-def get_user_calendar_preferences(user_id: str) -> Dict[str, List[str]]:
+async def get_user_calendar_preferences(user_id: str) -> Dict[str, List[str]]:
     """
     Retrieve the user's selected calendar preferences from the database.
 
@@ -826,14 +1175,14 @@ def get_user_calendar_preferences(user_id: str) -> Dict[str, List[str]]:
     Raises:
         HTTPException: If preferences are not found for the user.
     """
-    preferences = calendars_collection.find_one({"user_id": user_id})
+    preferences = await calendars_collection.find_one({"user_id": user_id})
     if preferences and "selected_calendars" in preferences:
         return {"selectedCalendars": preferences["selected_calendars"]}
     else:
         raise HTTPException(status_code=404, detail="Calendar preferences not found")
 
 
-def update_user_calendar_preferences(
+async def update_user_calendar_preferences(
     user_id: str, selected_calendars: List[str]
 ) -> Dict[str, str]:
     """
@@ -846,7 +1195,7 @@ def update_user_calendar_preferences(
     Returns:
         Dict[str, str]: A message indicating the result of the update operation.
     """
-    result = calendars_collection.update_one(
+    result = await calendars_collection.update_one(
         {"user_id": user_id},
         {"$set": {"selected_calendars": selected_calendars}},
         upsert=True,
@@ -857,7 +1206,7 @@ def update_user_calendar_preferences(
         return {"message": "No changes made to calendar preferences"}
 
 
-def search_calendar_events_native(
+async def search_calendar_events_native(
     query: str,
     user_id: str,
     access_token: str,
@@ -880,13 +1229,13 @@ def search_calendar_events_native(
     """
 
     # Get user's selected calendars - token refresh will be handled by the decorator
-    calendar_list_data = fetch_calendar_list(access_token)
+    calendar_list_data = await fetch_calendar_list(access_token)
     valid_token = access_token
     calendars = calendar_list_data.get("items", [])
 
     # Get user's calendar preferences
     user_selected_calendars: List[str] = []
-    preferences = calendars_collection.find_one({"user_id": user_id})
+    preferences = await calendars_collection.find_one({"user_id": user_id})
     if preferences and preferences.get("selected_calendars"):
         user_selected_calendars = preferences["selected_calendars"]
         logger.info(f"User has calendar preferences: {user_selected_calendars}")
@@ -911,33 +1260,43 @@ def search_calendar_events_native(
         logger.info("No selected calendars found, searching all available calendars")
         selected_cal_objs = calendars
 
-    all_matching_events = []
-    total_events_searched = 0
+    semaphore = asyncio.Semaphore(CALENDAR_FETCH_CONCURRENCY)
+
+    async def _search_calendars(cals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Search the given calendars concurrently and merge filtered results."""
+
+        async def _search_one(cal: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await search_events_in_calendar(
+                    cal["id"], query, valid_token, time_min, time_max
+                )
+
+        results = await asyncio.gather(
+            *[_search_one(cal) for cal in cals], return_exceptions=True
+        )
+
+        matching: List[Dict[str, Any]] = []
+        for cal, result in zip(cals, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error searching events in calendar {cal['id']}: {result}"
+                )
+                continue
 
-    # Search each calendar sequentially
-    for cal in selected_cal_objs:
-        try:
-            result = search_events_in_calendar(
-                cal["id"], query, valid_token, time_min, time_max
-            )
             events = result.get("items", [])
-            logger.info(
-                f"Found {len(events)} events in calendar '{cal.get('summary', cal['id'])}'"
-            )
+            if events:
+                logger.info(
+                    f"Found {len(events)} events in calendar '{cal.get('summary', cal['id'])}'"
+                )
 
             for event in events:
                 event["calendarId"] = cal["id"]
                 event["calendarTitle"] = cal.get("summary", "")
 
-            filtered_events = filter_events(events)
-            logger.info(
-                f"After filtering: {len(filtered_events)} events in calendar '{cal.get('summary', cal['id'])}'"
-            )
+            matching.extend(filter_events(events))
+        return matching
 
-            all_matching_events.extend(filtered_events)
-            total_events_searched += len(filtered_events)
-        except Exception as e:
-            logger.error(f"Error searching events in calendar {cal['id']}: {e}")
+    all_matching_events = await _search_calendars(selected_cal_objs)
 
     logger.info(
         f"Total matching events across all calendars: {len(all_matching_events)}"
@@ -946,28 +1305,9 @@ def search_calendar_events_native(
     # If no events found in selected calendars, try searching all calendars
     if not all_matching_events and selected_cal_objs != calendars:
         logger.info("No events found in selected calendars, searching all calendars...")
+        all_matching_events = await _search_calendars(calendars)
 
-        for cal in calendars:
-            try:
-                result = search_events_in_calendar(
-                    cal["id"], query, valid_token, time_min, time_max
-                )
-                events = result.get("items", [])
-
-                if events:
-                    logger.info(
-                        f"Found {len(events)} events in calendar '{cal.get('summary', cal['id'])}'"
-                    )
-
-                    for event in events:
-                        event["calendarId"] = cal["id"]
-                        event["calendarTitle"] = cal.get("summary", "")
-
-                    filtered_events = filter_events(events)
-                    all_matching_events.extend(filtered_events)
-                    total_events_searched += len(filtered_events)
-            except Exception as e:
-                logger.error(f"Error searching events in calendar {cal['id']}: {e}")
+    total_events_searched = len(all_matching_events)
 
     return {
         "query": query,
@@ -978,7 +1318,7 @@ def search_calendar_events_native(
     }
 
 
-def search_events_in_calendar(
+async def search_events_in_calendar(
     calendar_id: str,
     query: str,
     access_token: str,
@@ -1018,7 +1358,7 @@ def search_events_in_calendar(
         logger.info(
             f"Searching calendar {calendar_id} with query '{query}' and params: {params}"
         )
-        response = http_client.get(url, headers=headers, params=params)
+        response = await get_http_client().get(url, headers=headers, params=params)
         if response.status_code == 200:
             result = response.json()
             event_count = len(result.get("items", []))
@@ -1037,7 +1377,7 @@ def search_events_in_calendar(
         raise HTTPException(status_code=500, detail=f"HTTP search request failed: {e}")
 
 
-def delete_calendar_event(
+async def delete_calendar_event(
     event: EventDeleteRequest,
     access_token: str,
     user_id: Optional[str] = None,
@@ -1062,9 +1402,11 @@ def delete_calendar_event(
     headers = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        response = http_client.delete(url, headers=headers)
+        response = await get_http_client().delete(url, headers=headers)
 
         if response.status_code == 204:
+            if user_id:
+                await invalidate_calendar_sync_cache(user_id)
             return {"success": True, "message": "Event deleted successfully"}
         elif response.status_code == 404:
             raise HTTPException(
@@ -1091,7 +1433,7 @@ def delete_calendar_event(
         raise HTTPException(status_code=500, detail=f"Failed to delete event: {str(e)}")
 
 
-def update_calendar_event(
+async def update_calendar_event(
     event: EventUpdateRequest,
     access_token: str,
     user_id: Optional[str] = None,
@@ -1120,7 +1462,7 @@ def update_calendar_event(
 
     # First, get the existing event to preserve fields that weren't updated
     try:
-        get_response = http_client.get(
+        get_response = await get_http_client().get(
             url, headers={"Authorization": f"Bearer {access_token}"}
         )
 
@@ -1255,12 +1597,14 @@ def update_calendar_event(
 
     # Send request to update the event
     try:
-        response = http_client.put(url, headers=headers, json=event_payload)
+        response = await get_http_client().put(url, headers=headers, json=event_payload)
 
         if response.status_code == 200:
             updated_event = response.json()
             # Add calendarId to match the format of fetched events
             updated_event["calendarId"] = calendar_id
+            if user_id:
+                await invalidate_calendar_sync_cache(user_id)
             return updated_event
         elif response.status_code == 404:
             raise HTTPException(
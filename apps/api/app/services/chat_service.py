@@ -11,6 +11,7 @@ ensuring conversations are always saved even if client disconnects.
 
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -19,6 +20,13 @@ from app.agents.core.agent import call_agent
 from app.api.v1.middleware.tiered_rate_limiter import tiered_limiter
 from app.config.loggers import chat_logger as logger
 from app.config.model_pricing import calculate_token_cost
+from app.core.chat_profiler import (
+    finish_stream_profile,
+    maybe_report_chat_metrics,
+    record_stage,
+    stage_timer,
+    start_stream_profile,
+)
 from app.core.stream_manager import stream_manager
 from app.models.chat_models import (
     MessageModel,
@@ -63,6 +71,9 @@ async def run_chat_stream_background(
     is_new_conversation = body.conversation_id is None
     usage_metadata: Dict[str, Any] = {}
     follow_up_actions: List[str] = []
+    stream_started = time.perf_counter()
+    first_token_seen = False
+    profiler = start_stream_profile()
 
     try:
         description_task = None
@@ -86,7 +97,8 @@ async def run_chat_stream_background(
         user_model_config = None
         if user_id:
             try:
-                user_model_config = await get_user_selected_model(user_id)
+                with stage_timer("model_selection"):
+                    user_model_config = await get_user_selected_model(user_id)
             except Exception as e:
                 logger.warning(f"Could not get user's selected model: {e}")
 
@@ -172,6 +184,12 @@ async def run_chat_stream_background(
 
                     # Update progress for recovery
                     response_text = _extract_response_text(chunk)
+                    if response_text and not first_token_seen:
+                        first_token_seen = True
+                        record_stage(
+                            "time_to_first_token",
+                            (time.perf_counter() - stream_started) * 1000,
+                        )
                     if response_text:
                         await stream_manager.update_progress(
                             stream_id,
@@ -211,33 +229,40 @@ async def run_chat_stream_background(
             stream_id, f"data: {json.dumps({'error': str(e)})}\n\n"
         )
     finally:
-        # On cancellation, complete_message may be empty because nostream: marker
-        # never arrives. Recover from Redis progress which tracks accumulated text.
-        if not complete_message:
-            progress = await stream_manager.get_progress(stream_id)
-            if progress:
-                complete_message = progress.get("complete_message", "")
-                # Also recover tool_data if we have it
-                if progress.get("tool_data"):
-                    tool_data = progress["tool_data"]
-                logger.debug(
-                    f"Recovered {len(complete_message)} chars from Redis progress"
-                )
+        try:
+            # On cancellation, complete_message may be empty because nostream: marker
+            # never arrives. Recover from Redis progress which tracks accumulated text.
+            if not complete_message:
+                progress = await stream_manager.get_progress(stream_id)
+                if progress:
+                    complete_message = progress.get("complete_message", "")
+                    # Also recover tool_data if we have it
+                    if progress.get("tool_data"):
+                        tool_data = progress["tool_data"]
+                    logger.debug(
+                        f"Recovered {len(complete_message)} chars from Redis progress"
+                    )
 
-        # Always save conversation to MongoDB
-        await _save_conversation_async(
-            body=body,
-            user=user,
-            conversation_id=conversation_id,
-            complete_message=complete_message,
-            tool_data=tool_data,
-            metadata=usage_metadata,
-            user_message_id=user_message_id,
-            bot_message_id=bot_message_id,
-        )
+            # Always save conversation to MongoDB
+            with stage_timer("mongo_save"):
+                await _save_conversation_async(
+                    body=body,
+                    user=user,
+                    conversation_id=conversation_id,
+                    complete_message=complete_message,
+                    tool_data=tool_data,
+                    metadata=usage_metadata,
+                    user_message_id=user_message_id,
+                    bot_message_id=bot_message_id,
+                )
 
-        # Cleanup Redis
-        await stream_manager.cleanup(stream_id)
+            # Cleanup Redis
+            await stream_manager.cleanup(stream_id)
+        finally:
+            # Always stop a sampled profile, even if saving failed, so later
+            # streams can be profiled again
+            await finish_stream_profile(profiler, stream_id)
+            maybe_report_chat_metrics()
 
         logger.info(f"Background stream {stream_id} completed and saved")
 
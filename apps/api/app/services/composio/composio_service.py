@@ -1,14 +1,21 @@
 import asyncio
+import threading
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 
 from app.config.loggers import langchain_logger as logger
 from app.config.oauth_config import get_composio_social_configs
 from app.config.settings import settings
+from app.constants.cache import COMPOSIO_TOOL_CACHE_MAX_SIZE, COMPOSIO_TOOL_CACHE_TTL
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
 from app.models.trigger_config import TriggerConfig
 from app.services.composio.custom_tools.registry import custom_tools_registry
 from app.services.composio.langchain_composio_service import LangchainProvider
+from app.services.composio.toolkit_schema_cache import (
+    get_cached_toolkit_schemas,
+    set_cached_toolkit_schemas,
+)
 from app.services.mcp.mcp_tools_store import get_mcp_tools_store
 from app.utils.composio_hooks.registry import (
     master_after_execute_hook,
@@ -16,10 +23,15 @@ from app.utils.composio_hooks.registry import (
     master_schema_modifier,
 )
 from app.utils.query_utils import add_query_param
+from app.utils.request_coalescing import coalesce_request
 from composio import Composio, after_execute, before_execute, schema_modifier
+from composio.core.models._files import FileHelper
 
 COMPOSIO_SOCIAL_CONFIGS = get_composio_social_configs()
 
+# (tool_name, use_before_hook, use_after_hook, use_schema_modifier, user_id)
+ToolCacheKey = tuple[str, bool, bool, bool, str]
+
 
 class ComposioService:
     def __init__(self, api_key: str):
@@ -36,6 +48,7 @@ class ComposioService:
                     integration.composio_config.toolkit_version
                 )
 
+        self._toolkit_versions = toolkit_versions
         self.composio = Composio(
             provider=LangchainProvider(),
             api_key=api_key,
@@ -44,6 +57,15 @@ class ComposioService:
         )
         custom_tools_registry.initialize(self.composio)
 
+        # Same schema post-processing composio.tools.get applies before wrapping
+        self._file_helper = FileHelper(client=self.composio.client)
+
+        # Tool handles keyed by ToolCacheKey -> (monotonic expiry, tool).
+        # Guarded by a thread lock because get_tool is also called from
+        # worker threads (e.g. custom tools executing inside Composio).
+        self._tool_cache: OrderedDict[ToolCacheKey, tuple[float, Any]] = OrderedDict()
+        self._tool_cache_lock = threading.Lock()
+
     async def connect_account(
         self, provider: str, user_id: str, state_token: Optional[str] = None
     ) -> dict:
@@ -84,47 +106,97 @@ class ComposioService:
             raise
 
     async def get_tools(self, tool_kit: str, exclude_tools: Optional[list[str]] = None):
-        """Get tools for a toolkit with unified master hooks."""
+        """Get tools for a toolkit with unified master hooks.
+
+        Raw toolkit schemas come from the persistent schema cache when
+        available; otherwise they are fetched from Composio once and cached.
+        The schema modifier and Composio's file handling are applied locally
+        and the before/after hooks are attached at execution time, so no
+        second fetch is needed.
+        """
         logger.info(f"Loading {tool_kit} toolkit...")
 
         custom_tool_names = custom_tools_registry.get_tool_names(tool_kit.lower())
+        version = self._toolkit_versions.get(tool_kit.lower())
 
-        tools = await asyncio.to_thread(
-            lambda: self.composio.tools.get(  # type: ignore[call-overload]
-                user_id="",
+        schemas = await get_cached_toolkit_schemas(tool_kit, version)
+        if schemas is None:
+            schemas = await asyncio.to_thread(
+                self.composio.tools.get_raw_composio_tools,
                 toolkits=[tool_kit],
-                tools=custom_tool_names,
                 limit=1000,
             )
-        )
+            await set_cached_toolkit_schemas(tool_kit, version, schemas)
+
+        tools = self._wrap_toolkit_schemas(schemas)
+
+        if custom_tool_names:
+            # Custom tools are registered in-process, so this does not hit the
+            # Composio schema API for them
+            tools += await asyncio.to_thread(
+                lambda: self.composio.tools.get(  # type: ignore[call-overload]
+                    user_id="",
+                    tools=custom_tool_names,
+                    modifiers=[
+                        schema_modifier(tools=custom_tool_names)(
+                            master_schema_modifier
+                        ),
+                        before_execute(tools=custom_tool_names)(
+                            master_before_execute_hook
+                        ),
+                        after_execute(tools=custom_tool_names)(
+                            master_after_execute_hook
+                        ),
+                    ],
+                )
+            )
 
         exclude_tools = exclude_tools or []
-        tool_names = [t.name for t in tools]
-        master_before_modifier = before_execute(tools=tool_names)(
-            master_before_execute_hook
-        )
-        master_after_modifier = after_execute(tools=tool_names)(
-            master_after_execute_hook
-        )
-        master_schema_mod = schema_modifier(tools=tool_names)(master_schema_modifier)
+        result = [tool for tool in tools if tool.name not in exclude_tools]
+        await self._store_tool_metadata(tool_kit, result)
+        return result
+
+    def _wrap_toolkit_schemas(self, schemas: list) -> list:
+        """
+        Wrap raw schemas as tools the way composio.tools.get does.
+
+        The schemas are copied first, since the modifier and file handling
+        edit them in place.
+        """
+        schemas = [
+            master_schema_modifier(
+                schema.slug, schema.toolkit.slug, schema.model_copy(deep=True)
+            )
+            for schema in schemas
+        ]
+
+        # Type hints in descriptions, and file_uploadable params as file paths
+        for schema in schemas:
+            schema.input_parameters = self._file_helper.enhance_schema_descriptions(
+                schema=schema.input_parameters
+            )
+            schema.input_parameters = self._file_helper.process_file_uploadable_schema(
+                schema=schema.input_parameters
+            )
 
-        tools = await asyncio.to_thread(
-            lambda: self.composio.tools.get(  # type: ignore[call-overload]
+        tool_names = [schema.slug for schema in schemas]
+        modifiers = [
+            before_execute(tools=tool_names)(master_before_execute_hook),
+            after_execute(tools=tool_names)(master_after_execute_hook),
+        ]
+
+        def execute_tool(slug: str, arguments: dict):
+            return self.composio.tools.execute(
+                slug=slug,
+                arguments=arguments,
                 user_id="",
-                toolkits=[tool_kit],
-                tools=custom_tool_names,
-                modifiers=[
-                    master_schema_mod,
-                    master_before_modifier,
-                    master_after_modifier,
-                ],
-                limit=1000,
+                modifiers=modifiers,
+                dangerously_skip_version_check=True,
             )
-        )
 
-        result = [tool for tool in tools if tool.name not in exclude_tools]
-        await self._store_tool_metadata(tool_kit, result)
-        return result
+        return self.composio.provider.wrap_tools(
+            tools=schemas, execute_tool=execute_tool
+        )
 
     async def _store_tool_metadata(self, toolkit_name: str, tools: list) -> None:
         """Store Composio tool metadata in MongoDB for frontend visibility."""
@@ -188,6 +260,64 @@ class ComposioService:
         logger.info(f"Tools loaded: {len(result)} tools in {tools_time:.3f}s")
         return result
 
+    def _fetch_tool(
+        self,
+        tool_name: str,
+        use_before_hook: bool,
+        use_after_hook: bool,
+        use_schema_modifier: bool,
+        user_id: str,
+    ):
+        """Fetch a tool from Composio with the requested master hooks (blocking)."""
+        modifiers = []
+
+        if use_schema_modifier:
+            master_schema_mod = schema_modifier(tools=[tool_name])(
+                master_schema_modifier
+            )
+            modifiers.append(master_schema_mod)
+
+        if use_before_hook:
+            master_before_modifier = before_execute(tools=[tool_name])(
+                master_before_execute_hook
+            )
+            modifiers.append(master_before_modifier)
+
+        if use_after_hook:
+            master_after_modifier = after_execute(tools=[tool_name])(
+                master_after_execute_hook
+            )
+            modifiers.append(master_after_modifier)
+
+        tools = self.composio.tools.get(
+            user_id=user_id,
+            tools=[tool_name],
+            modifiers=modifiers,
+        )
+
+        return tools[0] if tools else None
+
+    def _get_cached_tool(self, key: ToolCacheKey):
+        """Return a cached tool handle if present and not expired."""
+        with self._tool_cache_lock:
+            entry = self._tool_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, tool = entry
+            if expires_at <= time.monotonic():
+                del self._tool_cache[key]
+                return None
+            self._tool_cache.move_to_end(key)
+            return tool
+
+    def _set_cached_tool(self, key: ToolCacheKey, tool) -> None:
+        """Store a tool handle, evicting the least recently used beyond capacity."""
+        with self._tool_cache_lock:
+            self._tool_cache[key] = (time.monotonic() + COMPOSIO_TOOL_CACHE_TTL, tool)
+            self._tool_cache.move_to_end(key)
+            while len(self._tool_cache) > COMPOSIO_TOOL_CACHE_MAX_SIZE:
+                self._tool_cache.popitem(last=False)
+
     def get_tool(
         self,
         tool_name: str,
@@ -196,39 +326,70 @@ class ComposioService:
         use_schema_modifier: bool = True,
         user_id: str = "",
     ):
-        """Get a specific tool by name with configurable hooks."""
-        try:
-            modifiers = []
+        """Get a specific tool by name with configurable hooks.
+
+        Blocking; prefer ``aget_tool`` from async code. Shares the tool-handle
+        cache with ``aget_tool``.
+        """
+        key = (
+            tool_name,
+            use_before_hook,
+            use_after_hook,
+            use_schema_modifier,
+            user_id,
+        )
+        tool = self._get_cached_tool(key)
+        if tool is not None:
+            return tool
 
-            if use_schema_modifier:
-                master_schema_mod = schema_modifier(tools=[tool_name])(
-                    master_schema_modifier
-                )
-                modifiers.append(master_schema_mod)
+        try:
+            tool = self._fetch_tool(*key)
+        except Exception as e:
+            logger.error(f"Error getting tool {tool_name}: {e}")
+            return None
 
-            if use_before_hook:
-                master_before_modifier = before_execute(tools=[tool_name])(
-                    master_before_execute_hook
-                )
-                modifiers.append(master_before_modifier)
+        if tool is not None:
+            self._set_cached_tool(key, tool)
+        return tool
 
-            if use_after_hook:
-                master_after_modifier = after_execute(tools=[tool_name])(
-                    master_after_execute_hook
-                )
-                modifiers.append(master_after_modifier)
+    async def aget_tool(
+        self,
+        tool_name: str,
+        use_before_hook: bool = True,
+        use_after_hook: bool = True,
+        use_schema_modifier: bool = True,
+        user_id: str = "",
+    ):
+        """Get a specific tool by name without blocking the event loop.
+
+        Tool handles are cached per (tool, hook flags, user) with a TTL. On a
+        miss the Composio fetch runs in a worker thread, and concurrent misses
+        for the same key share a single fetch.
+        """
+        key = (
+            tool_name,
+            use_before_hook,
+            use_after_hook,
+            use_schema_modifier,
+            user_id,
+        )
+        tool = self._get_cached_tool(key)
+        if tool is not None:
+            return tool
 
-            tools = self.composio.tools.get(
-                user_id=user_id,
-                tools=[tool_name],
-                modifiers=modifiers,
+        try:
+            tool = await coalesce_request(
+                "composio_tool:" + ":".join(str(part) for part in key),
+                lambda: asyncio.to_thread(self._fetch_tool, *key),
             )
-
-            return tools[0] if tools else None
         except Exception as e:
             logger.error(f"Error getting tool {tool_name}: {e}")
             return None
 
+        if tool is not None:
+            self._set_cached_tool(key, tool)
+        return tool
+
     async def check_connection_status(
         self, providers: list[str], user_id: str
     ) -> dict[str, bool]:
@@ -0,0 +1,63 @@
+"""
+Persistent cache for raw Composio toolkit schemas.
+
+Toolkit schemas only change when Composio publishes a new toolkit version, so
+they are cached in Redis keyed by toolkit slug plus ``toolkit_version``. Pinned
+versions are effectively immutable and kept for a long time; unpinned
+("latest") toolkits use a shorter TTL so upstream changes are picked up.
+
+Only the raw, unmodified schemas are stored. Schema modifiers, Composio's file
+handling and execution hooks are applied locally by ``ComposioService`` on
+every load.
+"""
+
+from typing import Optional
+
+from app.config.loggers import langchain_logger as logger
+from app.constants.cache import (
+    COMPOSIO_TOOLKIT_SCHEMA_CACHE_PREFIX,
+    COMPOSIO_TOOLKIT_SCHEMA_TTL,
+    COMPOSIO_TOOLKIT_SCHEMA_VERSIONED_TTL,
+)
+from app.db.redis import get_cache, set_cache
+from composio.types import Tool
+
+
+def _cache_key(toolkit: str, version: Optional[str]) -> str:
+    version_tag = version or "latest"
+    return f"{COMPOSIO_TOOLKIT_SCHEMA_CACHE_PREFIX}:{toolkit.lower()}:{version_tag}"
+
+
+async def get_cached_toolkit_schemas(
+    toolkit: str, version: Optional[str]
+) -> Optional[list[Tool]]:
+    """Return cached raw schemas for a toolkit version, or None on a miss."""
+    try:
+        cached = await get_cache(_cache_key(toolkit, version))
+        if not cached:
+            return None
+        return [Tool.model_validate(schema) for schema in cached]
+    except Exception as e:
+        logger.warning(f"Failed to read cached schemas for {toolkit}: {e}")
+        return None
+
+
+async def set_cached_toolkit_schemas(
+    toolkit: str, version: Optional[str], schemas: list[Tool]
+) -> None:
+    """Persist raw schemas for a toolkit version."""
+    if not schemas:
+        return
+
+    try:
+        await set_cache(
+            _cache_key(toolkit, version),
+            [schema.model_dump(mode="json") for schema in schemas],
+            ttl=(
+                COMPOSIO_TOOLKIT_SCHEMA_VERSIONED_TTL
+                if version
+                else COMPOSIO_TOOLKIT_SCHEMA_TTL
+            ),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache schemas for {toolkit}: {e}")
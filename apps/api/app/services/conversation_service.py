@@ -1,5 +1,6 @@
 import asyncio
 from datetime import datetime, timezone
+from typing import Any, Optional
 
 from app.db.mongodb.collections import conversations_collection
 from app.models.chat_models import (
@@ -133,14 +134,50 @@ async def get_conversations(user: dict, page: int = 1, limit: int = 10) -> dict:
     return result
 
 
-async def get_conversation(conversation_id: str, user: dict) -> dict:
+async def get_conversation(
+    conversation_id: str,
+    user: dict,
+    limit: Optional[int] = None,
+    before: Optional[int] = None,
+) -> dict:
     """
     Fetch a specific conversation by ID.
+
+    Without ``limit`` every message is returned. With ``limit`` only a window
+    of the embedded ``messages`` array is projected with ``$slice``: the latest
+    ``limit`` messages, or the ``limit`` messages preceding index ``before``.
+    The response then also carries ``message_count`` and ``messages_offset``
+    (index of the first returned message) so older pages can be requested.
     """
     user_id = user.get("user_id")
-    conversation = await conversations_collection.find_one(
-        {"user_id": user_id, "conversation_id": conversation_id}
-    )
+    match = {"user_id": user_id, "conversation_id": conversation_id}
+
+    if limit is None:
+        conversation = await conversations_collection.find_one(match)
+    else:
+        # $slice returns null for a missing array, so default it to []
+        messages: Any = {"$ifNull": ["$messages", []]}
+        if before is None:
+            messages_window: Any = {"$slice": [messages, -limit]}
+        elif before > 0:
+            page_size = min(limit, before)
+            messages_window = {"$slice": [messages, before - page_size, page_size]}
+        else:
+            messages_window = []
+
+        results = await conversations_collection.aggregate(
+            [
+                {"$match": match},
+                {"$limit": 1},
+                {
+                    "$addFields": {
+                        "message_count": {"$size": messages},
+                        "messages": messages_window,
+                    }
+                },
+            ]
+        ).to_list(1)
+        conversation = results[0] if results else None
 
     if not conversation:
         raise HTTPException(
@@ -148,6 +185,12 @@ async def get_conversation(conversation_id: str, user: dict) -> dict:
             detail="Conversation not found or does not belong to the user",
         )
 
+    if limit is not None:
+        end = conversation["message_count"] if before is None else before
+        conversation["messages_offset"] = max(
+            0, min(end, conversation["message_count"]) - len(conversation["messages"])
+        )
+
     conversations = _convert_ids([conversation])
 
     # Convert legacy tool data to unified format
@@ -253,21 +296,6 @@ async def pin_message(
     Pin or unpin a message within a conversation.
     """
     user_id = user.get("user_id")
-    conversation = await conversations_collection.find_one(
-        {"user_id": user_id, "conversation_id": conversation_id}
-    )
-
-    if not conversation:
-        raise HTTPException(status_code=404, detail="Conversation not found")
-
-    messages = conversation.get("messages", [])
-    target_message = next(
-        (msg for msg in messages if msg.get("message_id") == message_id), None
-    )
-
-    if not target_message:
-        raise HTTPException(status_code=404, detail="Message not found in conversation")
-
     update_result = await conversations_collection.update_one(
         {
             "user_id": user_id,
@@ -276,10 +304,22 @@ async def pin_message(
         },
         {
             "$set": {"messages.$.pinned": pinned},
-            "$currentDate": {"updatedAt": True},
+            # Denormalized pin index read by get_starred_messages
+            ("$addToSet" if pinned else "$pull"): {"pinned_message_ids": message_id},
+            # messages.updated_at lets batch sync return messages changed in place
+            "$currentDate": {"updatedAt": True, "messages.$.updated_at": True},
         },
     )
 
+    if update_result.matched_count == 0:
+        # Only on a miss, tell a missing conversation from a missing message
+        conversation_exists = await conversations_collection.count_documents(
+            {"user_id": user_id, "conversation_id": conversation_id}, limit=1
+        )
+        if not conversation_exists:
+            raise HTTPException(status_code=404, detail="Conversation not found")
+        raise HTTPException(status_code=404, detail="Message not found in conversation")
+
     if update_result.modified_count == 0:
         raise HTTPException(
             status_code=404, detail="Message not found or update failed"
@@ -297,15 +337,30 @@ async def pin_message(
 async def get_starred_messages(user: dict) -> dict:
     """
     Fetch all pinned messages across all conversations for the authenticated user.
+
+    Only conversations with a non-empty ``pinned_message_ids`` array are read,
+    and their messages are filtered against it in the database.
     """
     user_id = user.get("user_id")
 
     results = await conversations_collection.aggregate(
         [
-            {"$match": {"user_id": user_id}},
-            {"$unwind": "$messages"},
-            {"$match": {"messages.pinned": True}},
-            {"$project": {"_id": 0, "conversation_id": 1, "message": "$messages"}},
+            {"$match": {"user_id": user_id, "pinned_message_ids.0": {"$exists": True}}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "conversation_id": 1,
+                    "message": {
+                        "$filter": {
+                            "input": "$messages",
+                            "cond": {
+                                "$in": ["$$this.message_id", "$pinned_message_ids"]
+                            },
+                        }
+                    },
+                }
+            },
+            {"$unwind": "$message"},
         ]
     ).to_list(None)
 
@@ -503,6 +558,13 @@ async def batch_sync_conversations(request: BatchSyncRequest, user: dict) -> dic
     """
     Batch sync conversations - returns only conversations that have been updated
     since the provided timestamp, including their messages.
+
+    For items that carry ``last_message_id`` only the messages after that
+    message are returned, sliced in the database. Each conversation includes
+    ``message_count`` and ``messages_offset`` (index of the first returned
+    message); an offset of 0 means the full message list was sent. Earlier
+    messages changed in place (e.g. pinned) since ``last_updated`` are
+    returned separately in ``updated_messages``.
     """
     user_id = user.get("user_id")
     if not user_id:
@@ -510,26 +572,27 @@ async def batch_sync_conversations(request: BatchSyncRequest, user: dict) -> dic
             status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated"
         )
 
-    conversation_map = {
-        item.conversation_id: item.last_updated for item in request.conversations
-    }
+    sync_items = {item.conversation_id: item for item in request.conversations}
 
-    if not conversation_map:
+    if not sync_items:
         return {"conversations": []}
 
     # Build match conditions for each conversation
     match_conditions = []
-    for conv_id, last_updated in conversation_map.items():
+    anchor_branches = []
+    since_branches = []
+    for conv_id, item in sync_items.items():
         condition = {
             "user_id": user_id,
             "conversation_id": conv_id,
         }
 
         # Only include if updated after the provided timestamp
-        if last_updated:
+        last_updated_dt = None
+        if item.last_updated:
             try:
                 last_updated_dt = datetime.fromisoformat(
-                    last_updated.replace("Z", "+00:00")
+                    item.last_updated.replace("Z", "+00:00")
                 )
                 condition["$or"] = [
                     {"updatedAt": {"$gt": last_updated_dt}},
@@ -541,10 +604,62 @@ async def batch_sync_conversations(request: BatchSyncRequest, user: dict) -> dic
 
         match_conditions.append(condition)
 
+        if item.last_message_id and last_updated_dt:
+            since_branches.append(
+                {
+                    "case": {"$eq": ["$conversation_id", conv_id]},
+                    "then": {"$literal": last_updated_dt},
+                }
+            )
+
+        if item.last_message_id:
+            # $map keeps positions aligned for messages without a message_id
+            anchor_branches.append(
+                {
+                    "case": {"$eq": ["$conversation_id", conv_id]},
+                    "then": {
+                        "$indexOfArray": [
+                            {
+                                "$map": {
+                                    "input": "$messages",
+                                    "in": "$$this.message_id",
+                                }
+                            },
+                            item.last_message_id,
+                        ]
+                    },
+                }
+            )
+
     if not match_conditions:
         return {"conversations": []}
 
-    # Use aggregation to efficiently fetch conversations with messages
+    # Position right after the client's newest message, or 0 if it is unknown
+    messages_offset: Any = {"$literal": 0}
+    if anchor_branches:
+        messages_offset = {
+            "$add": [{"$switch": {"branches": anchor_branches, "default": -1}}, 1]
+        }
+
+    # Messages before the offset that changed since the client's last sync
+    updated_messages: Any = {"$literal": []}
+    if since_branches:
+        since = {"$switch": {"branches": since_branches, "default": None}}
+        updated_messages = {
+            "$filter": {
+                "input": {"$slice": ["$messages", {"$max": ["$messages_offset", 1]}]},
+                "cond": {
+                    "$and": [
+                        {"$gt": ["$messages_offset", 0]},
+                        {"$ne": [since, None]},
+                        {"$gt": ["$$this.updated_at", since]},
+                    ]
+                },
+            }
+        }
+
+    # Use aggregation to efficiently fetch conversations with only the
+    # messages each client is missing
     pipeline = [
         {"$match": {"$or": match_conditions}},
         {
@@ -558,7 +673,30 @@ async def batch_sync_conversations(request: BatchSyncRequest, user: dict) -> dic
                 "is_unread": 1,
                 "createdAt": 1,
                 "updatedAt": 1,
-                "messages": 1,
+                "messages": {"$ifNull": ["$messages", []]},
+                "messages_offset": messages_offset,
+            }
+        },
+        {
+            "$addFields": {
+                "message_count": {"$size": "$messages"},
+                "updated_messages": updated_messages,
+            }
+        },
+        {
+            "$addFields": {
+                "messages": {
+                    "$slice": [
+                        "$messages",
+                        "$messages_offset",
+                        {
+                            "$max": [
+                                1,
+                                {"$subtract": ["$message_count", "$messages_offset"]},
+                            ]
+                        },
+                    ]
+                }
             }
         },
     ]
@@ -566,15 +704,19 @@ async def batch_sync_conversations(request: BatchSyncRequest, user: dict) -> dic
     conversations = await conversations_collection.aggregate(pipeline).to_list(None)
 
     # Convert datetime objects to ISO strings
-    for conv in conversations:
+    for index, conv in enumerate(conversations):
         _convert_datetime_to_iso(conv, "createdAt", "updatedAt")
 
         # Convert message timestamps
-        if "messages" in conv:
-            for message in conv["messages"]:
-                _convert_datetime_to_iso(message, "timestamp", "createdAt", "date")
+        for message in conv["messages"] + conv["updated_messages"]:
+            _convert_datetime_to_iso(
+                message, "timestamp", "createdAt", "date", "updated_at"
+            )
 
         # Convert legacy tool data
-        conv = convert_conversation_messages(conv)
+        conv["updated_messages"] = [
+            convert_legacy_tool_data(message) for message in conv["updated_messages"]
+        ]
+        conversations[index] = convert_conversation_messages(conv)
 
     return {"conversations": conversations}
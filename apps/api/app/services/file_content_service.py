@@ -0,0 +1,151 @@
+"""
+Content-addressed storage shared by identical uploads.
+
+Uploads are fingerprinted with SHA-256. The raw file and everything derived
+from it (parsed pages and page summaries in ``file_contents``, summary
+embeddings in the Chroma "document_contents" collection) are stored once per
+user and content, keyed ``{user_id}:{sha256}`` (see ``content_key``). Each
+uploaded file is a reference to its content, so a user uploading the same
+file again, e.g. in another conversation, only adds a reference whose search
+entries are copied from the stored embeddings (see file_ingestion_service).
+
+Contents are never shared between users: a shared one would index almost
+instantly and so reveal that someone else uploaded the same file.
+
+Contents are reference counted. When the last file referencing one is
+deleted, its stored file, embeddings and record are garbage collected. Every
+content record gets its own ``artifact_id`` naming its Cloudinary asset and
+embeddings, so collecting a record never touches one created later for the
+same hash.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import cloudinary.uploader
+from app.config.loggers import app_logger as logger
+from app.db.chroma.chromadb import ChromaClient
+from app.db.mongodb.collections import file_contents_collection
+from app.models.files_models import FileIngestionStage, FileStatus
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+CONTENT_EMBEDDINGS_COLLECTION = "document_contents"
+
+
+def content_key(user_id: str, sha256: str) -> str:
+    """Key of a user's content record, used as ``content_hash`` on files."""
+    return f"{user_id}:{sha256}"
+
+
+async def acquire_content(
+    user_id: str, sha256: str, content_type: str, size: int
+) -> Dict[str, Any]:
+    """
+    Add a reference to the user's content with this hash, creating its record
+    if new.
+
+    A content whose ingestion failed is reset so the new upload retries it,
+    resuming at the stage that failed.
+
+    Returns:
+        The content record after adding the reference; its ``_id`` is the
+        content key
+    """
+    content_hash = content_key(user_id, sha256)
+    now = datetime.now(timezone.utc)
+
+    async def upsert() -> Dict[str, Any]:
+        return await file_contents_collection.find_one_and_update(
+            {"_id": content_hash},
+            {
+                "$inc": {"refcount": 1},
+                "$setOnInsert": {
+                    "user_id": user_id,
+                    "artifact_id": uuid.uuid4().hex,
+                    "type": content_type,
+                    "size": size,
+                    "status": FileStatus.PROCESSING,
+                    "ingestion": {
+                        "stage": FileIngestionStage.PARSE,
+                        "resumes": 0,
+                        "updated_at": now,
+                    },
+                    "created_at": now,
+                },
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    try:
+        content = await upsert()
+    except DuplicateKeyError:
+        # Another upload created the record at the same time; now it exists
+        content = await upsert()
+
+    if content["status"] == FileStatus.FAILED:
+        await file_contents_collection.update_one(
+            {"_id": content_hash, "status": FileStatus.FAILED},
+            {
+                "$set": {
+                    "status": FileStatus.PROCESSING,
+                    "ingestion.resumes": 0,
+                    "ingestion.updated_at": now,
+                },
+                "$unset": {"ingestion.error": ""},
+            },
+        )
+        content["status"] = FileStatus.PROCESSING
+
+    return content
+
+
+async def release_content(content_hash: str) -> None:
+    """Drop a reference to a content, garbage collecting it after the last one."""
+    content = await file_contents_collection.find_one_and_update(
+        {"_id": content_hash},
+        {"$inc": {"refcount": -1}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if content is None or content["refcount"] > 0:
+        return
+
+    # An upload may have taken a new reference in the meantime
+    result = await file_contents_collection.delete_one(
+        {"_id": content_hash, "refcount": {"$lte": 0}}
+    )
+    if result.deleted_count:
+        await _collect_artifacts(content)
+
+
+async def _collect_artifacts(content: Dict[str, Any]) -> None:
+    """Delete a collected content's stored file and embeddings."""
+    artifact_id = content["artifact_id"]
+
+    public_id = content.get("public_id")
+    if public_id:
+        try:
+            cloudinary_result = await asyncio.to_thread(
+                cloudinary.uploader.destroy, public_id
+            )
+            if cloudinary_result.get("result") != "ok":
+                logger.warning(
+                    f"Failed to delete file from Cloudinary: {cloudinary_result}"
+                )
+        except Exception as e:
+            logger.error(
+                f"Error deleting file from Cloudinary: {str(e)}", exc_info=True
+            )
+
+    try:
+        contents_store = await ChromaClient.get_langchain_client(
+            collection_name=CONTENT_EMBEDDINGS_COLLECTION
+        )
+        await contents_store.adelete(where={"artifact_id": artifact_id})
+    except Exception as e:
+        logger.error(f"Failed to delete content embeddings from ChromaDB: {str(e)}")
+
+    logger.info(f"Garbage collected file content {content['_id']}")
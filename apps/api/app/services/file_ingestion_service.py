@@ -0,0 +1,440 @@
+"""
+Background ingestion of uploaded files.
+
+``upload_file_service`` only stores the raw file and a reference to its
+content (see file_content_service) and queues ``process_file_ingestion`` for
+the content hash. The job runs the content through three stages, once per
+content however many files reference it:
+
+- parse: download the stored file and extract its pages
+- summarize: summarize the pages with the LLM
+- embed: embed the summaries into the "document_contents" collection
+
+Each stage's output is checkpointed on the content record, together with the
+next stage to run (``ingestion.stage``), before that stage starts. A job that
+crashes or times out therefore resumes where it stopped instead of parsing
+and summarizing again. A failing stage is retried with backoff; once its
+attempts are used up the content and its files are marked failed.
+
+Once the content is indexed, every file still processing is linked to it: the
+stored embeddings are copied into the "documents" collection under the file's
+own ID and metadata, so vector search stays per user without embedding again.
+Progress is published to each file's user over the WebSocket as
+``file_ingestion_progress`` messages.
+
+Files only become visible to chat once indexed (see ``fetch_files``).
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+
+from app.config.loggers import app_logger as logger
+from app.constants.files import (
+    FILE_DOWNLOAD_TIMEOUT,
+    FILE_INGESTION_RETRY_DELAY,
+    FILE_INGESTION_STAGE_MAX_ATTEMPTS,
+)
+from app.core.websocket_manager import websocket_manager
+from app.db.chroma.chromadb import ChromaClient
+from app.db.mongodb.collections import file_contents_collection, files_collection
+from app.models.files_models import (
+    DocumentPageModel,
+    DocumentSummaryModel,
+    FileIngestionStage,
+    FileStatus,
+)
+from app.services.file_content_service import CONTENT_EMBEDDINGS_COLLECTION
+from app.services.file_service import _process_file_summary, _summary_documents
+from app.utils.file_utils import DocumentProcessor
+from app.utils.http_client import request
+
+T = TypeVar("T")
+
+# Progress reported when each stage starts
+STAGE_PROGRESS = {
+    FileIngestionStage.PARSE: 10,
+    FileIngestionStage.SUMMARIZE: 40,
+    FileIngestionStage.EMBED: 80,
+    FileIngestionStage.DONE: 100,
+}
+
+# Projection of the file fields needed to link and notify a file
+_FILE_FIELDS = {
+    "file_id": 1,
+    "user_id": 1,
+    "filename": 1,
+    "type": 1,
+    "conversation_id": 1,
+}
+
+
+class ContentDeletedError(Exception):
+    """Every file referencing the content was deleted during ingestion."""
+
+
+async def _processing_files(content_hash: str) -> List[Dict[str, Any]]:
+    return await files_collection.find(
+        {"content_hash": content_hash, "status": FileStatus.PROCESSING},
+        _FILE_FIELDS,
+    ).to_list(length=None)
+
+
+async def emit_ingestion_progress(
+    file: Dict[str, Any],
+    stage: FileIngestionStage,
+    status: FileStatus = FileStatus.PROCESSING,
+    error: Optional[str] = None,
+) -> None:
+    """Publish a file's ingestion progress to the user's WebSockets."""
+    await websocket_manager.broadcast_to_user(
+        file["user_id"],
+        {
+            "type": "file_ingestion_progress",
+            "data": {
+                "file_id": file["file_id"],
+                "filename": file.get("filename"),
+                "stage": stage.value,
+                "status": status.value,
+                "progress": STAGE_PROGRESS[stage],
+                "error": error,
+            },
+        },
+    )
+
+
+async def _emit_to_files(content_hash: str, stage: FileIngestionStage) -> None:
+    """Report a content's stage to every file waiting on it."""
+    for file in await _processing_files(content_hash):
+        await emit_ingestion_progress(file, stage)
+
+
+async def _checkpoint(
+    content_hash: str,
+    next_stage: FileIngestionStage,
+    fields: Dict[str, Any],
+    unset: Optional[List[str]] = None,
+) -> None:
+    """Store a stage's output along with the next stage to run."""
+    now = datetime.now(timezone.utc)
+    update: Dict[str, Any] = {
+        "$set": {
+            **fields,
+            "ingestion.stage": next_stage,
+            "ingestion.updated_at": now,
+        }
+    }
+    if unset:
+        update["$unset"] = {field: "" for field in unset}
+
+    result = await file_contents_collection.update_one({"_id": content_hash}, update)
+    if result.matched_count == 0:
+        raise ContentDeletedError(content_hash)
+
+
+async def _with_retries(
+    key: str, stage: FileIngestionStage, operation: Callable[[], Awaitable[T]]
+) -> T:
+    """Run one stage's operation, retrying failures with exponential backoff."""
+    attempt = 1
+    while True:
+        try:
+            return await operation()
+        except Exception as e:
+            if attempt >= FILE_INGESTION_STAGE_MAX_ATTEMPTS:
+                raise
+            delay = FILE_INGESTION_RETRY_DELAY * 2 ** (attempt - 1)
+            logger.warning(
+                f"{key}: {stage.value} attempt {attempt} failed ({e}), "
+                f"retrying in {delay}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+async def _download(url: str) -> bytes:
+    response = await request("GET", url, timeout=FILE_DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+def _stored_summary(
+    content: Dict[str, Any],
+) -> Union[str, List[DocumentSummaryModel], DocumentSummaryModel]:
+    """Rebuild the summarize stage's result from the checkpointed fields."""
+    page_wise_summary = content.get("page_wise_summary")
+    if isinstance(page_wise_summary, list):
+        return [DocumentSummaryModel.model_validate(page) for page in page_wise_summary]
+    if isinstance(page_wise_summary, dict):
+        return DocumentSummaryModel.model_validate(page_wise_summary)
+    return content.get("description", "")
+
+
+async def _parse(content: Dict[str, Any], processor: DocumentProcessor) -> None:
+    content_hash = content["_id"]
+    data = await _with_retries(
+        content_hash, FileIngestionStage.PARSE, lambda: _download(content["url"])
+    )
+    pages = await _with_retries(
+        content_hash,
+        FileIngestionStage.PARSE,
+        lambda: processor.extract_pages(
+            data, content["type"], content.get("filename", "")
+        ),
+    )
+
+    content["parsed_pages"] = [page.model_dump(mode="json") for page in pages]
+    await _checkpoint(
+        content_hash,
+        FileIngestionStage.SUMMARIZE,
+        {"parsed_pages": content["parsed_pages"]},
+    )
+
+
+async def _summarize(content: Dict[str, Any], processor: DocumentProcessor) -> None:
+    content_hash = content["_id"]
+    pages = [
+        DocumentPageModel.model_validate(page)
+        for page in content.get("parsed_pages", [])
+    ]
+    summary_result = await _with_retries(
+        content_hash,
+        FileIngestionStage.SUMMARIZE,
+        lambda: processor.summarize_pages(
+            pages, content["type"], content.get("filename", "")
+        ),
+    )
+
+    summary, page_wise_summary = _process_file_summary(summary_result)
+    content["description"] = summary
+    content["page_wise_summary"] = page_wise_summary
+    # page_wise_summary holds the page contents too, so the parsed pages can go
+    await _checkpoint(
+        content_hash,
+        FileIngestionStage.EMBED,
+        {"description": summary, "page_wise_summary": page_wise_summary},
+        unset=["parsed_pages"],
+    )
+
+
+async def _embed(content: Dict[str, Any]) -> None:
+    ids, documents = _summary_documents(
+        _stored_summary(content),
+        content["artifact_id"],
+        {"artifact_id": content["artifact_id"]},
+    )
+    contents_store = await ChromaClient.get_langchain_client(
+        collection_name=CONTENT_EMBEDDINGS_COLLECTION
+    )
+    await _with_retries(
+        content["_id"],
+        FileIngestionStage.EMBED,
+        lambda: contents_store.aadd_documents(ids=ids, documents=documents),
+    )
+
+    try:
+        await _checkpoint(
+            content["_id"], FileIngestionStage.DONE, {"status": FileStatus.INDEXED}
+        )
+    except ContentDeletedError:
+        # Collected while embedding, possibly before these embeddings were
+        # added. The artifact_id is unique to this record, so this only
+        # removes what the collected content left behind.
+        await contents_store.adelete(where={"artifact_id": content["artifact_id"]})
+        raise
+
+
+async def _copy_embeddings(
+    stored: Dict[str, Any], artifact_id: str, file: Dict[str, Any]
+) -> None:
+    """Index a file in "documents" with its content's stored embeddings."""
+    file_id = file["file_id"]
+    metadata = {
+        "file_id": file_id,
+        "user_id": file["user_id"],
+        "filename": file["filename"],
+        "type": file["type"],
+    }
+    if file.get("conversation_id"):
+        metadata["conversation_id"] = file["conversation_id"]
+
+    client = await ChromaClient.get_client()
+    documents_collection = await client.get_collection("documents")
+    await documents_collection.upsert(
+        ids=[stored_id.replace(artifact_id, file_id, 1) for stored_id in stored["ids"]],
+        embeddings=stored["embeddings"],
+        documents=stored["documents"],
+        metadatas=[
+            {
+                **metadata,
+                **{k: v for k, v in stored_metadata.items() if k != "artifact_id"},
+            }
+            for stored_metadata in stored["metadatas"]
+        ],
+    )
+
+
+async def _delete_search_entries(file_id: str) -> None:
+    documents_store = await ChromaClient.get_langchain_client(
+        collection_name="documents"
+    )
+    await documents_store.adelete(where={"file_id": file_id})
+
+
+async def _link_files(content: Dict[str, Any]) -> int:
+    """
+    Index every file still waiting on an indexed content and mark it indexed.
+
+    Files uploaded while linking are picked up too, since the query repeats
+    until no file is left processing.
+    """
+    content_hash = content["_id"]
+    artifact_id = content["artifact_id"]
+
+    client = await ChromaClient.get_client()
+    contents_collection = await client.get_or_create_collection(
+        CONTENT_EMBEDDINGS_COLLECTION, metadata={"hnsw:space": "cosine"}
+    )
+    stored = await contents_collection.get(
+        where={"artifact_id": artifact_id},
+        include=["embeddings", "documents", "metadatas"],
+    )
+
+    linked = 0
+    while files := await _processing_files(content_hash):
+        for file in files:
+            file_id = file["file_id"]
+            try:
+                if stored["ids"]:
+                    await _with_retries(
+                        file_id,
+                        FileIngestionStage.EMBED,
+                        partial(_copy_embeddings, stored, artifact_id, file),
+                    )
+            except Exception as e:
+                logger.error(f"Failed to index file {file_id}: {e}", exc_info=True)
+                await _fail_files([file], f"{FileIngestionStage.EMBED.value}: {e}")
+                continue
+
+            result = await files_collection.update_one(
+                {"file_id": file_id, "status": FileStatus.PROCESSING},
+                {
+                    "$set": {
+                        "status": FileStatus.INDEXED,
+                        "description": content.get("description", ""),
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+            )
+            if result.matched_count == 0:
+                # Deleted while it was being indexed
+                await _delete_search_entries(file_id)
+                continue
+
+            await emit_ingestion_progress(
+                file, FileIngestionStage.DONE, FileStatus.INDEXED
+            )
+            linked += 1
+
+    return linked
+
+
+async def _fail_files(files: List[Dict[str, Any]], error: str) -> None:
+    for file in files:
+        await files_collection.update_one(
+            {"file_id": file["file_id"], "status": FileStatus.PROCESSING},
+            {
+                "$set": {
+                    "status": FileStatus.FAILED,
+                    "error": error,
+                    "updated_at": datetime.now(timezone.utc),
+                }
+            },
+        )
+        await emit_ingestion_progress(
+            file, FileIngestionStage.DONE, FileStatus.FAILED, error=error
+        )
+
+
+async def run_file_ingestion(content_hash: str) -> int:
+    """
+    Run a content's remaining ingestion stages and index the files using it.
+
+    Args:
+        content_hash: Key of the uploaded content (``{user_id}:{sha256}``)
+
+    Returns:
+        The number of files indexed
+
+    Raises:
+        ContentDeletedError: If no file references the content anymore
+        Exception: The error of a stage that failed all its attempts, after
+            the content and its files have been marked failed
+    """
+    content = await file_contents_collection.find_one({"_id": content_hash})
+    if not content:
+        raise ContentDeletedError(content_hash)
+
+    if content["status"] == FileStatus.FAILED:
+        await _fail_files(
+            await _processing_files(content_hash),
+            content.get("ingestion", {}).get("error", "Ingestion failed"),
+        )
+        return 0
+
+    stage = FileIngestionStage(
+        content.get("ingestion", {}).get("stage", FileIngestionStage.PARSE)
+    )
+    if stage not in (FileIngestionStage.PARSE, FileIngestionStage.DONE):
+        logger.info(f"Resuming ingestion of content {content_hash} at {stage.value}")
+
+    if stage != FileIngestionStage.DONE:
+        # Only the pipeline needs a name, for the fallback description of
+        # types it can't extract
+        file = await files_collection.find_one(
+            {"content_hash": content_hash}, {"filename": 1}
+        )
+        content["filename"] = file["filename"] if file else ""
+
+    try:
+        if stage in (FileIngestionStage.PARSE, FileIngestionStage.SUMMARIZE):
+            processor = DocumentProcessor()
+            if stage == FileIngestionStage.PARSE:
+                await _emit_to_files(content_hash, stage)
+                await _parse(content, processor)
+                stage = FileIngestionStage.SUMMARIZE
+
+            await _emit_to_files(content_hash, stage)
+            await _summarize(content, processor)
+            stage = FileIngestionStage.EMBED
+
+        if stage == FileIngestionStage.EMBED:
+            await _emit_to_files(content_hash, stage)
+            await _embed(content)
+            stage = FileIngestionStage.DONE
+
+    except ContentDeletedError:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Ingestion of content {content_hash} failed at {stage.value}: {e}",
+            exc_info=True,
+        )
+        error = f"{stage.value}: {e}"
+        await file_contents_collection.update_one(
+            {"_id": content_hash},
+            {
+                "$set": {
+                    "status": FileStatus.FAILED,
+                    "ingestion.error": error,
+                    "ingestion.updated_at": datetime.now(timezone.utc),
+                }
+            },
+        )
+        await _fail_files(await _processing_files(content_hash), error)
+        raise
+
+    linked = await _link_files(content)
+    logger.info(f"Content {content_hash} indexed for {linked} files")
+    return linked
@@ -3,22 +3,35 @@ Service module for file upload functionality with vector search capabilities.
 """
 
 import asyncio
-import io
+import hashlib
+import os
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import cloudinary
 import cloudinary.uploader
 from app.config.loggers import app_logger as logger
 from app.db.chroma.chromadb import ChromaClient
-from app.db.mongodb.collections import files_collection
+from app.constants.files import (
+    FILE_FAILED_DESCRIPTION,
+    FILE_HASH_CHUNK_SIZE,
+    FILE_PROCESSING_DESCRIPTION,
+    FILE_UPLOAD_MAX_SIZE,
+)
+from app.db.mongodb.collections import file_contents_collection, files_collection
 from app.db.utils import serialize_document
 from app.decorators.caching import Cacheable, CacheInvalidator
-from app.models.files_models import DocumentSummaryModel
+from app.models.files_models import (
+    DocumentSummaryModel,
+    FileStatus,
+    FileStatusResponse,
+)
 from app.models.message_models import FileData
+from app.services.file_content_service import acquire_content, release_content
 from app.utils.embedding_utils import search_documents_by_similarity
 from app.utils.file_utils import generate_file_summary
+from app.utils.redis_utils import RedisPoolManager
 from fastapi import HTTPException, UploadFile
 from langchain_core.documents import Document
 
@@ -34,13 +47,21 @@ async def upload_file_service(
     conversation_id: Optional[str] = None,
 ) -> dict:
     """
-    Upload a file to Cloudinary, generate embeddings, and store metadata in MongoDB and ChromaDB.
+    Store an uploaded file as a reference to its content and queue its ingestion.
+
+    The upload is hashed in chunks. Content this user uploaded before
+    (identical bytes, from any of their conversations) is reused: only a
+    reference is stored, and ingestion merely links it to the existing
+    summaries and embeddings. New content is uploaded to Cloudinary once.
+    Content is never shared between users. Returns as soon as the raw file is
+    stored. Parsing, summarizing and embedding run in the background
+    (process_file_ingestion), which reports progress over the WebSocket.
     Args:
         file (UploadFile): The file to upload
         user_id (str): The ID of the user uploading the file
         conversation_id (str, optional): The conversation ID to associate with the file
     Returns:
-        dict: File metadata including file_id and url
+        dict: File metadata including file_id, url and ingestion status
     Raises:
         HTTPException: If file upload fails
     """
@@ -56,46 +77,26 @@ async def upload_file_service(
         )
 
     file_id = str(uuid.uuid4())
-    public_id = f"file_{file_id}_{file.filename.replace(' ', '_')}"
 
     try:
-        content = await file.read()
-
-        file_size = len(content)
-        if file_size > 10 * 1024 * 1024:
-            logger.error("File size exceeds the 10 MB limit")
-            raise HTTPException(
-                status_code=400, detail="File size exceeds the 10 MB limit"
-            )
-
-        cloudinary_task = asyncio.to_thread(
-            cloudinary.uploader.upload,
-            io.BytesIO(content),
-            resource_type="auto",
-            public_id=public_id,
-            overwrite=True,
-        )
-
-        summary_task = generate_file_summary(
-            file_content=content,
-            content_type=file.content_type,
-            filename=file.filename,
-        )
-
-        upload_result, summary_result = await asyncio.gather(
-            cloudinary_task,
-            summary_task,
-        )
-
-        file_url = upload_result.get("secure_url")
-        if not file_url:
-            logger.error("Missing secure_url in Cloudinary upload response")
-            raise HTTPException(
-                status_code=500, detail="Invalid response from file upload service"
-            )
+        sha256, file_size = await _hash_upload(file)
+        content = await acquire_content(user_id, sha256, file.content_type, file_size)
+        content_hash = content["_id"]
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to upload file: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
 
-        summary, formatted_file_content = _process_file_summary(summary_result)
+    try:
+        file_url = content.get("url")
+        if file_url:
+            logger.info(f"File {file_id} reuses stored content {content_hash}")
+        else:
+            file_url = await _upload_content(file, content)
 
+        # Parsing, summarizing and embedding run in the worker
+        # (see file_ingestion_service); the file is visible to chat once indexed
         current_time = datetime.now(timezone.utc)
         file_metadata = {
             "file_id": file_id,
@@ -103,44 +104,112 @@ async def upload_file_service(
             "type": file.content_type,
             "size": file_size,
             "url": file_url,
-            "public_id": public_id,
+            "content_hash": content_hash,
             "user_id": user_id,
-            "description": summary,
-            "page_wise_summary": formatted_file_content,
+            "status": FileStatus.PROCESSING,
             "created_at": current_time,
             "updated_at": current_time,
         }
         if conversation_id:
             file_metadata["conversation_id"] = conversation_id
 
-        # Store in DB (Mongo + Chroma)
-        await asyncio.gather(
-            _store_in_mongodb(file_metadata),
-            _store_in_chromadb(
-                file_id=file_id,
-                user_id=user_id,
-                filename=file.filename,
-                content_type=file.content_type,
-                conversation_id=conversation_id,
-                file_description=summary_result,
-            ),
-        )
+        await _store_in_mongodb(file_metadata)
+        await queue_file_ingestion(content_hash)
 
         return {
             "file_id": file_id,
             "url": file_url,
             "filename": file.filename,
-            "description": summary,
             "type": file.content_type,
+            "status": FileStatus.PROCESSING,
         }
 
     except HTTPException:
+        await release_content(content_hash)
         raise
     except Exception as e:
+        await release_content(content_hash)
         logger.error(f"Failed to upload file: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
 
 
+async def _hash_upload(file: UploadFile) -> Tuple[str, int]:
+    """
+    Fingerprint an upload with SHA-256, reading it in chunks.
+
+    Returns:
+        The hex digest and the size in bytes
+    """
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := await file.read(FILE_HASH_CHUNK_SIZE):
+        size += len(chunk)
+        if size > FILE_UPLOAD_MAX_SIZE:
+            logger.error("File size exceeds the 10 MB limit")
+            raise HTTPException(
+                status_code=400, detail="File size exceeds the 10 MB limit"
+            )
+        digest.update(chunk)
+
+    await file.seek(0)
+    return digest.hexdigest(), size
+
+
+async def _upload_content(file: UploadFile, content: Dict[str, Any]) -> str:
+    """Upload new content to Cloudinary and record it; returns the file URL."""
+    # Named after the content, not the file, since other uploads share it
+    extension = os.path.splitext(file.filename or "")[1]
+    public_id = f"file_{content['artifact_id']}{extension}"
+
+    upload_result = await asyncio.to_thread(
+        cloudinary.uploader.upload,
+        file.file,
+        resource_type="auto",
+        public_id=public_id,
+        overwrite=True,
+    )
+
+    file_url = upload_result.get("secure_url")
+    if not file_url:
+        logger.error("Missing secure_url in Cloudinary upload response")
+        raise HTTPException(
+            status_code=500, detail="Invalid response from file upload service"
+        )
+
+    await file_contents_collection.update_one(
+        {"_id": content["_id"], "artifact_id": content["artifact_id"]},
+        {"$set": {"url": file_url, "public_id": public_id}},
+    )
+    return file_url
+
+
+async def queue_file_ingestion(content_hash: str) -> None:
+    """
+    Queue background ingestion of uploaded content as an ARQ task.
+
+    The job ID is derived from the content hash, so content already queued or
+    being processed isn't queued twice. If queuing fails,
+    resume_file_ingestions picks the files up once they're stale.
+    """
+    try:
+        pool = await RedisPoolManager.get_pool()
+        job = await pool.enqueue_job(
+            "process_file_ingestion",
+            content_hash,
+            _job_id=f"file_ingestion:{content_hash}",
+        )
+
+        if job:
+            logger.info(
+                f"Queued ingestion for content {content_hash} with job ID {job.job_id}"
+            )
+        else:
+            logger.info(f"Ingestion for content {content_hash} is already queued")
+
+    except Exception as e:
+        logger.error(f"Error queuing ingestion for content {content_hash}: {e}")
+
+
 def _process_file_summary(
     file_summary: str | list[DocumentSummaryModel] | DocumentSummaryModel,
 ) -> tuple:
@@ -184,51 +253,16 @@ async def _store_in_chromadb(
             collection_name="documents"
         )
 
-        documents = []
-        ids = []
-
-        if isinstance(file_description, list):
-            for page in file_description:
-                metadata = {
-                    "file_id": file_id,
-                    "user_id": user_id,
-                    "filename": filename,
-                    "type": content_type,
-                    "page_number": page.data.page_number,
-                }
-
-                if conversation_id:
-                    metadata["conversation_id"] = conversation_id
-
-                documents.append(
-                    Document(
-                        page_content=page.summary,
-                        metadata=metadata,
-                    )
-                )
-                ids.append(str(uuid.uuid4()))  # Generate a new ID for each page
-        else:
-            metadata = {
-                "file_id": file_id,
-                "user_id": user_id,
-                "filename": filename,
-                "type": content_type,
-            }
-
-            if conversation_id:
-                metadata["conversation_id"] = conversation_id
+        metadata = {
+            "file_id": file_id,
+            "user_id": user_id,
+            "filename": filename,
+            "type": content_type,
+        }
+        if conversation_id:
+            metadata["conversation_id"] = conversation_id
 
-            documents.append(
-                Document(
-                    page_content=(
-                        file_description
-                        if isinstance(file_description, str)
-                        else file_description.summary
-                    ),
-                    metadata=metadata,
-                )
-            )
-            ids.append(file_id)
+        ids, documents = _summary_documents(file_description, file_id, metadata)
 
         # Store document metadata in ChromaDB
         await chroma_documents_collection.aadd_documents(
@@ -244,6 +278,39 @@ async def _store_in_chromadb(
         )
 
 
+def _summary_documents(
+    file_description, id_prefix: str, metadata: Dict[str, Any]
+) -> Tuple[List[str], List[Document]]:
+    """
+    Build the ChromaDB IDs and documents indexing a file description.
+
+    Page-wise summaries get one document per page, with stable IDs so indexing
+    again overwrites them; other descriptions are a single document.
+    """
+    if isinstance(file_description, list):
+        return (
+            [f"{id_prefix}_{page.data.page_number}" for page in file_description],
+            [
+                Document(
+                    page_content=page.summary,
+                    metadata={**metadata, "page_number": page.data.page_number},
+                )
+                for page in file_description
+            ],
+        )
+
+    return [id_prefix], [
+        Document(
+            page_content=(
+                file_description
+                if isinstance(file_description, str)
+                else file_description.summary
+            ),
+            metadata=metadata,
+        )
+    ]
+
+
 async def update_file_in_chromadb(
     file_id: str,
     user_id: str,
@@ -259,7 +326,7 @@ async def update_file_in_chromadb(
             chroma_documents_collection = await ChromaClient.get_langchain_client(
                 collection_name="documents"
             )
-            await chroma_documents_collection.adelete(ids=[file_id])
+            await chroma_documents_collection.adelete(where={"file_id": file_id})
             logger.info(f"Removed old file data for {file_id} from ChromaDB")
         except Exception as delete_err:
             # Just log and continue with the new insertion
@@ -332,21 +399,41 @@ async def fetch_files(context: Dict[str, Any]) -> Dict[str, Any]:
         if explicit_file_ids:
             logger.info(f"Fetching {len(explicit_file_ids)} files by ID")
 
-            # Find which IDs aren't in the file_data_map
-            missing_ids = [
-                file_id for file_id in explicit_file_ids if file_id not in file_data_map
-            ]
+            stored_files = await files_collection.find(
+                {"file_id": {"$in": explicit_file_ids}},
+                {"page_wise_summary": 0},
+            ).to_list(length=None)
+            stored_ids = {file_data["file_id"] for file_data in stored_files}
+
+            # Files still being ingested (or whose ingestion failed) have no
+            # description yet; the model gets a placeholder saying so instead.
+            # Files uploaded before background ingestion have no status.
+            pending_descriptions = {
+                file_data["file_id"]: (
+                    FILE_FAILED_DESCRIPTION
+                    if file_data["status"] == FileStatus.FAILED
+                    else FILE_PROCESSING_DESCRIPTION
+                )
+                for file_data in stored_files
+                if file_data.get("status") not in (FileStatus.INDEXED, None)
+            }
+            if pending_descriptions:
+                logger.info(
+                    f"{len(pending_descriptions)} attached files aren't indexed yet"
+                )
 
             # Process files from file_data_map
             for file_id in explicit_file_ids:
-                if file_id in file_data_map:
+                if file_id in file_data_map and file_id in stored_ids:
                     file_data = file_data_map[file_id]
                     included_files.append(
                         {
                             "file_id": file_data["file_id"],
                             "url": file_data["url"],
                             "filename": file_data["filename"],
-                            "description": file_data.get("deskcription", ""),
+                            "description": pending_descriptions.get(
+                                file_id, file_data.get("deskcription", "")
+                            ),
                             "content_type": file_data.get("content_type", ""),
                             "_id": file_data[
                                 "file_id"
@@ -354,36 +441,36 @@ async def fetch_files(context: Dict[str, Any]) -> Dict[str, Any]:
                         }
                     )
 
-            # Batch lookup missing files from database
-            if missing_ids:
-                db_files = await files_collection.find(
-                    {"file_id": {"$in": missing_ids}}
-                ).to_list(length=None)
-
-                for file_data in db_files:
-                    # Convert ObjectId to string for serialization
-                    if "_id" in file_data:
-                        file_data["_id"] = str(file_data["_id"])
-
-                    # Convert date fields to ISO format
-                    for date_field in ["created_at", "updated_at"]:
-                        if date_field in file_data and hasattr(
-                            file_data[date_field], "isoformat"
-                        ):
-                            file_data[date_field] = file_data[date_field].isoformat()
-
-                    included_files.append(
-                        {
-                            "file_id": file_data["file_id"],
-                            "url": file_data["url"],
-                            "filename": file_data["filename"],
-                            "description": file_data.get("description", ""),
-                            "content_type": file_data.get("content_type", ""),
-                            "_id": file_data[
-                                "file_id"
-                            ],  # Use file_id as _id for consistency
-                        }
-                    )
+            # Files without fileData use the database documents
+            for file_data in stored_files:
+                if file_data["file_id"] in file_data_map:
+                    continue
+
+                # Convert ObjectId to string for serialization
+                if "_id" in file_data:
+                    file_data["_id"] = str(file_data["_id"])
+
+                # Convert date fields to ISO format
+                for date_field in ["created_at", "updated_at"]:
+                    if date_field in file_data and hasattr(
+                        file_data[date_field], "isoformat"
+                    ):
+                        file_data[date_field] = file_data[date_field].isoformat()
+
+                included_files.append(
+                    {
+                        "file_id": file_data["file_id"],
+                        "url": file_data["url"],
+                        "filename": file_data["filename"],
+                        "description": pending_descriptions.get(
+                            file_data["file_id"], file_data.get("description", "")
+                        ),
+                        "content_type": file_data.get("content_type", ""),
+                        "_id": file_data[
+                            "file_id"
+                        ],  # Use file_id as _id for consistency
+                    }
+                )
 
         # 2. Perform vector search for relevant files based on the query
         # Only perform the search if there's a meaningful query
@@ -482,6 +569,41 @@ async def fetch_files(context: Dict[str, Any]) -> Dict[str, Any]:
     return context
 
 
+async def get_file_status_service(file_id: str, user_id: str) -> FileStatusResponse:
+    """
+    Get the ingestion status of a user's file.
+
+    Args:
+        file_id (str): The ID of the file
+        user_id (str): The ID of the authenticated user
+
+    Returns:
+        FileStatusResponse: The file's status, its description once indexed
+        and the error if ingestion failed
+
+    Raises:
+        HTTPException: If the file is not found
+    """
+    file_data = await files_collection.find_one(
+        {"file_id": file_id, "user_id": user_id},
+        {"file_id": 1, "filename": 1, "status": 1, "description": 1, "error": 1},
+    )
+    if not file_data:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    # Files uploaded before background ingestion were indexed on upload
+    file_status = FileStatus(file_data.get("status", FileStatus.INDEXED))
+    return FileStatusResponse(
+        file_id=file_id,
+        filename=file_data.get("filename"),
+        status=file_status,
+        description=(
+            file_data.get("description") if file_status == FileStatus.INDEXED else None
+        ),
+        error=file_data.get("error") if file_status == FileStatus.FAILED else None,
+    )
+
+
 @CacheInvalidator(
     key_patterns=[
         "files:{user_id}:*",
@@ -490,7 +612,8 @@ async def fetch_files(context: Dict[str, Any]) -> Dict[str, Any]:
 async def delete_file_service(file_id: str, user_id: Optional[str]) -> dict:
     """
     Delete a file by its ID for the specified user.
-    Removes the file from MongoDB, Cloudinary, and ChromaDB.
+    Removes the file from MongoDB and ChromaDB, and releases its shared
+    content (deleted from Cloudinary once no other file references it).
 
     Args:
         file_id (str): The ID of the file to delete
@@ -518,9 +641,11 @@ async def delete_file_service(file_id: str, user_id: Optional[str]) -> dict:
             status_code=404, detail="File not found"
         )  # Get the conversation_id for cache invalidation
 
-    # Get the public_id for cloudinary deletion
+    # Files referencing shared content don't own a Cloudinary asset; the
+    # content is garbage collected once no file references it
+    content_hash = file_data.get("content_hash")
     public_id = file_data.get("public_id")
-    if not public_id:
+    if not content_hash and not public_id:
         logger.warning(f"File {file_id} has no public_id for Cloudinary deletion")
 
     # Delete from MongoDB
@@ -529,6 +654,15 @@ async def delete_file_service(file_id: str, user_id: Optional[str]) -> dict:
         logger.error("File not found for deletion in MongoDB")
         raise HTTPException(status_code=404, detail="File not found")
 
+    if content_hash:
+        try:
+            await release_content(content_hash)
+        except Exception as e:
+            # Log but don't fail; the file itself is already deleted
+            logger.error(
+                f"Failed to release content {content_hash}: {str(e)}", exc_info=True
+            )
+
     # Delete from Cloudinary if public_id exists
     if public_id:
         try:
@@ -547,7 +681,8 @@ async def delete_file_service(file_id: str, user_id: Optional[str]) -> dict:
         chroma_documents_collection = await ChromaClient.get_langchain_client(
             collection_name="documents"
         )
-        await chroma_documents_collection.adelete(ids=[file_id])
+        # Page-wise files are indexed as one document per page
+        await chroma_documents_collection.adelete(where={"file_id": file_id})
         logger.info(f"File with id {file_id} deleted from ChromaDB")
     except Exception as e:
         # Log the error but don't fail the request if ChromaDB deletion fails
@@ -0,0 +1,87 @@
+"""
+Per-user Gmail rate limiting.
+
+Gmail enforces a per-user quota measured in quota units per second
+(250 units/s). Each API method has a fixed unit cost, e.g. ``messages.get``
+costs 5 units, so a single user can fetch at most ~50 messages per second.
+
+This module keeps one token bucket per user so concurrent fetches for the
+same mailbox never exceed that quota, while different users are throttled
+independently. Buckets are kept in a bounded LRU so idle users do not leak.
+"""
+
+import asyncio
+import random
+from collections import OrderedDict
+
+from aiolimiter import AsyncLimiter
+
+from app.constants.email import (
+    GMAIL_MAX_TRACKED_USERS,
+    GMAIL_USER_QUOTA_UNITS_PER_SECOND,
+)
+
+# Quota unit costs for the Gmail API methods behind the Composio tools we use.
+# https://developers.google.com/gmail/api/reference/quota
+GMAIL_QUOTA_COSTS = {
+    "GMAIL_FETCH_EMAILS": 5,  # messages.list
+    "GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID": 5,  # messages.get
+    "GMAIL_FETCH_MESSAGE_BY_THREAD_ID": 10,  # threads.get
+}
+DEFAULT_QUOTA_COST = 5
+
+
+class GmailRateLimiter:
+    """Token-bucket limiter keyed by user ID, sized to the Gmail per-user quota."""
+
+    def __init__(
+        self,
+        units_per_second: float = GMAIL_USER_QUOTA_UNITS_PER_SECOND,
+        max_users: int = GMAIL_MAX_TRACKED_USERS,
+    ):
+        self._units_per_second = units_per_second
+        self._max_users = max_users
+        self._limiters: OrderedDict[str, AsyncLimiter] = OrderedDict()
+
+    def _get_limiter(self, user_id: str) -> AsyncLimiter:
+        limiter = self._limiters.get(user_id)
+        if limiter is None:
+            limiter = AsyncLimiter(self._units_per_second, time_period=1)
+            self._limiters[user_id] = limiter
+            if len(self._limiters) > self._max_users:
+                self._limiters.popitem(last=False)
+        else:
+            self._limiters.move_to_end(user_id)
+        return limiter
+
+    async def acquire(self, user_id: str, tool_name: str) -> None:
+        """Wait until the user's bucket has capacity for one call of ``tool_name``."""
+        cost = GMAIL_QUOTA_COSTS.get(tool_name, DEFAULT_QUOTA_COST)
+        await self._get_limiter(user_id).acquire(cost)
+
+
+def is_rate_limit_error(error: object) -> bool:
+    """Check whether a Composio/Gmail error message represents a 429 / quota error."""
+    if not error:
+        return False
+    message = str(error).lower()
+    return any(
+        marker in message
+        for marker in (
+            "429",
+            "rate limit",
+            "ratelimitexceeded",
+            "userratelimitexceeded",
+            "too many requests",
+            "quota exceeded",
+        )
+    )
+
+
+async def backoff_delay(attempt: int, base: float, cap: float) -> None:
+    """Sleep with jittered exponential backoff (``base * 2**attempt``, capped)."""
+    delay = min(cap, base * (2**attempt))
+    await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))  # nosec B311
+
+
+gmail_rate_limiter = GmailRateLimiter()
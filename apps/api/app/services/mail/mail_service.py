@@ -1,21 +1,33 @@
+import asyncio
 import json
-import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from app.config.loggers import general_logger as logger
+from app.constants.email import (
+    GMAIL_BACKOFF_BASE_SECONDS,
+    GMAIL_BACKOFF_MAX_SECONDS,
+    GMAIL_FETCH_CONCURRENCY,
+    GMAIL_FETCH_MAX_RETRIES,
+)
 from app.services.composio.composio_service import (
     get_composio_service,
 )
+from app.services.mail.gmail_rate_limiter import (
+    backoff_delay,
+    gmail_rate_limiter,
+    is_rate_limit_error,
+)
 from app.utils.general_utils import transform_gmail_message
 from fastapi import UploadFile
 
 
-def get_gmail_tool(tool_name: str, user_id: str):
+async def get_gmail_tool(tool_name: str, user_id: str):
     """
     Get a specific Gmail tool by name with caching using ComposioService.
 
     Args:
         tool_name: Name of the Gmail tool to retrieve
+        user_id: User ID the tool handle is bound to
 
     Returns:
         The specific Gmail tool or None if not found
@@ -23,7 +35,7 @@ def get_gmail_tool(tool_name: str, user_id: str):
     composio_service = get_composio_service()
 
     try:
-        return composio_service.get_tool(
+        return await composio_service.aget_tool(
             tool_name, use_before_hook=False, use_after_hook=False, user_id=user_id
         )
     except Exception as e:
@@ -46,7 +58,7 @@ async def invoke_gmail_tool(
         Response from the tool execution
     """
     try:
-        tool = get_gmail_tool(tool_name, user_id)
+        tool = await get_gmail_tool(tool_name, user_id)
 
         if not tool:
             return {"error": f"Tool {tool_name} not found", "successful": False}
@@ -146,55 +158,134 @@ async def send_email(
         return {"error": str(e), "successful": False}
 
 
-async def fetch_detailed_messages(
-    user_id: str, messages: List[Dict[str, Any]], batch_size: int = 20, delay: float = 2
-) -> List[Dict[str, Any]]:
+async def invoke_gmail_tool_rate_limited(
+    user_id: str,
+    tool_name: str,
+    parameters: Dict[str, Any],
+    max_retries: int = GMAIL_FETCH_MAX_RETRIES,
+) -> Dict[str, Any]:
     """
-    Fetch detailed Gmail messages using Composio tools while handling rate limits.
+    Invoke a Gmail tool through the per-user quota limiter, retrying on 429s.
 
     Args:
         user_id: User ID for Composio authentication
-        messages: List of message metadata (each containing 'id')
-        batch_size: Number of messages per batch (default: 20)
-        delay: Time in seconds to wait between batch executions
+        tool_name: Name of the Gmail tool to invoke
+        parameters: Parameters to pass to the tool
+        max_retries: Maximum retries when Gmail reports a rate limit error
 
     Returns:
-        List of detailed message objects
+        Response from the tool execution
     """
+    attempt = 0
+    while True:
+        await gmail_rate_limiter.acquire(user_id, tool_name)
+        result = await invoke_gmail_tool(user_id, tool_name, parameters)
+
+        if result.get("successful", True) or not is_rate_limit_error(
+            result.get("error")
+        ):
+            return result
 
-    detailed_messages = []
-    total_messages = len(messages)
+        if attempt >= max_retries:
+            logger.warning(
+                f"Gmail rate limit persisted after {max_retries} retries "
+                f"for {tool_name} (user {user_id})"
+            )
+            return result
 
-    for i in range(0, total_messages, batch_size):
-        batch_messages = messages[i : i + batch_size]
+        await backoff_delay(
+            attempt, GMAIL_BACKOFF_BASE_SECONDS, GMAIL_BACKOFF_MAX_SECONDS
+        )
+        attempt += 1
 
-        # Process each message in the current batch
-        for message in batch_messages:
-            message_id = message.get("id")
-            if not message_id:
-                continue
 
-            try:
-                parameters = {"message_id": message_id}
-                result = await invoke_gmail_tool(
-                    user_id, "GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID", parameters
-                )
+async def stream_detailed_messages(
+    user_id: str,
+    messages: List[Dict[str, Any]],
+    max_concurrency: int = GMAIL_FETCH_CONCURRENCY,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fetch detailed Gmail messages concurrently, yielding each one as it arrives.
+
+    Requests are bounded by ``max_concurrency`` and paced by the per-user
+    Gmail quota limiter; rate-limited calls are retried with backoff. Results
+    are yielded in completion order, not input order.
+
+    Args:
+        user_id: User ID for Composio authentication
+        messages: List of message metadata (each containing 'id')
+        max_concurrency: Maximum number of in-flight fetches
+
+    Yields:
+        Detailed message objects
+    """
+    message_ids = [message["id"] for message in messages if message.get("id")]
+    if not message_ids:
+        return
+
+    pending = iter(message_ids)
+    results: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
 
-                if result.get("successful", True):
-                    detailed_messages.append(result)
-                else:
-                    logger.error(
-                        f"Error fetching message {message_id}: {result.get('error')}"
+    async def _worker() -> None:
+        try:
+            for message_id in pending:
+                try:
+                    result = await invoke_gmail_tool_rate_limited(
+                        user_id,
+                        "GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID",
+                        {"message_id": message_id},
                     )
+                    if result.get("successful", True):
+                        await results.put(result)
+                    else:
+                        logger.error(
+                            f"Error fetching message {message_id}: {result.get('error')}"
+                        )
+                except Exception as e:
+                    logger.error(f"Error fetching message {message_id}: {e}")
+        finally:
+            # Sentinel: this worker has drained its share of the input
+            await results.put(None)
+
+    worker_count = min(max_concurrency, len(message_ids))
+    workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+
+    try:
+        finished = 0
+        while finished < worker_count:
+            item = await results.get()
+            if item is None:
+                finished += 1
+                continue
+            yield item
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
 
-            except Exception as e:
-                logger.error(f"Error fetching message {message_id}: {e}")
+async def fetch_detailed_messages(
+    user_id: str,
+    messages: List[Dict[str, Any]],
+    max_concurrency: int = GMAIL_FETCH_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch detailed Gmail messages using Composio tools while handling rate limits.
 
-        # Rate limiting: wait between batches
-        if i + batch_size < total_messages and delay > 0:
-            time.sleep(delay)
+    Args:
+        user_id: User ID for Composio authentication
+        messages: List of message metadata (each containing 'id')
+        max_concurrency: Maximum number of in-flight fetches
 
-    return detailed_messages
+    Returns:
+        List of detailed message objects (in completion order)
+    """
+    return [
+        message
+        async for message in stream_detailed_messages(
+            user_id, messages, max_concurrency=max_concurrency
+        )
+    ]
 
 
 async def modify_message_labels(
@@ -465,6 +556,7 @@ async def search_messages(
     query: Optional[str] = None,
     max_results: int = 20,
     page_token: Optional[str] = None,
+    rate_limited: bool = False,
 ) -> Dict[str, Any]:
     """
     Search Gmail messages using Composio Gmail tool.
@@ -474,6 +566,8 @@ async def search_messages(
         query: Search query in Gmail's search syntax
         max_results: Maximum number of results to return
         page_token: Token for pagination
+        rate_limited: Pace the call through the per-user quota limiter and
+            retry on 429s (for background bulk scans)
 
     Returns:
         Dict containing messages and next page token
@@ -486,7 +580,12 @@ async def search_messages(
         if page_token:
             parameters["page_token"] = page_token
 
-        result = await invoke_gmail_tool(user_id, "GMAIL_FETCH_EMAILS", parameters)
+        if rate_limited:
+            result = await invoke_gmail_tool_rate_limited(
+                user_id, "GMAIL_FETCH_EMAILS", parameters
+            )
+        else:
+            result = await invoke_gmail_tool(user_id, "GMAIL_FETCH_EMAILS", parameters)
 
         if result.get("successful", True):
             # Transform messages if needed
@@ -503,6 +602,62 @@ async def search_messages(
         return {"messages": [], "nextPageToken": None}
 
 
+async def iter_search_messages(
+    user_id: str,
+    query: Optional[str] = None,
+    max_results: int = 100,
+    page_size: int = 50,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Page through Gmail search results, yielding each page as soon as it arrives.
+
+    The next page is requested while the caller is still processing the
+    current one, so downstream work overlaps with Gmail round-trips. All
+    calls go through the per-user quota limiter.
+
+    Args:
+        user_id: User ID for Composio authentication
+        query: Search query in Gmail's search syntax
+        max_results: Maximum number of messages to yield in total
+        page_size: Number of messages requested per page
+
+    Yields:
+        Lists of transformed messages, one per page
+    """
+    fetched = 0
+
+    def _request(page_token: Optional[str]) -> asyncio.Task[Dict[str, Any]]:
+        return asyncio.create_task(
+            search_messages(
+                user_id=user_id,
+                query=query,
+                max_results=min(page_size, max_results - fetched),
+                page_token=page_token,
+                rate_limited=True,
+            )
+        )
+
+    next_page: Optional[asyncio.Task[Dict[str, Any]]] = _request(None)
+    try:
+        while next_page is not None:
+            result = await next_page
+            next_page = None
+
+            page = result.get("messages", [])[: max_results - fetched]
+            if not page:
+                return
+            fetched += len(page)
+
+            page_token = result.get("nextPageToken")
+            if page_token and fetched < max_results:
+                next_page = _request(page_token)
+
+            yield page
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
 async def create_label(
     user_id: str,
     name: str,
@@ -1006,23 +1161,8 @@ async def get_contact_list(user_id: str, max_results=100):
         # Use a dictionary to track unique contacts
         contacts = {}
 
-        # Process each message to extract contacts
-        for msg_data in messages:
-            msg_id = msg_data.get("id")
-            if not msg_id:
-                continue
-
-            # Fetch full message details
-            msg_params = {"message_id": msg_id}
-            msg_result = await invoke_gmail_tool(
-                user_id, "GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID", msg_params
-            )
-
-            if not msg_result.get("successful", True):
-                continue
-
-            msg = msg_result
-
+        # Fetch full message details concurrently and extract contacts as they arrive
+        async for msg in stream_detailed_messages(user_id, messages):
             # Extract headers
             headers = {}
             if "payload" in msg and "headers" in msg["payload"]:
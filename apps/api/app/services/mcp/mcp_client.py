@@ -18,6 +18,7 @@ Features:
 - HTTPS enforcement for all OAuth endpoints
 """
 
+import asyncio
 import base64
 import re
 import secrets
@@ -29,6 +30,7 @@ from typing import Optional
 import httpx
 from app.config.loggers import langchain_logger as logger
 from app.constants.cache import OAUTH_DISCOVERY_PREFIX
+from app.constants.mcp import MCP_CONNECT_TIMEOUT_SECONDS
 from app.core.lazy_loader import providers
 from app.db.chroma.chroma_tools_store import index_tools_to_store
 from app.db.mongodb.collections import (
@@ -46,6 +48,12 @@ from app.services.integrations.user_integration_status import (
     update_user_integration_status,
 )
 from app.services.mcp.mcp_client_pool import get_mcp_client_pool
+from app.services.mcp.mcp_schema_cache import (
+    compute_schema_hash,
+    get_cached_tool_schemas,
+    serialize_tool_schemas,
+    set_cached_tool_schemas,
+)
 from app.services.mcp.mcp_token_store import MCPTokenStore
 from app.services.mcp.mcp_tools_store import get_mcp_tools_store
 from app.services.mcp.oauth_discovery import (
@@ -71,7 +79,7 @@ from app.utils.mcp_utils import (
     generate_pkce_pair,
     wrap_tools_with_null_filter,
 )
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, StructuredTool
 from mcp_use import MCPClient as BaseMCPClient
 from mcp_use.agents.adapters.langchain_adapter import LangChainAdapter
 
@@ -113,7 +121,12 @@ class MCPClient:
         self.user_id = user_id
         self.token_store = MCPTokenStore(user_id)
         self._clients: dict[str, BaseMCPClient] = {}
+        # Tools handed out per integration: live tools, or lazy tools built from
+        # cached schemas that open the session on first call
         self._tools: dict[str, list[BaseTool]] = {}
+        # Live session tools by name, used to dispatch lazy tool calls
+        self._live_tools: dict[str, dict[str, BaseTool]] = {}
+        self._connect_locks: dict[str, asyncio.Lock] = {}
 
     async def probe_connection(self, server_url: str) -> dict:
         """Probe an MCP server to determine auth requirements."""
@@ -228,13 +241,20 @@ class MCPClient:
 
         return {"mcpServers": {integration_id: server_config}}
 
-    async def connect(self, integration_id: str) -> list[BaseTool]:
+    async def connect(
+        self, integration_id: str, already_connected: bool = False
+    ) -> list[BaseTool]:
         """
         Connect to an MCP server and return LangChain tools.
 
         For unauthenticated MCPs: Connects directly.
         For OAuth MCPs: Uses stored credentials from completed OAuth flow.
         Supports platform integrations (from code) and custom integrations.
+
+        Tool metadata (MongoDB, ChromaDB) is only rewritten when the tool
+        schema hash differs from the cached one. ``already_connected`` marks a
+        reconnect of an integration whose status is already "connected", so
+        the connection records are not rewritten either.
         """
         # Resolve integration from platform config or MongoDB
         resolved = await IntegrationResolver.resolve(integration_id)
@@ -260,13 +280,25 @@ class MCPClient:
 
             self._clients[integration_id] = client
             self._tools[integration_id] = tools
+            self._live_tools[integration_id] = {t.name: t for t in tools}
 
             logger.info(f"[{integration_id}] Connected to MCP, got {len(tools)} tools")
 
             # For unauthenticated MCPs, record connection in PostgreSQL (Issue 4.1 fix)
-            if not mcp_config.requires_auth:
+            if not mcp_config.requires_auth and not already_connected:
                 await self.token_store.store_unauthenticated(integration_id)
 
+            schemas_changed = await self._refresh_schema_cache(
+                integration_id, mcp_config.server_url, tools
+            )
+            if not schemas_changed:
+                logger.info(
+                    f"[{integration_id}] Tool schemas unchanged, skipping metadata writes"
+                )
+                if not already_connected:
+                    await self._mark_connected(integration_id)
+                return tools
+
             # Build tool metadata for MongoDB (name and description only)
             tool_metadata = [
                 {
@@ -304,16 +336,8 @@ class MCPClient:
                     description=custom_desc,
                 )
 
-            # Update user integration status to connected
-            try:
-                await update_user_integration_status(
-                    self.user_id, integration_id, "connected"
-                )
-            except Exception as status_err:
-                # Best-effort: log but don't fail if MongoDB update fails
-                logger.warning(
-                    f"MongoDB status update failed for {integration_id}: {status_err}"
-                )
+            if not already_connected:
+                await self._mark_connected(integration_id)
 
             return tools
 
@@ -339,6 +363,107 @@ class MCPClient:
             # PostgreSQL mcp_credentials only stores auth tokens
             raise
 
+    async def _mark_connected(self, integration_id: str) -> None:
+        """Update user integration status to connected."""
+        try:
+            await update_user_integration_status(
+                self.user_id, integration_id, "connected"
+            )
+        except Exception as status_err:
+            # Best-effort: log but don't fail if MongoDB update fails
+            logger.warning(
+                f"MongoDB status update failed for {integration_id}: {status_err}"
+            )
+
+    async def _refresh_schema_cache(
+        self, integration_id: str, server_url: str, tools: list[BaseTool]
+    ) -> bool:
+        """
+        Update the cached tool schemas after a live connect.
+
+        Returns True if the schemas changed (or can't be compared), meaning
+        tool metadata should be rewritten.
+        """
+        schemas = serialize_tool_schemas(tools)
+        if schemas is None:
+            return True
+
+        schema_hash = compute_schema_hash(schemas)
+        cached = await get_cached_tool_schemas(integration_id, server_url)
+        if cached and cached["hash"] == schema_hash:
+            return False
+
+        await set_cached_tool_schemas(integration_id, server_url, schema_hash, schemas)
+        return True
+
+    def _build_lazy_tools(
+        self, integration_id: str, schemas: list[dict]
+    ) -> list[BaseTool]:
+        """Build tools from cached schemas that open the MCP session on first call."""
+        tools: list[BaseTool] = []
+        for schema in schemas:
+            tool_name = schema["name"]
+
+            async def _call(_tool_name: str = tool_name, **kwargs) -> object:
+                return await self._invoke_live_tool(integration_id, _tool_name, kwargs)
+
+            tools.append(
+                StructuredTool.from_function(
+                    coroutine=_call,
+                    name=tool_name,
+                    description=schema.get("description") or "",
+                    args_schema=schema["args_schema"],
+                )
+            )
+        return tools
+
+    async def _invoke_live_tool(
+        self, integration_id: str, tool_name: str, kwargs: dict
+    ) -> object:
+        """Run a tool call on the live session, connecting first if needed."""
+        if integration_id not in self._clients:
+            lock = self._connect_locks.setdefault(integration_id, asyncio.Lock())
+            async with lock:
+                if integration_id not in self._clients:
+                    await asyncio.wait_for(
+                        self.connect(integration_id, already_connected=True),
+                        timeout=MCP_CONNECT_TIMEOUT_SECONDS,
+                    )
+
+        live_tool = self._live_tools.get(integration_id, {}).get(tool_name)
+        if live_tool is None:
+            return f"MCP tool error: '{tool_name}' is no longer provided by the server"
+        return await live_tool.ainvoke(kwargs)
+
+    async def _load_connected_tools(self, integration_id: str) -> list[BaseTool]:
+        """Return tools for a connected integration, preferring cached schemas."""
+        # Already loaded in memory (live or lazy)
+        if integration_id in self._tools:
+            return self._tools[integration_id]
+
+        resolved = await IntegrationResolver.resolve(integration_id)
+        if resolved and resolved.mcp_config:
+            cached = await get_cached_tool_schemas(
+                integration_id, resolved.mcp_config.server_url
+            )
+            if cached:
+                try:
+                    tools = self._build_lazy_tools(integration_id, cached["tools"])
+                    self._tools[integration_id] = tools
+                    return tools
+                except Exception as e:
+                    logger.warning(
+                        f"[{integration_id}] Cached tool schemas unusable, reconnecting: {e}"
+                    )
+
+        # Connect to get real tools with proper schemas
+        # This is required because stubs without args_schema cause LLM
+        # to use wrong parameter names (e.g., "name" instead of "query")
+        return await asyncio.wait_for(
+            self.connect(integration_id, already_connected=True),
+            timeout=MCP_CONNECT_TIMEOUT_SECONDS,
+        )
+
     async def _handle_custom_integration_connect(
         self,
         integration_id: str,
@@ -762,6 +887,7 @@ class MCPClient:
 
         if integration_id in self._tools:
             del self._tools[integration_id]
+        self._live_tools.pop(integration_id, None)
 
         # Clear OAuth discovery cache
         try:
@@ -848,8 +974,10 @@ class MCPClient:
         """
         Get tools from all connected MCP integrations for this user.
 
-        Always connects to get real tools with proper schemas.
-        Cached tools are returned from memory if already connected.
+        Integrations are loaded concurrently, each bounded by a connect
+        timeout. Tools already in memory are returned as-is; otherwise tools
+        are built from the cross-process schema cache (session opened on first
+        call), falling back to a live connect on a cache miss.
 
         Data Source:
         - MongoDB user_integrations (single source of truth for connection status)
@@ -868,24 +996,22 @@ class MCPClient:
         except Exception as e:
             logger.warning(f"Failed to get connected MCPs from user_integrations: {e}")
 
-        all_tools: dict[str, list[BaseTool]] = {}
-
-        for integration_id in connected_ids:
-            try:
-                # Check if already connected in memory (live tools with schemas)
-                if integration_id in self._tools:
-                    all_tools[integration_id] = self._tools[integration_id]
-                    continue
-
-                # Connect to get real tools with proper schemas
-                # This is required because stubs without args_schema cause LLM
-                # to use wrong parameter names (e.g., "name" instead of "query")
-                tools = await self.connect(integration_id)
-                if tools:
-                    all_tools[integration_id] = tools
+        results = await asyncio.gather(
+            *(
+                self._load_connected_tools(integration_id)
+                for integration_id in connected_ids
+            ),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.warning(f"Failed to get tools for MCP {integration_id}: {e}")
+        all_tools: dict[str, list[BaseTool]] = {}
+        for integration_id, result in zip(connected_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Failed to get tools for MCP {integration_id}: {result!r}"
+                )
+            elif result:
+                all_tools[integration_id] = result
 
         return all_tools
 
@@ -1,17 +1,22 @@
 """
-MCP Client Pool - Thread-safe pool for per-user MCPClient instances.
+MCP Client Pool - Per-user MCPClient instances shared across requests.
 
 Uses LRU eviction and TTL-based cleanup to manage memory.
 Integrated with lazy_provider for proper lifecycle management.
+
+Pool bookkeeping never awaits, so lookups, inserts and evictions are atomic on
+the event loop and need no lock. Evicted clients are detached synchronously and
+their MCP sessions are closed in background tasks, so a slow session teardown
+never delays another user's lookup.
 """
 
 from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from app.config.loggers import langchain_logger as logger
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
@@ -32,14 +37,26 @@ class PooledClient:
         self.last_used = datetime.now(timezone.utc)
 
 
+@dataclass
+class MCPClientPoolMetrics:
+    """Process-local pool counters."""
+
+    hits: int = 0
+    misses: int = 0
+    lru_evictions: int = 0
+    stale_evictions: int = 0
+    close_failures: int = 0
+
+
 class MCPClientPool:
     """
-    Thread-safe MCP client pool with LRU eviction.
+    MCP client pool with LRU eviction.
 
     Features:
     - Reuses MCPClient instances for the same user across requests
     - LRU eviction when pool reaches max capacity
     - Background cleanup of stale clients (not used within TTL)
+    - Session teardown off the lookup path
     - Graceful shutdown of all connections
     """
 
@@ -51,59 +68,70 @@ class MCPClientPool:
         self._clients: OrderedDict[str, PooledClient] = OrderedDict()
         self._max_clients = max_clients
         self._ttl = timedelta(seconds=ttl_seconds)
-        self._lock = asyncio.Lock()
         self._cleanup_task: asyncio.Task | None = None
+        self._close_tasks: set[asyncio.Task] = set()
+        self.metrics = MCPClientPoolMetrics()
 
     async def get(self, user_id: str) -> "MCPClient":
         """Get or create MCPClient for user."""
-        async with self._lock:
-            if user_id in self._clients:
-                pooled = self._clients[user_id]
-                pooled.touch()
-                # Move to end (most recently used)
-                self._clients.move_to_end(user_id)
-                logger.debug(f"Reusing pooled MCPClient for {user_id}")
-                return pooled.client
-
-            # Evict oldest if at capacity
-            if len(self._clients) >= self._max_clients:
-                oldest_key = next(iter(self._clients))
-                await self._evict(oldest_key)
-
-            # Create new client (local import to avoid circular dependency)
-            from app.services.mcp.mcp_client import MCPClient
-
-            client = MCPClient(user_id=user_id)
-            self._clients[user_id] = PooledClient(client=client)
-            logger.debug(f"Created new pooled MCPClient for {user_id}")
-            return client
-
-    async def _evict(self, user_id: str):
-        """Evict a client from the pool and close its connections."""
-        if user_id not in self._clients:
+        # No awaits below: the lookup and insert are atomic on the event loop
+        pooled = self._clients.get(user_id)
+        if pooled is not None:
+            pooled.touch()
+            # Move to end (most recently used)
+            self._clients.move_to_end(user_id)
+            self.metrics.hits += 1
+            logger.debug(f"Reusing pooled MCPClient for {user_id}")
+            return pooled.client
+
+        self.metrics.misses += 1
+
+        # Evict oldest if at capacity
+        while len(self._clients) >= self._max_clients:
+            oldest_key = next(iter(self._clients))
+            self._evict(oldest_key)
+            self.metrics.lru_evictions += 1
+
+        # Create new client (local import to avoid circular dependency)
+        from app.services.mcp.mcp_client import MCPClient
+
+        client = MCPClient(user_id=user_id)
+        self._clients[user_id] = PooledClient(client=client)
+        logger.debug(f"Created new pooled MCPClient for {user_id}")
+        return client
+
+    def _evict(self, user_id: str) -> None:
+        """Detach a client from the pool and close its connections in the background."""
+        pooled = self._clients.pop(user_id, None)
+        if pooled is None:
             return
 
-        pooled = self._clients.pop(user_id)
-        # Close all active MCP sessions using public method
+        task = asyncio.create_task(self._close_client(user_id, pooled.client))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+        logger.debug(f"Evicted MCPClient for {user_id}")
+
+    async def _close_client(self, user_id: str, client: "MCPClient") -> None:
+        """Close all active MCP sessions of a detached client."""
         try:
-            await pooled.client.close_all_client_sessions()
+            await client.close_all_client_sessions()
         except Exception as e:
+            self.metrics.close_failures += 1
             logger.warning(f"Error closing MCP sessions for user {user_id}: {e}")
-        logger.debug(f"Evicted MCPClient for {user_id}")
 
     async def cleanup_stale(self):
         """Remove clients that haven't been used within TTL."""
-        async with self._lock:
-            now = datetime.now(timezone.utc)
-            stale = [
-                uid
-                for uid, pooled in self._clients.items()
-                if now - pooled.last_used > self._ttl
-            ]
-            for user_id in stale:
-                await self._evict(user_id)
-            if stale:
-                logger.info(f"Cleaned up {len(stale)} stale MCP clients")
+        now = datetime.now(timezone.utc)
+        stale = [
+            uid
+            for uid, pooled in self._clients.items()
+            if now - pooled.last_used > self._ttl
+        ]
+        for user_id in stale:
+            self._evict(user_id)
+        if stale:
+            self.metrics.stale_evictions += len(stale)
+            logger.info(f"Cleaned up {len(stale)} stale MCP clients")
 
     async def start_cleanup_loop(self, interval: int = 60):
         """Start background cleanup task."""
@@ -132,11 +160,14 @@ class MCPClientPool:
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
-                raise
+                pass
 
-        async with self._lock:
-            for user_id in list(self._clients.keys()):
-                await self._evict(user_id)
+        for user_id in list(self._clients.keys()):
+            self._evict(user_id)
+
+        # Wait for all background session closes, including earlier evictions
+        if self._close_tasks:
+            await asyncio.gather(*self._close_tasks, return_exceptions=True)
 
         logger.info("MCPClientPool shutdown complete")
 
@@ -145,6 +176,17 @@ class MCPClientPool:
         """Current number of pooled clients."""
         return len(self._clients)
 
+    def get_metrics(self) -> dict[str, Any]:
+        """Snapshot of pool counters and current occupancy."""
+        lookups = self.metrics.hits + self.metrics.misses
+        return {
+            **asdict(self.metrics),
+            "size": len(self._clients),
+            "max_clients": self._max_clients,
+            "pending_closes": len(self._close_tasks),
+            "hit_rate": self.metrics.hits / lookups if lookups else 0.0,
+        }
+
 
 @lazy_provider(
     name="mcp_client_pool",
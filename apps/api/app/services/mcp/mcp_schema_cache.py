@@ -0,0 +1,87 @@
+"""
+Cross-process cache of MCP tool schemas.
+
+Tool schemas discovered over a live MCP session are cached in Redis per
+integration and server URL, together with a hash of the schema set. This lets
+an agent bind an integration's tools before any session exists (the session
+is opened lazily on the first tool call), and lets ``MCPClient.connect`` skip
+tool metadata writes when the hash is unchanged.
+
+Server URLs are hashed in the key since some embed user-specific parameters.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from app.config.loggers import langchain_logger as logger
+from app.constants.cache import (
+    MCP_TOOL_SCHEMA_CACHE_PREFIX,
+    MCP_TOOL_SCHEMA_CACHE_TTL,
+)
+from app.db.redis import get_cache, set_cache
+from app.utils.mcp_utils import serialize_args_schema
+from langchain_core.tools import BaseTool
+
+
+def _cache_key(integration_id: str, server_url: str) -> str:
+    url_hash = hashlib.sha256(server_url.encode()).hexdigest()[:32]
+    return f"{MCP_TOOL_SCHEMA_CACHE_PREFIX}:{integration_id}:{url_hash}"
+
+
+def serialize_tool_schemas(tools: list[BaseTool]) -> Optional[list[dict]]:
+    """
+    Serialize tools to cacheable schema dicts.
+
+    Returns None if any tool's args schema can't be serialized, since a lazy
+    tool with a missing schema would make the LLM guess argument names.
+    """
+    schemas = []
+    for tool in tools:
+        args_schema = serialize_args_schema(tool)
+        if args_schema is None and getattr(tool, "args_schema", None) is not None:
+            return None
+        schemas.append(
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "args_schema": args_schema or {"type": "object", "properties": {}},
+            }
+        )
+    return schemas
+
+
+def compute_schema_hash(schemas: list[dict]) -> str:
+    """Stable hash of a tool schema set."""
+    canonical = json.dumps(schemas, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def get_cached_tool_schemas(
+    integration_id: str, server_url: str
+) -> Optional[dict]:
+    """Return ``{"hash": str, "tools": list[dict]}`` or None on a miss."""
+    try:
+        cached = await get_cache(_cache_key(integration_id, server_url))
+        if cached and cached.get("hash") and cached.get("tools"):
+            return cached
+    except Exception as e:
+        logger.warning(f"[{integration_id}] Failed to read cached tool schemas: {e}")
+    return None
+
+
+async def set_cached_tool_schemas(
+    integration_id: str, server_url: str, schema_hash: str, schemas: list[dict]
+) -> None:
+    """Persist the tool schema set for an integration."""
+    if not schemas:
+        return
+
+    try:
+        await set_cache(
+            _cache_key(integration_id, server_url),
+            {"hash": schema_hash, "tools": schemas},
+            ttl=MCP_TOOL_SCHEMA_CACHE_TTL,
+        )
+    except Exception as e:
+        logger.warning(f"[{integration_id}] Failed to cache tool schemas: {e}")
@@ -0,0 +1,290 @@
+"""
+Write-behind buffering for per-turn memories.
+
+Storing every chat message with its own ``store_memory`` call costs a Mem0
+round-trip and an extraction pass per fragment. ``MemoryWriteBuffer`` instead
+appends messages to a Redis list per (user, conversation) and flushes each
+list as a single ``store_memory_batch`` call when it is full, when it gets
+old, or when the user moves on to another conversation.
+
+Keys:
+    memory_buffer:{user_id}:{conversation_id}           queued messages
+    memory_buffer:{user_id}:{conversation_id}:inflight  messages being flushed
+    memory_buffer:lease:{user_id}:{conversation_id}     flush lease
+    memory_buffer:attempts:{user_id}:{conversation_id}  consecutive failures
+    memory_buffer:active:{user_id}                      user's latest conversation
+    memory_buffer:due                                   zset of buffer -> due time
+
+A flush renames the queue to its inflight list and removes messages from
+that list only after Mem0 accepted them, so messages survive a crash at any
+point and are picked up again by ``sweep`` (delivery is at-least-once). The
+ARQ worker runs ``sweep`` every minute for age-based and retried flushes.
+"""
+
+import asyncio
+import json
+import time
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from app.config.loggers import llm_logger as logger
+from app.constants.memory import (
+    MEMORY_BUFFER_FLUSH_TIMEOUT,
+    MEMORY_BUFFER_LEASE_TTL,
+    MEMORY_BUFFER_MAX_AGE,
+    MEMORY_BUFFER_MAX_ATTEMPTS,
+    MEMORY_BUFFER_MAX_BACKLOG,
+    MEMORY_BUFFER_MAX_BATCH,
+    MEMORY_BUFFER_MAX_CONCURRENT_FLUSHES,
+    MEMORY_BUFFER_MAX_MESSAGES,
+    MEMORY_BUFFER_RETRY_DELAY,
+    MEMORY_BUFFER_SWEEP_LIMIT,
+)
+from app.db.redis import redis_cache
+from app.services.memory_service import memory_service
+
+MEMORY_BUFFER_PREFIX = "memory_buffer"
+DUE_KEY = f"{MEMORY_BUFFER_PREFIX}:due"
+
+
+def _member(user_id: str, conversation_id: str) -> str:
+    return f"{user_id}:{conversation_id}"
+
+
+class MemoryWriteBuffer:
+    """Durable per-conversation buffer in front of ``store_memory_batch``."""
+
+    def __init__(self, redis: Any = None) -> None:
+        # Resolved lazily so tests can pass their own client
+        self._redis = redis
+        self._flush_slots = asyncio.Semaphore(MEMORY_BUFFER_MAX_CONCURRENT_FLUSHES)
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def redis(self) -> Any:
+        return self._redis if self._redis is not None else redis_cache.redis
+
+    async def append(
+        self,
+        user_id: str,
+        message: str,
+        conversation_id: str,
+    ) -> bool:
+        """
+        Queue a user message for storage in memory.
+
+        Falls back to storing it right away when Redis is unavailable.
+
+        Returns:
+            True if the message was queued or stored
+        """
+        if not self.redis:
+            entry = await memory_service.store_memory(
+                message=message,
+                user_id=user_id,
+                conversation_id=conversation_id,
+                metadata={
+                    "conversation_id": conversation_id,
+                    "type": "user_message",
+                },
+                async_mode=True,
+            )
+            return entry is not None
+
+        member = _member(user_id, conversation_id)
+        key = f"{MEMORY_BUFFER_PREFIX}:{member}"
+        item = json.dumps(
+            {
+                "message": message,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+        try:
+            size = await self.redis.rpush(key, item)
+            await self.redis.zadd(
+                DUE_KEY, {member: time.time() + MEMORY_BUFFER_MAX_AGE}, nx=True
+            )
+            if size > MEMORY_BUFFER_MAX_BACKLOG:
+                await self.redis.ltrim(key, -MEMORY_BUFFER_MAX_BACKLOG, -1)
+                logger.warning(
+                    f"Memory buffer for user {user_id} exceeded "
+                    f"{MEMORY_BUFFER_MAX_BACKLOG} messages, dropping the oldest"
+                )
+
+            previous = await self.redis.set(
+                f"{MEMORY_BUFFER_PREFIX}:active:{user_id}",
+                conversation_id,
+                ex=MEMORY_BUFFER_MAX_AGE,
+                get=True,
+            )
+        except Exception as e:
+            logger.error(f"Error buffering memory for user {user_id}: {e}")
+            return False
+
+        # The user moved on: treat their previous conversation as ended
+        if previous and previous != conversation_id:
+            self._spawn(user_id, previous)
+
+        # When every flush slot is busy the backend is slow; let the buffer
+        # grow and go out later as a bigger batch instead of queueing more calls
+        if size >= MEMORY_BUFFER_MAX_MESSAGES and not self._flush_slots.locked():
+            self._spawn(user_id, conversation_id)
+        return True
+
+    def _spawn(self, user_id: str, conversation_id: str) -> None:
+        task = asyncio.create_task(self.flush(user_id, conversation_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self, user_id: str, conversation_id: str) -> int:
+        """
+        Store a conversation's buffered messages in memory.
+
+        Does nothing if another flush of the same buffer holds its lease. On
+        failure the messages stay in Redis and the buffer is due again after
+        MEMORY_BUFFER_RETRY_DELAY.
+
+        Returns:
+            Number of messages stored
+        """
+        member = _member(user_id, conversation_id)
+        lease_key = f"{MEMORY_BUFFER_PREFIX}:lease:{member}"
+
+        async with self._flush_slots:
+            try:
+                if not await self.redis.set(
+                    lease_key, "1", nx=True, ex=MEMORY_BUFFER_LEASE_TTL
+                ):
+                    return 0
+            except Exception as e:
+                logger.error(f"Error flushing memory buffer for user {user_id}: {e}")
+                return 0
+
+            try:
+                # Bounded well below the lease TTL, so releasing the lease
+                # with a plain DEL can't remove another process's lease
+                return await asyncio.wait_for(
+                    self._drain(user_id, conversation_id),
+                    timeout=MEMORY_BUFFER_FLUSH_TIMEOUT,
+                )
+            except Exception as e:
+                logger.error(f"Error flushing memory buffer for user {user_id}: {e}")
+                with suppress(Exception):
+                    await self.redis.zadd(
+                        DUE_KEY, {member: time.time() + MEMORY_BUFFER_RETRY_DELAY}
+                    )
+                return 0
+            finally:
+                with suppress(Exception):
+                    await self.redis.delete(lease_key)
+
+    async def _drain(self, user_id: str, conversation_id: str) -> int:
+        member = _member(user_id, conversation_id)
+        key = f"{MEMORY_BUFFER_PREFIX}:{member}"
+        inflight_key = f"{key}:inflight"
+        attempts_key = f"{MEMORY_BUFFER_PREFIX}:attempts:{member}"
+
+        # A leftover inflight list is from a flush that crashed or failed;
+        # finish it first, then claim the messages queued since
+        claimed = False
+        stored = 0
+        while True:
+            raw_items = await self.redis.lrange(
+                inflight_key, 0, MEMORY_BUFFER_MAX_BATCH - 1
+            )
+            if not raw_items:
+                if claimed or not await self.redis.exists(key):
+                    break
+                await self.redis.rename(key, inflight_key)
+                claimed = True
+                continue
+
+            items = [json.loads(raw) for raw in raw_items]
+            if await self._store(user_id, conversation_id, items):
+                await self.redis.delete(attempts_key)
+                stored += len(items)
+            else:
+                attempts = await self.redis.incr(attempts_key)
+                if attempts < MEMORY_BUFFER_MAX_ATTEMPTS:
+                    raise RuntimeError(
+                        f"Mem0 rejected a batch of {len(items)} messages "
+                        f"(attempt {attempts})"
+                    )
+                logger.error(
+                    f"Dropping {len(items)} buffered memories for user {user_id} "
+                    f"after {attempts} failed attempts"
+                )
+                await self.redis.delete(attempts_key)
+
+            await self.redis.ltrim(inflight_key, len(raw_items), -1)
+
+        # Remove the buffer from the due set, then put it back if messages
+        # arrived meanwhile (an append between the two re-adds it itself)
+        await self.redis.zrem(DUE_KEY, member)
+        if await self.redis.exists(key):
+            await self.redis.zadd(
+                DUE_KEY, {member: time.time() + MEMORY_BUFFER_MAX_AGE}, nx=True
+            )
+
+        if stored:
+            logger.info(
+                f"Flushed {stored} buffered memories for user {user_id} "
+                f"(conversation {conversation_id})"
+            )
+        return stored
+
+    async def _store(
+        self, user_id: str, conversation_id: str, items: List[Dict[str, Any]]
+    ) -> bool:
+        metadata = {
+            "conversation_id": conversation_id,
+            "type": "user_message",
+            "batch_size": len(items),
+            "first_message_at": items[0]["timestamp"],
+            "last_message_at": items[-1]["timestamp"],
+        }
+        return await memory_service.store_memory_batch(
+            messages=[{"role": "user", "content": item["message"]} for item in items],
+            user_id=user_id,
+            conversation_id=conversation_id,
+            metadata=metadata,
+            async_mode=True,
+        )
+
+    async def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Flush every buffer that is due: old enough, or waiting for a retry.
+
+        Returns:
+            Number of messages stored
+        """
+        if not self.redis:
+            return 0
+
+        members = await self.redis.zrangebyscore(
+            DUE_KEY,
+            "-inf",
+            now if now is not None else time.time(),
+            start=0,
+            num=MEMORY_BUFFER_SWEEP_LIMIT,
+        )
+        results = await asyncio.gather(
+            *(self.flush(*member.split(":", 1)) for member in members)
+        )
+        return sum(results)
+
+    async def close(self) -> None:
+        """Wait for flushes started by this process; unflushed messages stay queued."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+# Create singleton instance
+memory_write_buffer = MemoryWriteBuffer()
+
+
+async def close_memory_write_buffer() -> None:
+    """Let in-flight buffer flushes finish before shutdown."""
+    await memory_write_buffer.close()
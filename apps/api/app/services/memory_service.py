@@ -1,18 +1,29 @@
 """Memory service layer for handling all memory operations with latest Mem0 API."""
 
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from app.agents.memory.client import memory_client_manager
 from app.config.loggers import llm_logger as logger
+from app.constants.cache import MEMORY_SEARCH_CACHE_MAX_SIZE, MEMORY_SEARCH_CACHE_TTL
 from app.utils.general_utils import describe_structure
+from app.utils.request_coalescing import coalesce_request
 from app.models.memory_models import (
     MemoryEntry,
     MemoryRelation,
     MemorySearchResult,
 )
 
+# (user_id, generation, normalized query, limit, threshold)
+SearchCacheKey = Tuple[str, int, str, int, Optional[float]]
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query so trivially different phrasings share a cache entry."""
+    return " ".join(query.lower().split()).strip(" .?!")
+
 
 class MemoryService:
     """Service class for managing memory operations."""
@@ -20,6 +31,18 @@ class MemoryService:
     def __init__(self):
         """Initialize the memory service."""
         self.logger = logger
+        # Short-lived search results keyed by SearchCacheKey -> (monotonic
+        # expiry, result). A write bumps the user's generation, so entries
+        # cached before it are never read again.
+        self._search_cache: OrderedDict[
+            SearchCacheKey, Tuple[float, MemorySearchResult]
+        ] = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def _invalidate_searches(self, user_id: Optional[str]) -> None:
+        """Make cached and in-flight searches for a user stale after a write."""
+        if user_id:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
 
     async def _get_client(self):
         """Get the configured async memory client."""
@@ -402,13 +425,16 @@ class MemoryService:
 
             # Use v2 API to add memory
             # Messages format allows Mem0 to infer structured memories
-            result = await client.add(
-                messages=[{"role": "user", "content": message}],
-                user_id=user_id,
-                metadata=metadata,
-                run_id=conversation_id,
-                async_mode=async_mode,
-            )
+            try:
+                result = await client.add(
+                    messages=[{"role": "user", "content": message}],
+                    user_id=user_id,
+                    metadata=metadata,
+                    run_id=conversation_id,
+                    async_mode=async_mode,
+                )
+            finally:
+                self._invalidate_searches(user_id)
 
             mode_str = "async" if async_mode else "sync"
             self.logger.info(f"Memory stored for user {user_id} (mode: {mode_str})")
@@ -526,7 +552,10 @@ class MemoryService:
                 add_kwargs["custom_instructions"] = custom_instructions
 
             # Use v2 API to add multiple memories in one call
-            result = await client.add(**add_kwargs)
+            try:
+                result = await client.add(**add_kwargs)
+            finally:
+                self._invalidate_searches(user_id)
 
             # Build namespace description for logging
             namespace_desc = []
@@ -611,6 +640,10 @@ class MemoryService:
         """
         Search for relevant memories using Mem0 v2 API with semantic search.
 
+        Results are cached per user and normalized query for a few seconds,
+        and concurrent identical searches share one remote call. Writes from
+        this process invalidate the user's cached searches.
+
         Args:
             query: Search query
             user_id: User identifier
@@ -624,6 +657,50 @@ class MemoryService:
         if not user_id:
             return MemorySearchResult()
 
+        generation = self._generations.get(user_id, 0)
+        cache_key: SearchCacheKey = (
+            user_id,
+            generation,
+            _normalize_query(query),
+            limit,
+            threshold,
+        )
+
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if expires_at > time.monotonic():
+                self._search_cache.move_to_end(cache_key)
+                return cached_result
+            del self._search_cache[cache_key]
+
+        result = await coalesce_request(
+            f"memory_search:{cache_key!r}",
+            lambda: self._search_remote(query, user_id, limit, threshold),
+        )
+        if result is None:
+            return MemorySearchResult()
+
+        # Don't cache a result that a write has already made stale
+        if self._generations.get(user_id, 0) == generation:
+            self._search_cache[cache_key] = (
+                time.monotonic() + MEMORY_SEARCH_CACHE_TTL,
+                result,
+            )
+            self._search_cache.move_to_end(cache_key)
+            while len(self._search_cache) > MEMORY_SEARCH_CACHE_MAX_SIZE:
+                self._search_cache.popitem(last=False)
+
+        return result
+
+    async def _search_remote(
+        self,
+        query: str,
+        user_id: str,
+        limit: int,
+        threshold: Optional[float],
+    ) -> Optional[MemorySearchResult]:
+        """Run a Mem0 search; returns None on failure so it isn't cached."""
         try:
             client = await self._get_client()
 
@@ -671,7 +748,7 @@ class MemoryService:
 
         except Exception as e:
             self.logger.error(f"Error searching memories for user {user_id}: {e}")
-            return MemorySearchResult()
+            return None
 
     async def get_all_memories(
         self,
@@ -769,7 +846,10 @@ class MemoryService:
             client = await self._get_client()
 
             # v2 API delete by memory_id
-            result = await client.delete(memory_id=memory_id)
+            try:
+                result = await client.delete(memory_id=memory_id)
+            finally:
+                self._invalidate_searches(user_id)
 
             self.logger.info(f"Memory {memory_id} deleted for user {user_id}: {result}")
             return True
@@ -798,7 +878,10 @@ class MemoryService:
             client = await self._get_client()
 
             # v2 API delete_all with user filter
-            result = await client.delete_all(user_id=user_id)
+            try:
+                result = await client.delete_all(user_id=user_id)
+            finally:
+                self._invalidate_searches(user_id)
 
             self.logger.info(f"All memories deleted for user {user_id}: {result}")
             return True
@@ -56,6 +56,7 @@ class NotificationService:
         channel_type: Optional[str] = None,
         notification_type: Optional[NotificationType] = None,
         source: Optional[NotificationSourceEnum] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         return await self.orchestrator.get_user_notifications(
             user_id,
@@ -65,6 +66,7 @@ class NotificationService:
             channel_type,
             notification_type,
             source,
+            cursor,
         )
 
     async def get_notification(
@@ -87,6 +89,10 @@ class NotificationService:
             user_id, status, channel_type
         )
 
+    async def reconcile_notification_counts(self, user_id: str) -> Dict[str, int]:
+        """Rebuild the cached per-status notification counters for a user"""
+        return await self.orchestrator.storage.reconcile_notification_counts(user_id)
+
     async def bulk_actions(
         self, notification_ids: List[str], user_id: str, action: BulkActions
     ) -> Dict[str, bool]:
@@ -67,7 +67,7 @@ async def fetch_provider_user_info(
         composio_service = get_composio_service()
 
         # Get the tool without hooks (we just need the data)
-        tool = composio_service.get_tool(
+        tool = await composio_service.aget_tool(
             tool_name=tool_name,
             use_before_hook=False,
             use_after_hook=False,
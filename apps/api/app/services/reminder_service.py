@@ -22,6 +22,7 @@ from app.services.scheduler_service import BaseSchedulerService
 from app.utils.cron_utils import get_next_run_time
 from arq.connections import RedisSettings
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 
 class ReminderScheduler(BaseSchedulerService):
@@ -192,6 +193,23 @@ class ReminderScheduler(BaseSchedulerService):
             return ReminderModel(**doc)
         return None
 
+    async def claim_task(self, task_id: str) -> Optional[BaseScheduledTask]:
+        """Atomically mark a scheduled reminder as executing."""
+        doc = await reminders_collection.find_one_and_update(
+            {"_id": ObjectId(task_id), "status": ReminderStatus.SCHEDULED},
+            {
+                "$set": {
+                    "status": ReminderStatus.EXECUTING,
+                    "updated_at": datetime.now(timezone.utc),
+                }
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc:
+            doc["_id"] = str(doc["_id"])
+            return ReminderModel(**doc)
+        return None
+
     async def execute_task(self, task: BaseScheduledTask) -> TaskExecutionResult:
         """Execute a reminder task."""
         try:
@@ -237,10 +255,16 @@ class ReminderScheduler(BaseSchedulerService):
 
         return result.modified_count > 0
 
-    async def get_pending_task(self, current_time: datetime) -> List[BaseScheduledTask]:
+    async def get_pending_task(
+        self, current_time: datetime, window_end: Optional[datetime] = None
+    ) -> List[BaseScheduledTask]:
         """Get all scheduled reminders that should be enqueued."""
+        scheduled_at_filter: Dict[str, Any] = {"$gte": current_time}
+        if window_end:
+            scheduled_at_filter["$lte"] = window_end
+
         cursor = reminders_collection.find(
-            {"status": ReminderStatus.SCHEDULED, "scheduled_at": {"$gte": current_time}}
+            {"status": ReminderStatus.SCHEDULED, "scheduled_at": scheduled_at_filter}
         )
 
         tasks: List[BaseScheduledTask] = []
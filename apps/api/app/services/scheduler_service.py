@@ -1,13 +1,26 @@
 """
 Base scheduler service for managing scheduled tasks.
+
+Tasks live in MongoDB and only those due within ``SCHEDULER_LOOKAHEAD_WINDOW``
+are enqueued in ARQ, so the queue stays small regardless of how many tasks are
+scheduled far ahead. Every enqueue uses a job ID derived from the task and its
+due time, which makes the startup scan, the periodic scan and (re)scheduling
+safe to overlap across replicas. Execution starts with an atomic claim, so a
+task runs at most once even if duplicate jobs slip through.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from app.config.loggers import general_logger as logger
 from app.config.settings import settings
+from app.constants.scheduler import (
+    SCHEDULER_EARLY_EXECUTION_TOLERANCE,
+    SCHEDULER_ENQUEUE_BATCH_SIZE,
+    SCHEDULER_LOOKAHEAD_WINDOW,
+)
 from app.models.scheduler_models import (
     BaseScheduledTask,
     ScheduleConfig,
@@ -19,6 +32,13 @@ from arq import create_pool
 from arq.connections import RedisSettings
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so they compare with aware ones."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 class BaseSchedulerService(ABC):
     """
     Base scheduler service that handles all scheduling-related functionality.
@@ -101,7 +121,7 @@ class BaseSchedulerService(ABC):
         Process a scheduled task execution.
 
         This method handles the complete task execution lifecycle:
-        1. Get and validate the task
+        1. Atomically claim the task (SCHEDULED -> EXECUTING)
         2. Execute the task
         3. Handle recurring logic
         4. Update task status
@@ -112,48 +132,18 @@ class BaseSchedulerService(ABC):
         Returns:
             Task execution result
         """
-        # Get the task
-        task = await self.get_task(task_id)
+        task = await self.claim_due_task(task_id)
         if not task:
-            logger.error(f"Task {task_id} not found")
             return TaskExecutionResult(
-                success=False, message=f"Task {task_id} not found"
-            )
-
-        if task.status != ScheduledTaskStatus.SCHEDULED:
-            logger.warning(f"Task {task_id} is not scheduled (status: {task.status})")
-            return TaskExecutionResult(
-                success=False, message=f"Task {task_id} is not in scheduled status"
+                success=False, message=f"Task {task_id} is not due for execution"
             )
 
         logger.info(f"Processing task {task_id}")
 
         try:
-            # Mark task as executing
-            await self.update_task_status(
-                task_id,
-                ScheduledTaskStatus.EXECUTING,
-                {"updated_at": datetime.now(timezone.utc)},
-            )
-
             # Execute the task
             execution_result = await self.execute_task(task)
-
-            # Increment occurrence count
-            occurrence_count = task.occurrence_count + 1
-
-            # Handle recurring tasks
-            if task.repeat:
-                await self._handle_recurring_task(task, occurrence_count)
-            else:
-                # One-time task - mark as completed
-                await self.update_task_status(
-                    task_id,
-                    ScheduledTaskStatus.COMPLETED,
-                    {"occurrence_count": occurrence_count},
-                )
-                logger.info(f"Completed one-time task {task_id}")
-
+            await self.complete_task_occurrence(task)
             return execution_result
 
         except Exception as e:
@@ -167,6 +157,64 @@ class BaseSchedulerService(ABC):
                 success=False, message=f"Task execution failed: {str(e)}"
             )
 
+    async def claim_due_task(self, task_id: str) -> Optional[BaseScheduledTask]:
+        """
+        Claim a task for the job that fired for it.
+
+        Only one job can move a task out of SCHEDULED, so duplicate jobs for the
+        same occurrence don't run it twice.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            The claimed task, or None if it doesn't exist, was already claimed
+            or has been rescheduled to a later time
+        """
+        task = await self.claim_task(task_id)
+        if not task:
+            if not await self.get_task(task_id):
+                logger.error(f"Task {task_id} not found")
+            else:
+                logger.warning(
+                    f"Task {task_id} is not scheduled or was already claimed"
+                )
+            return None
+
+        # A job enqueued before a reschedule fires at the old time; hand the
+        # task back so the job for the new time can claim it
+        scheduled_at = _as_utc(task.scheduled_at)
+        now = datetime.now(timezone.utc)
+        if scheduled_at > now + SCHEDULER_EARLY_EXECUTION_TOLERANCE:
+            await self.update_task_status(task_id, ScheduledTaskStatus.SCHEDULED)
+            logger.info(
+                f"Skipping stale job for task {task_id}, now due at {scheduled_at}"
+            )
+            return None
+
+        return task
+
+    async def complete_task_occurrence(self, task: BaseScheduledTask) -> None:
+        """
+        Schedule a claimed task's next occurrence, or mark it completed.
+
+        Args:
+            task: Task claimed with claim_due_task
+        """
+        occurrence_count = task.occurrence_count + 1
+
+        # Handle recurring tasks
+        if task.repeat:
+            await self._handle_recurring_task(task, occurrence_count)
+        elif task.id:
+            # One-time task - mark as completed
+            await self.update_task_status(
+                task.id,
+                ScheduledTaskStatus.COMPLETED,
+                {"occurrence_count": occurrence_count},
+            )
+            logger.info(f"Completed one-time task {task.id}")
+
     async def cancel_task(self, task_id: str, user_id: str) -> bool:
         """
         Cancel a scheduled task.
@@ -194,21 +242,44 @@ class BaseSchedulerService(ABC):
 
         return success
 
-    async def scan_and_schedule_pending_tasks(self):
+    async def scan_and_schedule_pending_tasks(self) -> int:
         """
-        Scan for scheduled tasks and enqueue them in ARQ.
-        Called during service startup.
+        Enqueue every scheduled task due within the lookahead window.
+
+        Called during service startup and periodically by the ARQ worker.
+        Tasks already in the queue are skipped by their job ID, so overlapping
+        scans are harmless.
+
+        Returns:
+            Number of tasks enqueued or already queued
         """
         now = datetime.now(timezone.utc)
-        tasks = await self.get_pending_task(now)
+        tasks = [
+            task
+            for task in await self.get_pending_task(
+                now, now + SCHEDULER_LOOKAHEAD_WINDOW
+            )
+            if task.id
+        ]
 
         scheduled_count = 0
-        for task in tasks:
-            if task.id:
-                await self._enqueue_task(task.id, task.scheduled_at)
-                scheduled_count += 1
+        for start in range(0, len(tasks), SCHEDULER_ENQUEUE_BATCH_SIZE):
+            batch = tasks[start : start + SCHEDULER_ENQUEUE_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(
+                    self._enqueue_task(task.id, task.scheduled_at)  # type: ignore[arg-type]
+                    for task in batch
+                ),
+                return_exceptions=True,
+            )
+            for task, result in zip(batch, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to enqueue task {task.id}: {result}")
+                elif result:
+                    scheduled_count += 1
 
         logger.info(f"Scheduled {scheduled_count} pending tasks")
+        return scheduled_count
 
     async def _handle_recurring_task(
         self, task: BaseScheduledTask, occurrence_count: int
@@ -237,7 +308,10 @@ class BaseSchedulerService(ABC):
             user_timezone = trigger_config.timezone
             logger.debug(f"Using workflow timezone: {user_timezone}")
 
-        next_run = get_next_run_time(task.repeat, task.scheduled_at, user_timezone)
+        # An occurrence run late (e.g. caught up after downtime) continues from
+        # now, so missed occurrences aren't all run back to back
+        base_time = max(_as_utc(task.scheduled_at), datetime.now(timezone.utc))
+        next_run = get_next_run_time(task.repeat, base_time, user_timezone)
 
         # Check if we should continue scheduling
         should_continue = True
@@ -268,7 +342,7 @@ class BaseSchedulerService(ABC):
                 task.id,
                 ScheduledTaskStatus.SCHEDULED,
                 {
-                    "scheduled_at": next_run.isoformat(),
+                    "scheduled_at": next_run,
                     "occurrence_count": occurrence_count,
                 },
             )
@@ -283,29 +357,47 @@ class BaseSchedulerService(ABC):
             )
             logger.info(f"Completed recurring task {task.id}")
 
+    def _job_id(self, task_id: str, scheduled_at: datetime) -> str:
+        """Deterministic ARQ job ID for one occurrence of a task."""
+        return (
+            f"{self.get_job_name()}:{task_id}:{int(_as_utc(scheduled_at).timestamp())}"
+        )
+
     async def _enqueue_task(self, task_id: str, scheduled_at: datetime) -> bool:
         """
-        Enqueue a task in ARQ.
+        Enqueue a task in ARQ if it is due within the lookahead window.
+
+        Tasks due later are left for the periodic scan. The job ID is derived
+        from the task and its due time, so enqueueing the same occurrence twice
+        is a no-op.
 
         Args:
             task_id: Task ID
             scheduled_at: When to execute the task
 
         Returns:
-            True if enqueued successfully
+            True if the task is queued or deferred to a later scan
         """
         if not self.arq_pool:
             logger.error("ARQ pool not initialized")
             return False
 
-        job_name = self.get_job_name()
+        scheduled_at = _as_utc(scheduled_at)
+        if scheduled_at > datetime.now(timezone.utc) + SCHEDULER_LOOKAHEAD_WINDOW:
+            logger.debug(
+                f"Task {task_id} due at {scheduled_at} is outside the lookahead window"
+            )
+            return True
+
+        job_id = self._job_id(task_id, scheduled_at)
         job = await self.arq_pool.enqueue_job(
-            job_name, task_id, _defer_until=scheduled_at
+            self.get_job_name(), task_id, _job_id=job_id, _defer_until=scheduled_at
         )
 
         if not job:
-            logger.error(f"Failed to enqueue task {task_id}")
-            return False
+            # ARQ returns None when a job with this ID already exists
+            logger.debug(f"Task {task_id} already enqueued with job ID {job_id}")
+            return True
 
         logger.debug(f"Enqueued task {task_id} with job ID {job.job_id}")
         return True
@@ -328,6 +420,19 @@ class BaseSchedulerService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def claim_task(self, task_id: str) -> Optional[BaseScheduledTask]:
+        """
+        Atomically move a task from SCHEDULED to EXECUTING.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            The claimed task, or None if it doesn't exist or isn't scheduled
+        """
+        pass
+
     @abstractmethod
     async def execute_task(self, task: BaseScheduledTask) -> TaskExecutionResult:
         """
@@ -364,12 +469,15 @@ class BaseSchedulerService(ABC):
         pass
 
     @abstractmethod
-    async def get_pending_task(self, current_time: datetime) -> List[BaseScheduledTask]:
+    async def get_pending_task(
+        self, current_time: datetime, window_end: Optional[datetime] = None
+    ) -> List[BaseScheduledTask]:
         """
         Get all tasks that should be scheduled.
 
         Args:
             current_time: Current time for filtering
+            window_end: Only return tasks due at or before this time
 
         Returns:
             List of tasks to schedule
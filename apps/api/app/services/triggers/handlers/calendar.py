@@ -190,7 +190,7 @@ class CalendarTriggerHandler(TriggerHandler):
             # Import here to avoid circular imports
             from app.services import calendar_service
 
-            calendars = calendar_service.list_calendars(user_id)
+            calendars = await calendar_service.list_calendars(user_id)
 
             if calendars and "items" in calendars:
                 return [
@@ -77,7 +77,7 @@ class GitHubTriggerHandler(TriggerHandler):
         search_query = kwargs.get("search", "").strip()
 
         # Use LangChain wrapper pattern
-        tool = composio_service.get_tool(
+        tool = await composio_service.aget_tool(
             "GITHUB_LIST_REPOSITORIES_FOR_THE_AUTHENTICATED_USER",
             user_id=user_id,
         )
@@ -69,7 +69,7 @@ class GoogleSheetsTriggerHandler(TriggerHandler):
             # Get spreadsheets list
             if field_name == "spreadsheet_ids":
                 # Use LangChain wrapper pattern
-                tool = composio_service.get_tool(
+                tool = await composio_service.aget_tool(
                     "GOOGLESHEETS_SEARCH_SPREADSHEETS",
                     user_id=user_id,
                 )
@@ -124,7 +124,7 @@ class GoogleSheetsTriggerHandler(TriggerHandler):
 
             # Get sheets grouped by spreadsheet (cascading)
             elif field_name == "sheet_names" and parent_ids:
-                tool = composio_service.get_tool(
+                tool = await composio_service.aget_tool(
                     "GOOGLESHEETS_GET_SHEET_NAMES",
                     user_id=user_id,
                 )
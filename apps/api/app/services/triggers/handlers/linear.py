@@ -66,7 +66,7 @@ class LinearTriggerHandler(TriggerHandler):
         composio_service = get_composio_service()
 
         if field_name == "team_id":
-            tool = composio_service.get_tool(
+            tool = await composio_service.aget_tool(
                 "LINEAR_GET_ALL_LINEAR_TEAMS", user_id=user_id
             )
             if not tool:
@@ -99,7 +99,9 @@ class NotionTriggerHandler(TriggerHandler):
             composio_service = get_composio_service()
 
             # Use NOTION_FETCH_DATA tool
-            tool = composio_service.get_tool("NOTION_FETCH_DATA", user_id=user_id)
+            tool = await composio_service.aget_tool(
+                "NOTION_FETCH_DATA", user_id=user_id
+            )
             if not tool:
                 logger.error("Notion FETCH_DATA tool not found")
                 return []
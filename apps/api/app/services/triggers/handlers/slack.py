@@ -299,7 +299,7 @@ class SlackTriggerHandler(TriggerHandler):
                 composio_service = get_composio_service()
 
                 # Use SLACK_LIST_ALL_CHANNELS with pagination support
-                tool = composio_service.get_tool(
+                tool = await composio_service.aget_tool(
                     "SLACK_LIST_ALL_CHANNELS", user_id=user_id
                 )
                 if not tool:
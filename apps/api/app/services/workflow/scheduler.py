@@ -13,9 +13,10 @@ from app.models.scheduler_models import (
     ScheduledTaskStatus,
     TaskExecutionResult,
 )
-from app.models.workflow_models import Workflow
+from app.models.workflow_models import TriggerType, Workflow
 from app.services.scheduler_service import BaseSchedulerService
 from arq.connections import RedisSettings
+from pymongo import ReturnDocument
 
 
 class WorkflowScheduler(BaseSchedulerService):
@@ -71,6 +72,36 @@ class WorkflowScheduler(BaseSchedulerService):
             logger.error(f"Error fetching workflow {task_id}: {e}")
             return None
 
+    async def claim_task(self, task_id: str) -> Optional[Workflow]:
+        """
+        Atomically mark a scheduled workflow as executing.
+
+        Args:
+            task_id: Workflow ID
+
+        Returns:
+            Claimed workflow or None if it isn't in SCHEDULED status
+        """
+        try:
+            workflow_doc = await workflows_collection.find_one_and_update(
+                {"_id": task_id, "status": ScheduledTaskStatus.SCHEDULED.value},
+                {
+                    "$set": {
+                        "status": ScheduledTaskStatus.EXECUTING.value,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+            if not workflow_doc:
+                return None
+
+            workflow_doc["id"] = workflow_doc.pop("_id")
+            return Workflow(**workflow_doc)
+        except Exception as e:
+            logger.error(f"Error claiming workflow {task_id}: {e}")
+            return None
+
     async def execute_task(self, task: BaseScheduledTask) -> TaskExecutionResult:
         """
         Execute a workflow task.
@@ -171,12 +202,15 @@ class WorkflowScheduler(BaseSchedulerService):
             logger.error(f"Error updating workflow {task_id}: {e}")
             return False
 
-    async def get_pending_task(self, current_time: datetime) -> List[BaseScheduledTask]:
+    async def get_pending_task(
+        self, current_time: datetime, window_end: Optional[datetime] = None
+    ) -> List[BaseScheduledTask]:
         """
         Get workflows that should be scheduled for execution.
 
         Args:
             current_time: Current time to check against
+            window_end: Also return workflows due up to this time
 
         Returns:
             List of workflows ready for execution (as BaseScheduledTask)
@@ -184,12 +218,19 @@ class WorkflowScheduler(BaseSchedulerService):
         try:
             # Find workflows that are:
             # 1. In SCHEDULED status
-            # 2. Have scheduled_at <= current_time
+            # 2. Due by window_end (or current_time when no window is given).
+            #    This includes overdue workflows, e.g. ones that came due while
+            #    the service was down; running one claims it and advances
+            #    scheduled_at, so later scans don't pick it up again.
             # 3. Are activated
+            # 4. Are triggered by a schedule; manual and integration workflows
+            #    are also SCHEDULED, with scheduled_at set at creation
+            scheduled_at_filter: Dict[str, Any] = {"$lte": window_end or current_time}
             query = {
                 "status": ScheduledTaskStatus.SCHEDULED.value,
-                "scheduled_at": {"$lte": current_time},
+                "scheduled_at": scheduled_at_filter,
                 "activated": True,
+                "trigger_config.type": TriggerType.SCHEDULE.value,
             }
 
             cursor = workflows_collection.find(query)
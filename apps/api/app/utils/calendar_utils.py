@@ -19,7 +19,7 @@ def resolve_timezone(timezone: str) -> str:
         raise HTTPException(status_code=400, detail=f"Invalid timezone: '{timezone}'")
 
 
-def fetch_calendar_color(calendar_id: str, user_id: str) -> tuple[str, str]:
+async def fetch_calendar_color(calendar_id: str, user_id: str) -> tuple[str, str]:
     """
     Fetch calendar name and background color for a given calendar_id.
 
@@ -33,7 +33,7 @@ def fetch_calendar_color(calendar_id: str, user_id: str) -> tuple[str, str]:
     from app.services.calendar_service import list_calendars
 
     try:
-        calendar_list = list_calendars(user_id)
+        calendar_list = await list_calendars(user_id)
         if calendar_list:
             for cal in calendar_list.get("items", []):
                 if cal.get("id") == calendar_id:
@@ -69,7 +69,7 @@ def extract_event_dates(calendar_options: List[Dict[str, Any]]) -> Set[str]:
     return event_dates
 
 
-def fetch_same_day_events(
+async def fetch_same_day_events(
     event_dates: Set[str],
     access_token: str,
     user_id: str,
@@ -94,7 +94,7 @@ def fetch_same_day_events(
             time_min = f"{event_date}T00:00:00Z"
             time_max = f"{event_date}T23:59:59Z"
 
-            events_response = get_calendar_events(
+            events_response = await get_calendar_events(
                 access_token=access_token,
                 user_id=user_id,
                 time_min=time_min,
@@ -0,0 +1,47 @@
+"""
+Bounded thread pools for blocking SDK calls.
+
+Some provider SDKs (e.g. Tavily, Firecrawl) only offer synchronous clients.
+Calling them directly from ``async def`` code blocks the event loop for the
+whole network round-trip, stalling every other request and stream on the
+worker. ``run_blocking`` runs such calls on a dedicated, bounded pool per
+provider, so one slow provider can't exhaust the loop's default executor and
+concurrency towards each provider stays capped.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def create_bounded_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Create a thread pool for one provider's blocking calls."""
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+
+async def run_blocking(
+    executor: ThreadPoolExecutor,
+    func: Callable[..., T],
+    *args,
+    timeout: Optional[float] = None,
+) -> T:
+    """
+    Run a blocking callable on ``executor`` without blocking the event loop.
+
+    As with ``loop.run_in_executor``, pass keyword arguments through
+    ``functools.partial`` so they can't collide with ``timeout``. Context
+    variables are propagated like ``asyncio.to_thread`` does. The timeout
+    covers queueing for a worker plus the call itself; on timeout
+    ``asyncio.TimeoutError`` is raised and the worker finishes the call in the
+    background.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args)
+    future = loop.run_in_executor(executor, call)
+    if timeout is None:
+        return await future
+    return await asyncio.wait_for(future, timeout)
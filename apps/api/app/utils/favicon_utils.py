@@ -3,25 +3,29 @@ Favicon fetching utilities with Redis caching.
 
 Strategy:
 1. Check Redis cache by root domain (e.g., smithery.ai)
-2. Try Google's favicon service (fastest, most reliable)
-3. Try 'favicon' library (parses HTML for link tags) - runs in thread pool
-4. Try standard /favicon.ico path
-5. Parse HTML for link[rel=icon] tags
-6. Cache result in Redis for 180 days
+2. Race the sources below concurrently; the first valid icon wins:
+   - Google's favicon service
+   - 'favicon' library (parses HTML for link tags) - runs in thread pool
+   - Standard /favicon.ico path
+   - Parse HTML for link[rel=icon] tags
+3. Cache result in Redis for 180 days, or a miss for 30 minutes
+
+All requests go through the shared pooled HTTP client.
 """
 
 import asyncio
 import time
+from typing import Awaitable
 from urllib.parse import urlparse, urljoin
 
-import httpx
 import favicon
 import tldextract
 from bs4 import BeautifulSoup
 
 from app.config.loggers import app_logger as logger
-from app.constants.cache import FAVICON_CACHE_TTL
+from app.constants.cache import FAVICON_CACHE_TTL, FAVICON_NEGATIVE_CACHE_TTL
 from app.db.redis import get_cache, set_cache
+from app.utils.http_client import request
 
 # HTTP client settings
 HTTP_TIMEOUT = 3.0
@@ -33,6 +37,9 @@ GOOGLE_FAVICON_URL = "https://www.google.com/s2/favicons?domain={domain}&sz=256"
 # Known favicon extensions that don't need validation
 KNOWN_FAVICON_EXTENSIONS = (".ico", ".png", ".svg", ".webp")
 
+# Cached for domains where no strategy found an icon
+FAVICON_NOT_FOUND = ""
+
 
 def _get_domain_cache_key(server_url: str) -> str:
     """Extract root domain for cache key."""
@@ -172,12 +179,13 @@ def _select_best_icon(icons: list[dict]) -> str | None:
 async def _validate_favicon_url(url: str) -> bool:
     """Verify favicon URL returns an image (HEAD request)."""
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            response = await client.head(url, follow_redirects=True)
-            if response.status_code != 200:
-                return False
-            content_type = response.headers.get("content-type", "").lower()
-            return "image" in content_type
+        response = await request(
+            "HEAD", url, follow_redirects=True, timeout=HTTP_TIMEOUT
+        )
+        if response.status_code != 200:
+            return False
+        content_type = response.headers.get("content-type", "").lower()
+        return "image" in content_type
     except Exception as e:
         logger.debug(f"Favicon validation failed for {url}: {e}")
         return False
@@ -196,13 +204,14 @@ async def _try_standard_favicon(url: str) -> str | None:
 async def _try_html_link_parsing(url: str) -> str | None:
     """Fetch HTML and parse link[rel=icon] tags."""
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            response = await client.get(url, follow_redirects=True)
-            if response.status_code != 200:
-                return None
+        response = await request(
+            "GET", url, follow_redirects=True, timeout=HTTP_TIMEOUT
+        )
+        if response.status_code != 200:
+            return None
 
-            icons = _parse_icons_from_html(response.text, url)
-            return _select_best_icon(icons)
+        icons = _parse_icons_from_html(response.text, url)
+        return _select_best_icon(icons)
 
     except Exception as e:
         logger.debug(f"HTML link parsing failed for {url}: {e}")
@@ -220,38 +229,63 @@ async def _try_google_favicon_service(domain: str) -> str | None:
     favicon_url = GOOGLE_FAVICON_URL.format(domain=domain)
 
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            response = await client.head(favicon_url, follow_redirects=True)
-            if response.status_code != 200:
-                return None
+        response = await request(
+            "HEAD", favicon_url, follow_redirects=True, timeout=HTTP_TIMEOUT
+        )
+        if response.status_code != 200:
+            return None
 
-            content_type = response.headers.get("content-type", "").lower()
-            if "image" not in content_type:
-                return None
+        content_type = response.headers.get("content-type", "").lower()
+        if "image" not in content_type:
+            return None
 
-            # Google returns a small default globe icon (~318 bytes at sz=128)
-            # Real favicons are typically larger. Skip if too small.
-            content_length = response.headers.get("content-length", "")
-            if content_length and int(content_length) < 400:
-                logger.debug(f"Google favicon too small for {domain}, likely default")
-                return None
+        # Google returns a small default globe icon (~318 bytes at sz=128)
+        # Real favicons are typically larger. Skip if too small.
+        content_length = response.headers.get("content-length", "")
+        if content_length and int(content_length) < 400:
+            logger.debug(f"Google favicon too small for {domain}, likely default")
+            return None
 
-            return favicon_url
+        return favicon_url
 
     except Exception as e:
         logger.debug(f"Google favicon service failed for {domain}: {e}")
     return None
 
 
+async def _validated(candidate: Awaitable[str | None], source: str) -> str | None:
+    """Await a candidate icon URL and verify it, unless its extension is known."""
+    result = await candidate
+    if not result:
+        return None
+    # Skip validation for known favicon extensions
+    if _is_known_favicon_url(result) or await _validate_favicon_url(result):
+        return result
+    logger.debug(f"{source} result failed validation: {result}")
+    return None
+
+
+async def _first_result(*strategies: Awaitable[str | None]) -> str | None:
+    """Run strategies concurrently and return the first non-empty result."""
+    tasks = [asyncio.ensure_future(strategy) for strategy in strategies]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def _fetch_favicon_impl(server_url: str) -> str | None:
     """
     Fetch favicon from external sources.
 
-    Uses root domain only. Strategy:
-    1. Google's favicon service (fastest, most reliable)
-    2. favicon library (thread pool, with timeout)
-    3. Standard /favicon.ico path
-    4. Parse HTML for link[rel=icon]
+    Uses root domain only. Races Google's favicon service, the favicon
+    library, the standard /favicon.ico path and HTML link[rel=icon] parsing;
+    each strategy swallows its own errors and returns None on failure.
     """
     url = _get_root_domain_url(server_url)
     extracted = tldextract.extract(server_url)
@@ -262,44 +296,21 @@ async def _fetch_favicon_impl(server_url: str) -> str | None:
     if domain != "smithery.ai":
         return GOOGLE_FAVICON_URL.format(domain=domain)
 
-    # Try Google's favicon service first (fastest)
-    result = await _try_google_favicon_service(domain)
-    if result:
-        return result
-
-    # Try favicon library (runs in thread pool)
-    result = await _try_favicon_library(url)
-    if result:
-        # Skip validation for known favicon extensions
-        if _is_known_favicon_url(result):
-            return result
-        if await _validate_favicon_url(result):
-            return result
-        logger.debug(f"Favicon library result failed validation: {result}")
-
-    # Try standard /favicon.ico path
-    result = await _try_standard_favicon(url)
-    if result:
-        return result
-
-    # Fallback: parse HTML for link rel=icon
-    result = await _try_html_link_parsing(url)
-    if result:
-        # Skip validation for known favicon extensions
-        if _is_known_favicon_url(result):
-            return result
-        # Only validate unknown extensions
-        if await _validate_favicon_url(result):
-            return result
-        logger.debug(f"HTML parsing result failed validation: {result}")
-
-    return None
+    return await _first_result(
+        _try_google_favicon_service(domain),
+        _validated(_try_favicon_library(url), "Favicon library"),
+        _try_standard_favicon(url),
+        _validated(_try_html_link_parsing(url), "HTML parsing"),
+    )
 
 
 async def fetch_favicon_from_url(server_url: str) -> str | None:
     """
     Fetch favicon URL with Redis caching by root domain.
 
+    Misses are cached for a short time too, so dead or icon-less domains
+    aren't probed again on every request.
+
     Returns:
         Favicon URL string or None if not found
     """
@@ -308,14 +319,18 @@ async def fetch_favicon_from_url(server_url: str) -> str | None:
     try:
         # Check Redis cache first
         cached = await get_cache(cache_key)
-        if cached:
-            return cached
+        if cached is not None:
+            return cached or None
 
         # Cache miss - fetch from external sources
         result = await _fetch_favicon_impl(server_url)
 
         if result:
             await set_cache(cache_key, result, ttl=FAVICON_CACHE_TTL)
+        else:
+            await set_cache(
+                cache_key, FAVICON_NOT_FOUND, ttl=FAVICON_NEGATIVE_CACHE_TTL
+            )
 
         return result
 
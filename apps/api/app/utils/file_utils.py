@@ -16,6 +16,12 @@ from app.config.loggers import app_logger as logger
 from app.config.settings import settings
 from app.models.files_models import DocumentPageModel, DocumentSummaryModel
 
+# Document types parsed with LlamaParse, and the suffix it needs to detect them
+DOCUMENT_SUFFIXES = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+}
+
 
 class DocumentProcessor:
     """Document processing and summarization using LlamaIndex and LlamaCloud."""
@@ -47,22 +53,86 @@ class DocumentProcessor:
         try:
             if content_type.startswith("image/"):
                 return await self.process_image(file_content)
-            elif content_type == "application/pdf":
-                return await self.process_doc(file_content)
-            elif (
-                content_type
-                == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            ):
-                return await self.process_doc(file_content, suffix=".docx")
+            elif content_type in DOCUMENT_SUFFIXES:
+                return await self.process_doc(
+                    file_content, suffix=DOCUMENT_SUFFIXES[content_type]
+                )
             elif content_type.startswith("text/"):
                 return await self.process_text(file_content)
             else:
-                ext = os.path.splitext(filename)[1].lower()
-                return f"File of type {ext} (no content extraction available)"
+                return await self.summarize_pages([], content_type, filename)
         except Exception as e:
             logger.error(f"Failed to process file {filename}: {str(e)}", exc_info=True)
             return f"File processing failed for {filename}"
 
+    async def extract_pages(
+        self, file_content: bytes, content_type: str, filename: str
+    ) -> List[DocumentPageModel]:
+        """
+        Extract the content of a file as pages, without summarizing it.
+
+        Images are described by the vision model, PDF/DOCX files are parsed to
+        markdown page by page and text files are a single page. Other types
+        have no extractable content. Unlike process_file, failures raise so
+        callers can retry.
+
+        Args:
+            file_content: Raw file bytes
+            content_type: MIME type of the file
+            filename: Name of the file
+
+        Returns:
+            The extracted pages
+        """
+        if content_type.startswith("image/"):
+            description = await self._describe_image(file_content)
+            return [DocumentPageModel(page_number=1, content=description)]
+        elif content_type in DOCUMENT_SUFFIXES:
+            return await self._parse_doc(
+                file_content, suffix=DOCUMENT_SUFFIXES[content_type]
+            )
+        elif content_type.startswith("text/"):
+            return [
+                DocumentPageModel(
+                    page_number=1,
+                    content=file_content.decode("utf-8", errors="replace"),
+                )
+            ]
+        return []
+
+    async def summarize_pages(
+        self, pages: List[DocumentPageModel], content_type: str, filename: str
+    ) -> Union[str, List[DocumentSummaryModel], DocumentSummaryModel]:
+        """
+        Summarize pages returned by extract_pages. Failures raise.
+
+        Args:
+            pages: Pages extracted from the file
+            content_type: MIME type of the file
+            filename: Name of the file
+
+        Returns:
+            The same summary shapes as process_file
+        """
+        if content_type.startswith("image/"):
+            # The vision model's description already is the summary
+            return (
+                pages[0].content
+                if pages
+                else "Image description could not be generated."
+            )
+        elif content_type in DOCUMENT_SUFFIXES:
+            return await self._summarize_doc_pages(pages)
+        elif content_type.startswith("text/") and pages:
+            return DocumentSummaryModel(
+                data=pages[0],
+                summary=await self._summarize_text(
+                    pages[0].content[:4000]
+                ),  # Limit to avoid token issues
+            )
+        ext = os.path.splitext(filename)[1].lower()
+        return f"File of type {ext} (no content extraction available)"
+
     async def process_image(self, image_data: bytes) -> str:
         """
         Process and summarize an image using LlamaCloud's vision model.
@@ -75,41 +145,44 @@ class DocumentProcessor:
             Summary of the image content
         """
         try:
-            # Convert the image to base64 for the LLM
-            base64_image = base64.b64encode(image_data).decode("utf-8")
+            return await self._describe_image(image_data)
+        except Exception as e:
+            logger.error(f"Failed to process image: {str(e)}", exc_info=True)
+            return "Image description could not be generated."
 
-            # Process with vision model
-            response = await self.llm.ainvoke(
-                input=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": """
-                                Provide a concise summary of the content in this image. Assume it is part of a document like a PDF or DOCX, and ensure the summary is relevant for semantic search and accurately describes the image.
+    async def _describe_image(self, image_data: bytes) -> str:
+        """Describe an image with the vision model."""
+        # Convert the image to base64 for the LLM
+        base64_image = base64.b64encode(image_data).decode("utf-8")
+
+        # Process with vision model
+        response = await self.llm.ainvoke(
+            input=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": """
+                            Provide a concise summary of the content in this image. Assume it is part of a document like a PDF or DOCX, and ensure the summary is relevant for semantic search and accurately describes the image.
 
-                                Note: Only respond with the summary text, without any additional information or context.""",
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}"
-                                },
+                            Note: Only respond with the summary text, without any additional information or context.""",
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{base64_image}"
                             },
-                        ],
-                    }
-                ],
-            )
+                        },
+                    ],
+                }
+            ],
+        )
 
-            description = response
-            if not isinstance(description, str):
-                description = str(description)
-            return description
-
-        except Exception as e:
-            logger.error(f"Failed to process image: {str(e)}", exc_info=True)
-            return "Image description could not be generated."
+        description = response
+        if not isinstance(description, str):
+            description = str(description)
+        return description
 
     async def process_doc(
         self,
@@ -127,56 +200,65 @@ class DocumentProcessor:
             List of DocumentSummaryModel with page images and summaries
         """
         try:
-            # Save PDF to temporary file for LlamaIndex processing
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(data)
+            pages = await self._parse_doc(data, suffix=suffix)
+            return await self._summarize_doc_pages(pages)
+        except Exception as e:
+            logger.error(f"Failed to process PDF: {str(e)}", exc_info=True)
+            return []
+
+    async def _parse_doc(
+        self, data: bytes, suffix: str = ".pdf"
+    ) -> List[DocumentPageModel]:
+        """Parse a PDF/DOCX file to one markdown page per document page."""
+        # Save PDF to temporary file for LlamaIndex processing
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+            temp_path = temp_file.name
+            temp_file.write(data)
 
+        try:
             result = await self.parser.aparse(
                 file_path=temp_path,
             )
-
+        finally:
             # Clean up temporary file
             os.remove(temp_path)
 
-            if isinstance(result, list):
-                result = result[0]
+        if isinstance(result, list):
+            result = result[0]
 
-            md_documents = await result.aget_markdown_documents(split_by_page=True)
+        md_documents = await result.aget_markdown_documents(split_by_page=True)
+        return [
+            DocumentPageModel(page_number=i + 1, content=document.text)
+            for i, document in enumerate(md_documents)
+        ]
 
-            summarized_pages = await self.llm.abatch(
-                inputs=[
-                    [
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"""Provide a concise summary of the content in given text. Assume it is part of a document like a PDF or DOCX, and ensure the summary is relevant for semantic search and accurately describes the content.
-                                    Note: Only respond with the summary text, without any additional information or context.
-                                    CONTENT:{md_documents[i].text}""",
-                                },
-                            ],
-                        }
-                    ]
-                    for i in range(len(md_documents))
+    async def _summarize_doc_pages(
+        self, pages: List[DocumentPageModel]
+    ) -> List[DocumentSummaryModel]:
+        """Summarize every page of a parsed document in one batch."""
+        summarized_pages = await self.llm.abatch(
+            inputs=[
+                [
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": f"""Provide a concise summary of the content in given text. Assume it is part of a document like a PDF or DOCX, and ensure the summary is relevant for semantic search and accurately describes the content.
+                                Note: Only respond with the summary text, without any additional information or context.
+                                CONTENT:{page.content}""",
+                            },
+                        ],
+                    }
                 ]
-            )
-
-            return [
-                DocumentSummaryModel(
-                    data=DocumentPageModel(
-                        page_number=i + 1,
-                        content=md_documents[i].text,
-                    ),
-                    summary=str(summarized_pages[i]),
-                )
-                for i in range(len(md_documents))
+                for page in pages
             ]
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to process PDF: {str(e)}", exc_info=True)
-            return []
+        return [
+            DocumentSummaryModel(data=page, summary=str(summary))
+            for page, summary in zip(pages, summarized_pages)
+        ]
 
     async def process_text(self, text_data: bytes) -> DocumentSummaryModel:
         """
@@ -212,25 +294,28 @@ class DocumentProcessor:
     async def _generate_text_summary(self, text: str) -> str:
         """Generate a summary for text content using LlamaCloud."""
         try:
-            response = await self.llm.ainvoke(
-                input=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert document summarizer. Create concise summaries that capture key information.",
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Summarize the following text in a concise way that preserves the most important information:\n\n{text}",
-                    },
-                ],
-            )
-
-            return str(response)
-
+            return await self._summarize_text(text)
         except Exception as e:
             logger.error(f"Failed to generate summary: {str(e)}", exc_info=True)
             return "Summary could not be generated."
 
+    async def _summarize_text(self, text: str) -> str:
+        """Summarize text content with the LLM."""
+        response = await self.llm.ainvoke(
+            input=[
+                {
+                    "role": "system",
+                    "content": "You are an expert document summarizer. Create concise summaries that capture key information.",
+                },
+                {
+                    "role": "user",
+                    "content": f"Summarize the following text in a concise way that preserves the most important information:\n\n{text}",
+                },
+            ],
+        )
+
+        return str(response)
+
 
 # Function to implement file description generation interface compatible with existing code
 async def generate_file_summary(
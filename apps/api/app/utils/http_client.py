@@ -0,0 +1,96 @@
+"""
+Shared pooled HTTP client for outbound fetches.
+
+One ``httpx.AsyncClient`` per event loop, created at startup and closed at
+shutdown, so repeated fetches (URL unfurling, favicon lookups) reuse
+connections instead of paying a TCP+TLS handshake per call. HTTP/2 is
+negotiated when the optional ``h2`` package is installed.
+
+``request`` additionally caps concurrent requests per host.
+"""
+
+import asyncio
+import importlib.util
+import weakref
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+import httpx
+from app.config.loggers import app_logger as logger
+from app.constants.http import (
+    HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_CLIENT_MAX_PER_HOST,
+    HTTP_CLIENT_TIMEOUT,
+)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_host_slots: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[str, "_HostSlot"]
+] = weakref.WeakKeyDictionary()
+
+
+class _HostSlot:
+    """Per-host semaphore, dropped once no request to the host is in flight."""
+
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(HTTP_CLIENT_MAX_PER_HOST)
+        self.users = 0
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=HTTP_CLIENT_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send a request on the shared client, bounded per host."""
+    slots = _host_slots.setdefault(asyncio.get_running_loop(), {})
+    host = urlparse(url).netloc.lower()
+    slot = slots.get(host)
+    if slot is None:
+        slot = slots[host] = _HostSlot()
+
+    slot.users += 1
+    try:
+        async with slot.semaphore:
+            return await get_http_client().request(method, url, **kwargs)
+    finally:
+        slot.users -= 1
+        if not slot.users and slots.get(host) is slot:
+            del slots[host]
+
+
+async def init_http_client() -> None:
+    """Create the shared client for the running event loop."""
+    get_http_client()
+    logger.info(f"Shared HTTP client ready (http2={HTTP2_AVAILABLE})")
+
+
+async def close_http_client() -> None:
+    """Close the shared client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    _host_slots.pop(loop, None)
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
@@ -3,9 +3,14 @@ from urllib.parse import urljoin, urlparse
 
 import httpx
 from app.config.loggers import search_logger as logger
+from app.constants.cache import (
+    URL_METADATA_CACHE_TTL,
+    URL_METADATA_NEGATIVE_CACHE_TTL,
+)
 from app.db.mongodb.collections import search_urls_collection
 from app.db.redis import get_cache, set_cache
 from app.db.utils import serialize_document
+from app.utils.http_client import request
 from app.models.search_models import URLResponse
 from bs4 import BeautifulSoup
 from fastapi import HTTPException, status
@@ -55,17 +60,23 @@ async def fetch_url_metadata(url: str) -> URLResponse:
         return URLResponse(**metadata)
 
     metadata = await scrape_url_metadata(url)
+
+    # Failed fetches are only cached briefly and never persisted, so a URL that
+    # was down isn't stuck without a preview
+    if not any(value for key, value in metadata.items() if key != "url"):
+        await set_cache(cache_key, metadata, URL_METADATA_NEGATIVE_CACHE_TTL)
+        return URLResponse(**metadata)
+
     await search_urls_collection.insert_one(metadata)
-    await set_cache(cache_key, serialize_document(metadata), 864000)
+    await set_cache(cache_key, serialize_document(metadata), URL_METADATA_CACHE_TTL)
 
     return URLResponse(**metadata)
 
 
 async def scrape_url_metadata(url: str) -> dict:
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
+        response = await request("GET", url, follow_redirects=True, timeout=10)
+        response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "html.parser")
 
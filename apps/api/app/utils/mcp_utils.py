@@ -142,7 +142,12 @@ def extract_type_from_field(field_info: dict) -> tuple[Any, Any, bool]:
 
 
 def serialize_args_schema(tool: BaseTool) -> dict | None:
-    """Serialize tool's args schema to JSON-compatible dict."""
+    """
+    Serialize tool's args schema to its full JSON Schema.
+
+    The result keeps ``$defs``, ``$ref``s, array item types and nested objects,
+    so it can be used as a tool's ``args_schema`` as is.
+    """
     if not hasattr(tool, "args_schema") or not tool.args_schema:
         logger.debug(f"Tool {tool.name} has no args_schema")
         return None
@@ -152,11 +157,7 @@ def serialize_args_schema(tool: BaseTool) -> dict | None:
         if not isinstance(args_schema, type) or not issubclass(args_schema, BaseModel):
             logger.debug(f"Tool {tool.name} args_schema is not a BaseModel")
             return None
-        schema = args_schema.model_json_schema()  # type: ignore[attr-defined]
-        result = {
-            "properties": schema.get("properties", {}),
-            "required": schema.get("required", []),
-        }
+        result = args_schema.model_json_schema()  # type: ignore[attr-defined]
         logger.debug(
             f"Serialized schema for {tool.name}: {len(result.get('properties', {}))} properties"
         )
@@ -4,23 +4,22 @@ import asyncio
 from datetime import datetime, timezone
 
 from app.config.loggers import llm_logger as logger
-from app.services.memory_service import memory_service
+from app.services.memory_buffer_service import memory_write_buffer
 from app.agents.templates.mail_templates import GmailMessageParser
 
 
 async def store_user_message_memory(user_id: str, message: str, conversation_id: str):
-    """Store user message in memory and return formatted data if successful."""
+    """
+    Queue user message for memory storage and return formatted data if successful.
+
+    Messages are buffered per conversation and stored in batches (see
+    MemoryWriteBuffer), so this doesn't wait on Mem0.
+    """
     try:
-        result = await memory_service.store_memory(
-            message=message,
+        result = await memory_write_buffer.append(
             user_id=user_id,
+            message=message,
             conversation_id=conversation_id,
-            metadata={
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "conversation_id": conversation_id,
-                "type": "user_message",
-            },
-            async_mode=True,
         )
 
         if result:
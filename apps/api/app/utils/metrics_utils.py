@@ -0,0 +1,69 @@
+"""
+In-process latency histograms.
+
+There is no metrics backend, so histograms are kept in memory per process and
+exported through ``snapshot()`` (logged periodically or returned by the
+owning service's ``get_metrics()``).
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence
+
+from app.constants.profiling import LATENCY_BUCKETS_MS
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram of millisecond durations."""
+
+    buckets: Sequence[float] = LATENCY_BUCKETS_MS
+    counts: list[int] = field(init=False)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile, reported as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.buckets):
+                    return min(float(self.buckets[index]), self.max)
+                return self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.5), 2),
+            "p95_ms": round(self.quantile(0.95), 2),
+            "p99_ms": round(self.quantile(0.99), 2),
+            "max_ms": round(self.max, 2),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def snapshot_histograms(histograms: Dict[str, Histogram]) -> Dict[str, Any]:
+    """Snapshot a label -> histogram mapping, skipping empty histograms."""
+    return {
+        label: histogram.snapshot()
+        for label, histogram in sorted(histograms.items())
+        if histogram.count
+    }
@@ -0,0 +1,156 @@
+"""
+Near-duplicate text detection in roughly linear time.
+
+Comparing every text against every kept text with ``SequenceMatcher.ratio``
+is quadratic in the number of texts on top of quadratic per-pair work.
+``NearDuplicateIndex`` instead computes a MinHash signature per text (one
+permutation hashing over word-bigram shingles, with densification) and
+buckets it with LSH banding, so a lookup only touches kept texts that share a
+band.
+
+Candidates are confirmed with the same ``SequenceMatcher.ratio`` check as
+before (with its cheap upper bounds first), so a reported duplicate always
+meets the threshold exactly; LSH only decides which pairs get compared. Only
+the candidates sharing the most bands are checked, which keeps the work per
+lookup bounded even when many kept texts come from the same template.
+"""
+
+import heapq
+import zlib
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from app.constants.general import (
+    DEDUPLICATION_LSH_BANDS,
+    DEDUPLICATION_LSH_ROWS,
+    DEDUPLICATION_MAX_CANDIDATES,
+)
+
+_HASH_RANGE = 1 << 32
+
+
+def _shingles(text: str) -> set[bytes]:
+    """Word bigrams of ``text``; single words for one-word texts."""
+    words = text.split()
+    if len(words) < 2:
+        return {word.encode() for word in words}
+    return {f"{a} {b}".encode() for a, b in zip(words, words[1:], strict=False)}
+
+
+def minhash_signature(text: str, size: int) -> Tuple[int, ...]:
+    """
+    One-permutation MinHash signature of ``text`` with ``size`` slots.
+
+    Each shingle hash is assigned to a slot by its low bits and competes for
+    that slot's minimum, so the signature costs one hash per shingle. Empty
+    slots borrow from the next non-empty slot (rotation densification).
+    """
+    slot_width = _HASH_RANGE // size
+    mins = [_HASH_RANGE] * size
+    for shingle in _shingles(text):
+        value = zlib.crc32(shingle)
+        slot = value % size
+        if value < mins[slot]:
+            mins[slot] = value
+
+    if all(value == _HASH_RANGE for value in mins):
+        return tuple(mins)
+
+    signature = list(mins)
+    for slot in range(size):
+        offset = 0
+        while mins[(slot + offset) % size] == _HASH_RANGE:
+            offset += 1
+        if offset:
+            signature[slot] = mins[(slot + offset) % size] + offset * slot_width
+    return tuple(signature)
+
+
+class NearDuplicateIndex:
+    """
+    Index of kept texts answering "is this text a near-duplicate of one?".
+
+    Args:
+        threshold: Minimum ``SequenceMatcher.ratio`` for two texts to count
+            as duplicates
+        bands: Number of LSH bands
+        rows: Signature slots per band. More bands or fewer rows raise recall
+            at lower similarities at the cost of more candidate checks.
+        max_candidates: Most candidates confirmed with SequenceMatcher per lookup
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        bands: int = DEDUPLICATION_LSH_BANDS,
+        rows: int = DEDUPLICATION_LSH_ROWS,
+        max_candidates: int = DEDUPLICATION_MAX_CANDIDATES,
+    ) -> None:
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_candidates = max_candidates
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._texts: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _band_keys(self, text: str) -> List[Tuple[int, ...]]:
+        signature = minhash_signature(text, self.bands * self.rows)
+        return [
+            signature[band * self.rows : (band + 1) * self.rows]
+            for band in range(self.bands)
+        ]
+
+    def find(self, text: str, band_keys: Optional[list] = None) -> Optional[int]:
+        """Return the id of a kept text at least ``threshold`` similar, if any."""
+        if not text:
+            return None
+
+        shared_bands: Dict[int, int] = defaultdict(int)
+        for buckets, key in zip(
+            self._buckets, band_keys or self._band_keys(text), strict=True
+        ):
+            for candidate in buckets.get(key, ()):
+                shared_bands[candidate] += 1
+
+        # Most likely matches first
+        length = len(text)
+        candidates = heapq.nlargest(
+            self.max_candidates, shared_bands, key=shared_bands.__getitem__
+        )
+        for candidate in candidates:
+            kept = self._texts[candidate]
+            # Upper bound on ratio from lengths alone (real_quick_ratio)
+            if 2.0 * min(length, len(kept)) / (length + len(kept)) < self.threshold:
+                continue
+
+            matcher = SequenceMatcher(None, text, kept)
+            if (
+                matcher.quick_ratio() >= self.threshold
+                and matcher.ratio() >= self.threshold
+            ):
+                return candidate
+        return None
+
+    def add(self, text: str, band_keys: Optional[list] = None) -> int:
+        """Add a kept text and return its id."""
+        text_id = len(self._texts)
+        for buckets, key in zip(
+            self._buckets, band_keys or self._band_keys(text), strict=True
+        ):
+            buckets[key].append(text_id)
+        self._texts.append(text)
+        return text_id
+
+    def add_if_unique(self, text: str) -> bool:
+        """Add ``text`` unless it duplicates a kept text; returns True if added."""
+        band_keys = self._band_keys(text)
+        if self.find(text, band_keys) is not None:
+            return False
+        self.add(text, band_keys)
+        return True
@@ -0,0 +1,123 @@
+"""
+Per-user notification counters cached in Redis.
+
+Each user has a Redis hash holding the number of notifications per status plus
+a ``total`` field, so the notification bell can be answered with a single
+HGETALL instead of a ``count_documents`` scan.
+
+Counters are adjusted incrementally whenever the storage layer creates or
+changes the status of a notification. Increments only apply while the hash
+exists; a missing hash (first read, Redis eviction, TTL expiry) is rebuilt
+from MongoDB by the storage layer's reconciliation routine. The TTL is not
+refreshed on increments, so any drift is corrected at least once per TTL.
+"""
+
+from typing import Dict, Optional
+
+from app.config.loggers import app_logger as logger
+from app.constants.cache import (
+    NOTIFICATION_COUNTS_CACHE_PREFIX,
+    NOTIFICATION_COUNTS_CACHE_TTL,
+)
+from app.db.redis import redis_cache
+
+TOTAL_FIELD = "total"
+
+# Apply HINCRBY pairs only if the hash already exists, so a partial hash is
+# never created from deltas alone.
+_INCREMENT_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+def _counts_key(user_id: str) -> str:
+    return f"{NOTIFICATION_COUNTS_CACHE_PREFIX}:{user_id}"
+
+
+async def get_cached_counts(user_id: str) -> Optional[Dict[str, int]]:
+    """Return the cached per-status counters for a user, or None on a miss."""
+    if not redis_cache.redis:
+        return None
+
+    try:
+        counts = await redis_cache.redis.hgetall(_counts_key(user_id))
+    except Exception as e:
+        logger.warning(f"Failed to read notification counts for {user_id}: {e}")
+        return None
+
+    if not counts:
+        return None
+    return {field: int(value) for field, value in counts.items()}
+
+
+async def set_cached_counts(user_id: str, counts: Dict[str, int]) -> None:
+    """Replace the cached counters for a user."""
+    if not redis_cache.redis:
+        return
+
+    key = _counts_key(user_id)
+    mapping = {TOTAL_FIELD: 0, **counts}
+    try:
+        async with redis_cache.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, NOTIFICATION_COUNTS_CACHE_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to cache notification counts for {user_id}: {e}")
+
+
+async def increment_counts(user_id: str, deltas: Dict[str, int]) -> None:
+    """Apply counter deltas if the user's counters are currently cached."""
+    args: list[str | int] = []
+    for field, delta in deltas.items():
+        if delta:
+            args.extend((field, delta))
+
+    if not args or not redis_cache.redis:
+        return
+
+    try:
+        await redis_cache.redis.eval(
+            _INCREMENT_IF_EXISTS, 1, _counts_key(user_id), *args
+        )
+    except Exception as e:
+        # Drop the hash so the next read reconciles instead of serving drift
+        logger.warning(f"Failed to update notification counts for {user_id}: {e}")
+        await invalidate_counts(user_id)
+
+
+async def invalidate_counts(user_id: str) -> None:
+    """Drop the cached counters so they are rebuilt on the next read."""
+    if not redis_cache.redis:
+        return
+
+    try:
+        await redis_cache.redis.delete(_counts_key(user_id))
+    except Exception as e:
+        logger.warning(f"Failed to invalidate notification counts for {user_id}: {e}")
+
+
+def status_transition_deltas(
+    transitions: Dict[str, int], new_status: str
+) -> Dict[str, int]:
+    """
+    Build counter deltas for moving notifications into ``new_status``.
+
+    Args:
+        transitions: Number of notifications moved, keyed by their previous status
+        new_status: Status the notifications now have
+    """
+    deltas: Dict[str, int] = {}
+    for old_status, count in transitions.items():
+        if old_status == new_status or not count:
+            continue
+        deltas[old_status] = deltas.get(old_status, 0) - count
+        deltas[new_status] = deltas.get(new_status, 0) + count
+    return deltas
@@ -381,6 +381,7 @@ class NotificationOrchestrator:
         channel_type: Optional[str] = None,
         notification_type: Optional[NotificationType] = None,
         source: Optional[NotificationSourceEnum] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get notifications for a user with optional filtering.
@@ -393,12 +394,20 @@ class NotificationOrchestrator:
             channel_type: Optional channel type filter
             notification_type: Optional notification type filter
             source: Optional source filter
+            cursor: Optional keyset cursor from a previous page (overrides offset)
 
         Returns:
             List of serialized notifications
         """
         notifications = await self.storage.get_user_notifications(
-            user_id, status, limit, offset, channel_type, notification_type, source
+            user_id,
+            status,
+            limit,
+            offset,
+            channel_type,
+            notification_type,
+            source,
+            cursor,
         )
         return [await self._serialize_notification(n) for n in notifications]
 
@@ -435,22 +444,48 @@ class NotificationOrchestrator:
         Returns:
             Dictionary mapping notification IDs to success/failure status
         """
-        results = {}
-
-        for notification_id in notification_ids:
-            try:
-                if action == BulkActions.MARK_READ:
-                    result = await self.mark_as_read(notification_id, user_id)
-                    success = result is not None
-                elif action == BulkActions.ARCHIVE:
-                    success = await self.archive_notification(notification_id, user_id)
-                else:
-                    success = False
-
-                results[notification_id] = success
-            except Exception as e:
-                logger.error(f"Bulk action failed for {notification_id}: {e}")
-                results[notification_id] = False
+        # Dedupe while preserving order so the result keys match the request
+        notification_ids = list(dict.fromkeys(notification_ids))
+        results = {notification_id: False for notification_id in notification_ids}
+        if not notification_ids:
+            return results
+
+        now = datetime.now(timezone.utc)
+        if action == BulkActions.MARK_READ:
+            target_status = NotificationStatus.READ
+            updates: Dict[str, Any] = {"status": target_status.value, "read_at": now}
+        elif action == BulkActions.ARCHIVE:
+            target_status = NotificationStatus.ARCHIVED
+            updates = {"status": target_status.value, "archived_at": now}
+        else:
+            return results
+
+        try:
+            # Single set-based update; documents already in the target state are
+            # skipped so "mark all as read" doesn't rewrite read timestamps.
+            existing_ids = await self.storage.bulk_update_status(
+                notification_ids, user_id, target_status, updates
+            )
+        except Exception as e:
+            logger.error(f"Bulk {action.value} failed for user {user_id}: {e}")
+            return results
+
+        for notification_id in existing_ids:
+            results[notification_id] = True
+
+        # Clients only handle the per-notification read event, so send it for
+        # each notification found, as mark_as_read does. Archiving never
+        # broadcast an event.
+        if action == BulkActions.MARK_READ:
+            for notification_id in notification_ids:
+                if notification_id in existing_ids:
+                    await websocket_manager.broadcast_to_user(
+                        user_id,
+                        {
+                            "type": "notification.read",
+                            "notification_id": notification_id,
+                        },
+                    )
 
         return results
 
@@ -1,5 +1,7 @@
+import base64
+import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config.loggers import app_logger as logger
 from app.db.mongodb.collections import (
@@ -11,6 +13,14 @@ from app.models.notification.notification_models import (
     NotificationType,
     NotificationSourceEnum,
 )
+from app.utils.notification.counters import (
+    TOTAL_FIELD,
+    get_cached_counts,
+    increment_counts,
+    set_cached_counts,
+    status_transition_deltas,
+)
+from pymongo import ReturnDocument
 
 # class NotificationStorage(ABC):
 #     """Abstract storage interface"""
@@ -53,12 +63,31 @@ from app.models.notification.notification_models import (
 #         pass
 
 
+def encode_notification_cursor(created_at: datetime, notification_id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor string"""
+    payload = json.dumps({"t": created_at.isoformat(), "id": notification_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_notification_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_notification_cursor"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["t"]), str(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid notification cursor") from e
+
+
 class MongoDBNotificationStorage:
     """MongoDB storage implementation for notifications"""
 
     async def save_notification(self, notification: NotificationRecord) -> None:
         """Save a notification to MongoDB"""
         await notifications_collection.insert_one(notification.model_dump())
+        await increment_counts(
+            notification.user_id,
+            {TOTAL_FIELD: 1, notification.status.value: 1},
+        )
 
     async def get_notification(
         self, notification_id: str, user_id: str | None
@@ -82,6 +111,26 @@ class MongoDBNotificationStorage:
         # Debug logging
         logger.info(f"Updating notification {notification_id} with updates: {updates}")
 
+        if "status" in updates:
+            # Status changes need the previous status to keep counters in sync
+            new_status = NotificationStatus(updates["status"]).value
+            previous = await notifications_collection.find_one_and_update(
+                {"id": notification_id},
+                {"$set": updates},
+                projection={"_id": 0, "user_id": 1, "status": 1},
+                return_document=ReturnDocument.BEFORE,
+            )
+            if previous is None:
+                logger.warning(f"No notification found with id: {notification_id}")
+                return
+
+            await increment_counts(
+                previous["user_id"],
+                status_transition_deltas({previous["status"]: 1}, new_status),
+            )
+            logger.info(f"Successfully updated notification {notification_id}")
+            return
+
         result = await notifications_collection.update_one(
             {"id": notification_id}, {"$set": updates}
         )
@@ -98,6 +147,68 @@ class MongoDBNotificationStorage:
         else:
             logger.info(f"Successfully updated notification {notification_id}")
 
+    async def bulk_update_status(
+        self,
+        notification_ids: List[str],
+        user_id: str,
+        status: NotificationStatus,
+        updates: Dict[str, Any],
+    ) -> set[str]:
+        """
+        Move many of a user's notifications into ``status`` in one round trip.
+
+        A single projection query resolves which IDs belong to the user and their
+        current status, then one ``update_many`` applies the change. Notifications
+        already in ``status`` are left untouched so repeated bulk actions do not
+        rewrite timestamps.
+
+        Returns:
+            The subset of ``notification_ids`` that exist for the user
+        """
+        if not notification_ids:
+            return set()
+
+        cursor = notifications_collection.find(
+            {"id": {"$in": notification_ids}, "user_id": user_id},
+            {"_id": 0, "id": 1, "status": 1},
+        )
+        current_status = {doc["id"]: doc["status"] async for doc in cursor}
+
+        to_update = [
+            notification_id
+            for notification_id, current in current_status.items()
+            if current != status.value
+        ]
+        if to_update:
+            result = await notifications_collection.update_many(
+                {
+                    "id": {"$in": to_update},
+                    "user_id": user_id,
+                    "status": {"$ne": status.value},
+                },
+                {
+                    "$set": {
+                        **updates,
+                        "status": status.value,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+            )
+            logger.info(
+                f"Bulk update for user {user_id} - requested: {len(notification_ids)}, "
+                f"matched: {result.matched_count}, modified: {result.modified_count}"
+            )
+
+            transitions: Dict[str, int] = {}
+            for notification_id in to_update:
+                previous = current_status[notification_id]
+                transitions[previous] = transitions.get(previous, 0) + 1
+            await increment_counts(
+                user_id, status_transition_deltas(transitions, status.value)
+            )
+
+        return set(current_status)
+
     async def get_user_notifications(
         self,
         user_id: str,
@@ -107,9 +218,16 @@ class MongoDBNotificationStorage:
         channel_type: Optional[str] = None,
         notification_type: Optional[NotificationType] = None,
         source: Optional[NotificationSourceEnum] = None,
+        cursor: Optional[str] = None,
     ) -> List[NotificationRecord]:
-        """Get user's notifications with optional filtering"""
-        query = {"user_id": user_id}
+        """
+        Get user's notifications with optional filtering.
+
+        Results are ordered newest first by (created_at, id). When ``cursor`` is
+        given it takes precedence over ``offset`` and the page starts right after
+        the cursor position, which stays fast regardless of history size.
+        """
+        query: Dict[str, Any] = {"user_id": user_id}
         if status is not None:
             query["status"] = status
 
@@ -125,10 +243,20 @@ class MongoDBNotificationStorage:
         if source is not None:
             query["source"] = source
 
-        cursor = notifications_collection.find(query)
-        cursor = cursor.sort("created_at", -1).skip(offset).limit(limit)
+        if cursor is not None:
+            cursor_created_at, cursor_id = decode_notification_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": cursor_created_at}},
+                {"created_at": cursor_created_at, "id": {"$lt": cursor_id}},
+            ]
+            offset = 0
 
-        results = await cursor.to_list(length=limit)
+        db_cursor = notifications_collection.find(query)
+        db_cursor = (
+            db_cursor.sort([("created_at", -1), ("id", -1)]).skip(offset).limit(limit)
+        )
+
+        results = await db_cursor.to_list(length=limit)
         return [NotificationRecord.model_validate(doc) for doc in results]
 
     async def get_notification_count(
@@ -138,10 +266,31 @@ class MongoDBNotificationStorage:
         channel_type: Optional[str] = None,
     ) -> int:
         """Get count of notifications for a user with optional status filtering"""
-        query = {"user_id": user_id}
+        if channel_type is None:
+            # Served from the cached per-user counters
+            counts = await get_cached_counts(user_id)
+            if counts is None:
+                counts = await self.reconcile_notification_counts(user_id)
+            field = NotificationStatus(status).value if status else TOTAL_FIELD
+            return counts.get(field, 0)
+
+        query = {"user_id": user_id, "channels.channel_type": channel_type}
         if status is not None:
             query["status"] = status
-        if channel_type is not None:
-            query["channels.channel_type"] = channel_type
 
         return await notifications_collection.count_documents(query)
+
+    async def reconcile_notification_counts(self, user_id: str) -> Dict[str, int]:
+        """Recompute a user's counters from MongoDB and refresh the cache"""
+        pipeline = [
+            {"$match": {"user_id": user_id}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]
+        counts: Dict[str, int] = {}
+        async for row in notifications_collection.aggregate(pipeline):
+            if row["_id"] is not None:
+                counts[str(row["_id"])] = row["count"]
+        counts[TOTAL_FIELD] = sum(counts.values())
+
+        await set_cached_counts(user_id, counts)
+        return counts
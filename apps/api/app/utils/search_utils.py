@@ -1,18 +1,34 @@
+import asyncio
+from functools import partial
 from typing import Optional
 
 from app.config.loggers import search_logger as logger
 from app.config.settings import settings
 from app.constants.cache import ONE_HOUR_TTL
+from app.constants.search import (
+    FIRECRAWL_MAX_CONCURRENCY,
+    FIRECRAWL_TIMEOUT,
+    SEARCH_CACHE_STALE_TTL,
+    TAVILY_MAX_CONCURRENCY,
+    TAVILY_TIMEOUT,
+)
 from app.decorators.caching import Cacheable
 from app.utils.exceptions import FetchError
+from app.utils.executor_utils import create_bounded_executor, run_blocking
 from firecrawl import FirecrawlApp
 from langgraph.config import get_stream_writer
+from langgraph.types import StreamWriter
 from tavily import TavilyClient
 
 # Initialize clients with lazy loading
 _tavily_client = None
 _firecrawl_client = None
 
+# Both SDKs are synchronous; their calls run on bounded per-provider pools so
+# a search or scrape never blocks the event loop
+_tavily_executor = create_bounded_executor("tavily", TAVILY_MAX_CONCURRENCY)
+_firecrawl_executor = create_bounded_executor("firecrawl", FIRECRAWL_MAX_CONCURRENCY)
+
 
 def get_tavily_client() -> TavilyClient:
     """Get or create Tavily client instance with lazy loading."""
@@ -36,10 +52,23 @@ def get_firecrawl_client() -> FirecrawlApp:
     return _firecrawl_client
 
 
+def get_progress_writer() -> StreamWriter:
+    """
+    Get the graph's stream writer, or a no-op outside a graph run (e.g. a
+    direct API call or a background cache refresh).
+    """
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda chunk: None
+
+
 @Cacheable(
     key_pattern="tavily:{search_topic}:{query}:{count}:{extra_params}",
     ttl=ONE_HOUR_TTL,
     namespace="search",
+    single_flight=True,
+    stale_ttl=SEARCH_CACHE_STALE_TTL,
 )
 async def fetch_tavily_search(
     query: str,
@@ -76,16 +105,29 @@ async def fetch_tavily_search(
             search_params.update(extra_params)
 
         # Perform the search
-        result = tavily.search(**search_params)
+        result = await run_blocking(
+            _tavily_executor,
+            partial(tavily.search, **search_params),
+            timeout=TAVILY_TIMEOUT,
+        )
         logger.info(f"Fetched Tavily search results for query: {query}")
 
         return result
+    except asyncio.TimeoutError:
+        logger.error(f"Tavily search timed out after {TAVILY_TIMEOUT}s: {query}")
+        return {}
     except Exception as e:
         logger.error(f"Error calling Tavily API: {e}")
         return {}
 
 
-@Cacheable(key_pattern="search:{query}:{count}", ttl=ONE_HOUR_TTL, namespace="search")
+@Cacheable(
+    key_pattern="search:{query}:{count}",
+    ttl=ONE_HOUR_TTL,
+    namespace="search",
+    single_flight=True,
+    stale_ttl=SEARCH_CACHE_STALE_TTL,
+)
 async def perform_search(query: str, count: int) -> dict:
     """
     Perform Tavily search and return comprehensive results.
@@ -129,7 +171,11 @@ async def perform_search(query: str, count: int) -> dict:
 
 
 @Cacheable(
-    key_pattern="firecrawl:{url}:{use_stealth}", ttl=ONE_HOUR_TTL, namespace="web"
+    key_pattern="firecrawl:{url}:{use_stealth}",
+    ttl=ONE_HOUR_TTL,
+    namespace="web",
+    single_flight=True,
+    stale_ttl=SEARCH_CACHE_STALE_TTL,
 )
 async def fetch_with_firecrawl(url: str, use_stealth: bool = False) -> str:
     """
@@ -143,14 +189,18 @@ async def fetch_with_firecrawl(url: str, use_stealth: bool = False) -> str:
         The scraped content in markdown format
     """
     try:
-        writer = get_stream_writer()
+        writer = get_progress_writer()
         writer({"progress": f"Fetching URL with Firecrawl: {url[:50]}..."})
 
         app = get_firecrawl_client()
 
         # First try with normal mode
         try:
-            result = app.scrape(url, formats=["markdown"])
+            result = await run_blocking(
+                _firecrawl_executor,
+                partial(app.scrape, url, formats=["markdown"]),
+                timeout=FIRECRAWL_TIMEOUT,
+            )
 
             # Handle the response - Firecrawl SDK returns a Document object
             if result and hasattr(result, "markdown") and result.markdown:
@@ -159,6 +209,11 @@ async def fetch_with_firecrawl(url: str, use_stealth: bool = False) -> str:
             else:
                 raise FetchError("No markdown content returned from Firecrawl", url=url)
 
+        except asyncio.TimeoutError as e:
+            # The time budget is spent; don't start a stealth retry on top
+            raise FetchError(
+                f"Firecrawl timed out after {FIRECRAWL_TIMEOUT}s", url=url
+            ) from e
         except Exception as e:
             # If normal mode fails and we haven't tried stealth yet, retry with stealth
             if not use_stealth:
@@ -174,7 +229,11 @@ async def fetch_with_firecrawl(url: str, use_stealth: bool = False) -> str:
                     )
 
                     # Retry with stealth mode - use proxy parameter
-                    result = app.scrape(url, formats=["markdown"], proxy="stealth")
+                    result = await run_blocking(
+                        _firecrawl_executor,
+                        partial(app.scrape, url, formats=["markdown"], proxy="stealth"),
+                        timeout=FIRECRAWL_TIMEOUT,
+                    )
 
                     if result and hasattr(result, "markdown") and result.markdown:
                         writer(
@@ -1,54 +1,93 @@
-from arq import cron
+from arq import cron, func
 
+from app.constants.files import FILE_INGESTION_JOB_TIMEOUT
+from app.constants.scheduler import SCHEDULER_ENQUEUE_SCAN_MINUTES
+from app.core.loop_monitor import track_loop_lag
 from app.workers.config.worker_settings import WorkerSettings
 from app.workers.lifecycle import shutdown, startup
 from app.workers.tasks import (
     check_inactive_users,
     cleanup_expired_reminders,
     cleanup_stuck_personalization,
+    enqueue_scheduled_tasks,
     execute_workflow_by_id,
+    flush_memory_buffers,
     generate_workflow_steps,
+    process_file_ingestion,
     process_gmail_emails_to_memory,
     process_personalization_task,
     process_reminder,
     process_workflow_generation_task,
+    prune_old_checkpoints,
     store_memories_batch,
     regenerate_workflow_steps,
+    resume_file_ingestions,
 )
 
-# Configure the worker settings with all task functions and lifecycle hooks
+# Configure the worker settings with all task functions and lifecycle hooks.
+# track_loop_lag attributes event-loop lag per task when ENABLE_LOOP_MONITOR is
+# set and keeps each function's name, so job names are unchanged.
 WorkerSettings.functions = [
-    process_reminder,
-    cleanup_expired_reminders,
-    check_inactive_users,
-    process_workflow_generation_task,
-    execute_workflow_by_id,
-    regenerate_workflow_steps,
-    generate_workflow_steps,
-    process_gmail_emails_to_memory,
-    process_personalization_task,
-    store_memories_batch,
-    cleanup_stuck_personalization,
+    track_loop_lag(process_reminder),
+    track_loop_lag(cleanup_expired_reminders),
+    track_loop_lag(enqueue_scheduled_tasks),
+    track_loop_lag(check_inactive_users),
+    track_loop_lag(process_workflow_generation_task),
+    track_loop_lag(execute_workflow_by_id),
+    track_loop_lag(regenerate_workflow_steps),
+    track_loop_lag(generate_workflow_steps),
+    track_loop_lag(process_gmail_emails_to_memory),
+    track_loop_lag(process_personalization_task),
+    track_loop_lag(store_memories_batch),
+    track_loop_lag(cleanup_stuck_personalization),
+    track_loop_lag(flush_memory_buffers),
+    track_loop_lag(prune_old_checkpoints),
+    func(
+        track_loop_lag(process_file_ingestion),
+        timeout=FILE_INGESTION_JOB_TIMEOUT,
+    ),
+    track_loop_lag(resume_file_ingestions),
 ]
 
 WorkerSettings.cron_jobs = [
     cron(
-        cleanup_expired_reminders,
+        track_loop_lag(cleanup_expired_reminders),
         hour=0,  # At midnight
         minute=0,
         second=0,
     ),
     cron(
-        check_inactive_users,
+        track_loop_lag(check_inactive_users),
         hour=9,  # At 9 AM
         minute=0,
         second=0,
     ),
     cron(
-        cleanup_stuck_personalization,
+        track_loop_lag(cleanup_stuck_personalization),
         minute={0, 30},  # Every 30 minutes
         second=0,
     ),
+    cron(
+        track_loop_lag(enqueue_scheduled_tasks),
+        minute=SCHEDULER_ENQUEUE_SCAN_MINUTES,  # Every 5 minutes
+        second=0,
+    ),
+    cron(
+        track_loop_lag(prune_old_checkpoints),
+        hour=3,  # At 3 AM, off-peak
+        minute=0,
+        second=0,
+        timeout=3_600,  # The first runs may work through a large backlog
+    ),
+    cron(
+        track_loop_lag(flush_memory_buffers),
+        second=30,  # Every minute
+    ),
+    cron(
+        track_loop_lag(resume_file_ingestions),
+        minute={5, 15, 25, 35, 45, 55},  # Every 10 minutes
+        second=0,
+    ),
 ]
 
 WorkerSettings.on_startup = startup
@@ -2,11 +2,14 @@
 Task modules for ARQ worker.
 """
 
+from .checkpoint_tasks import prune_old_checkpoints
 from .cleanup_tasks import cleanup_stuck_personalization
+from .file_tasks import process_file_ingestion, resume_file_ingestions
 from .memory_email_tasks import process_gmail_emails_to_memory
-from .memory_tasks import store_memories_batch
+from .memory_tasks import flush_memory_buffers, store_memories_batch
 from .onboarding_tasks import process_personalization_task
 from .reminder_tasks import cleanup_expired_reminders, process_reminder
+from .scheduler_tasks import enqueue_scheduled_tasks
 from .user_tasks import check_inactive_users
 from .workflow_tasks import (
     execute_workflow_as_chat,
@@ -20,8 +23,10 @@ __all__ = [
     "process_gmail_emails_to_memory",
     "process_personalization_task",
     "store_memories_batch",
+    "flush_memory_buffers",
     "process_reminder",
     "cleanup_expired_reminders",
+    "enqueue_scheduled_tasks",
     "check_inactive_users",
     "process_workflow_generation_task",
     "execute_workflow_by_id",
@@ -29,4 +34,7 @@ __all__ = [
     "regenerate_workflow_steps",
     "execute_workflow_as_chat",
     "cleanup_stuck_personalization",
+    "prune_old_checkpoints",
+    "process_file_ingestion",
+    "resume_file_ingestions",
 ]
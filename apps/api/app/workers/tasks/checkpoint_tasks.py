@@ -0,0 +1,33 @@
+"""ARQ worker tasks for LangGraph checkpoint maintenance."""
+
+from app.agents.core.graph_builder.checkpoint_pruning import prune_checkpoints
+from app.agents.core.graph_builder.checkpointer_manager import get_checkpointer_manager
+from app.config.loggers import arq_worker_logger as logger
+from app.constants.postgres import CHECKPOINT_KEEP_LATEST
+
+
+async def prune_old_checkpoints(
+    ctx: dict, keep_latest: int = CHECKPOINT_KEEP_LATEST
+) -> str:
+    """
+    Delete all but the newest checkpoints of every conversation thread.
+
+    Args:
+        ctx: ARQ context
+        keep_latest: Checkpoints kept per thread and namespace
+
+    Returns:
+        Processing result message
+    """
+    try:
+        manager = await get_checkpointer_manager()
+        result = await prune_checkpoints(manager.pool, keep_latest=keep_latest)
+        return (
+            f"Pruned {result.threads} threads: reclaimed {result.rows} rows "
+            f"({result.checkpoints} checkpoints, {result.writes} writes, "
+            f"{result.blobs} blobs)"
+        )
+    except Exception as e:
+        error_msg = f"Error pruning checkpoints: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
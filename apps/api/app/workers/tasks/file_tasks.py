@@ -0,0 +1,141 @@
+"""ARQ worker tasks for ingesting uploaded files."""
+
+from datetime import datetime, timedelta, timezone
+
+from app.config.loggers import arq_worker_logger as logger
+from app.constants.files import (
+    FILE_INGESTION_MAX_RESUMES,
+    FILE_INGESTION_RESUME_LIMIT,
+    FILE_INGESTION_STALE_MINUTES,
+)
+from app.db.mongodb.collections import file_contents_collection, files_collection
+from app.models.files_models import FileStatus
+from app.services.file_ingestion_service import (
+    ContentDeletedError,
+    run_file_ingestion,
+)
+from app.services.file_service import queue_file_ingestion
+
+
+async def process_file_ingestion(ctx: dict, content_hash: str) -> str:
+    """
+    Parse, summarize and embed uploaded content, resuming at its last stage,
+    then index every file referencing it.
+
+    Args:
+        ctx: ARQ context
+        content_hash: Key of the uploaded content (``{user_id}:{sha256}``)
+
+    Returns:
+        Processing result message
+    """
+    try:
+        linked = await run_file_ingestion(content_hash)
+        return f"Content {content_hash} indexed for {linked} files"
+    except ContentDeletedError:
+        return f"Content {content_hash} was deleted during ingestion"
+    except Exception as e:
+        error_msg = f"Error ingesting content {content_hash}: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
+
+
+async def resume_file_ingestions(ctx: dict) -> str:
+    """
+    Re-queue ingestion of files that stalled (crashed, timed out or never queued).
+
+    Jobs run per content, so stalled files are grouped by their content hash
+    and each content resumes at its last finished stage. A content that stalls
+    more than FILE_INGESTION_MAX_RESUMES times is marked failed along with its
+    files instead.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Processing result message
+    """
+    try:
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(minutes=FILE_INGESTION_STALE_MINUTES)
+        stale_files = await files_collection.find(
+            {"status": FileStatus.PROCESSING, "updated_at": {"$lt": cutoff}},
+            {"content_hash": 1},
+        ).to_list(length=FILE_INGESTION_RESUME_LIMIT)
+
+        content_hashes = {
+            file["content_hash"] for file in stale_files if file.get("content_hash")
+        }
+        if not content_hashes:
+            return "No stalled file ingestions"
+
+        resumed = failed = 0
+        for content_hash in content_hashes:
+            content = await file_contents_collection.find_one(
+                {"_id": content_hash}, {"status": 1, "ingestion": 1}
+            )
+            ingestion = (content or {}).get("ingestion", {})
+
+            # Still making progress, just slowly
+            if (
+                content
+                and content["status"] == FileStatus.PROCESSING
+                and ingestion["updated_at"].replace(tzinfo=timezone.utc) >= cutoff
+            ):
+                continue
+
+            files_filter = {
+                "content_hash": content_hash,
+                "status": FileStatus.PROCESSING,
+            }
+            if not content or ingestion.get("resumes", 0) >= FILE_INGESTION_MAX_RESUMES:
+                error = "Ingestion stalled too many times"
+                if content:
+                    await file_contents_collection.update_one(
+                        {"_id": content_hash, "status": FileStatus.PROCESSING},
+                        {
+                            "$set": {
+                                "status": FileStatus.FAILED,
+                                "ingestion.error": error,
+                                "ingestion.updated_at": now,
+                            }
+                        },
+                    )
+                await files_collection.update_many(
+                    files_filter,
+                    {
+                        "$set": {
+                            "status": FileStatus.FAILED,
+                            "error": error,
+                            "updated_at": now,
+                        }
+                    },
+                )
+                failed += 1
+                continue
+
+            # Bumping updated_at keeps the next sweep from queuing it again
+            # while this job runs
+            await file_contents_collection.update_one(
+                {"_id": content_hash},
+                {
+                    "$inc": {"ingestion.resumes": 1},
+                    "$set": {"ingestion.updated_at": now},
+                },
+            )
+            await files_collection.update_many(
+                files_filter, {"$set": {"updated_at": now}}
+            )
+            await queue_file_ingestion(content_hash)
+            logger.info(
+                f"Resuming stalled ingestion of content {content_hash} "
+                f"at {ingestion.get('stage')}"
+            )
+            resumed += 1
+
+        return f"Resumed {resumed} stalled file ingestions, marked {failed} failed"
+
+    except Exception as e:
+        error_msg = f"Error resuming file ingestions: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return error_msg
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Dict, List
 
 from app.config.loggers import arq_worker_logger as logger
+from app.services.memory_buffer_service import memory_write_buffer
 from app.services.memory_service import memory_service
 
 
@@ -135,3 +136,25 @@ Example: "User works as Software Engineer at Acme Corp", "User's email is john@e
         error_msg = f"Error in batch memory processing for user {user_id}: {str(e)}"
         logger.error(error_msg)
         return error_msg
+
+
+async def flush_memory_buffers(ctx: dict) -> str:
+    """
+    Flush buffered chat memories that are due.
+
+    Picks up buffers that reached MEMORY_BUFFER_MAX_AGE, failed flushes waiting
+    for a retry, and flushes interrupted by a crash.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Processing result message
+    """
+    try:
+        stored = await memory_write_buffer.sweep()
+        return f"Flushed {stored} buffered memories"
+    except Exception as e:
+        error_msg = f"Error flushing memory buffers: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
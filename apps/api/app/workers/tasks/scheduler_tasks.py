@@ -0,0 +1,31 @@
+"""
+Scheduler-related ARQ tasks.
+"""
+
+from app.config.loggers import arq_worker_logger as logger
+from app.services.reminder_service import reminder_scheduler
+from app.services.workflow.scheduler import workflow_scheduler
+
+
+async def enqueue_scheduled_tasks(ctx: dict) -> str:
+    """
+    Enqueue reminders and workflows that are now within the lookahead window.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Enqueue result message
+    """
+    try:
+        reminder_count = await reminder_scheduler.scan_and_schedule_pending_tasks()
+        workflow_count = await workflow_scheduler.scan_and_schedule_pending_tasks()
+
+        message = f"Enqueued {reminder_count} reminders and {workflow_count} workflows"
+        logger.info(message)
+        return message
+
+    except Exception as e:
+        error_msg = f"Failed to enqueue scheduled tasks: {str(e)}"
+        logger.error(error_msg)
+        raise
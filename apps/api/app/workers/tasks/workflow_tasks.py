@@ -224,19 +224,29 @@ async def execute_workflow_by_id(
 ) -> str:
     """
     Execute a workflow by ID with proper execution count tracking.
+
+    Jobs enqueued by the scheduler carry no context. They claim the workflow
+    first, so duplicate jobs for the same occurrence don't run it twice, and
+    afterwards schedule its next occurrence (or complete it). Manual and
+    trigger runs execute the workflow regardless of its schedule.
     """
     logger.info(f"Processing workflow execution: {workflow_id}")
 
     scheduler = WorkflowScheduler()
     workflow = None
     execution_messages = []
+    scheduled_run = context is None
 
     try:
         await scheduler.initialize()
-        workflow = await scheduler.get_task(workflow_id)
-
-        if not workflow:
-            return f"Workflow {workflow_id} not found"
+        if scheduled_run:
+            workflow = await scheduler.claim_due_task(workflow_id)
+            if not workflow:
+                return f"Workflow {workflow_id} is not due for execution"
+        else:
+            workflow = await scheduler.get_task(workflow_id)
+            if not workflow:
+                return f"Workflow {workflow_id} not found"
 
         # Execute the workflow
         execution_messages = await execute_workflow_as_chat(
@@ -279,6 +289,13 @@ async def execute_workflow_by_id(
         return f"Error executing workflow {workflow_id}: {str(e)}"
 
     finally:
+        # A failed run still moves a recurring workflow on to its next
+        # occurrence; failures are tracked in its execution stats
+        if scheduled_run and workflow:
+            try:
+                await scheduler.complete_task_occurrence(workflow)
+            except Exception as e:
+                logger.error(f"Failed to schedule next run of {workflow_id}: {e}")
         if scheduler:
             await scheduler.close()
 
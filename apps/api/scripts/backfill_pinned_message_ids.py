@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Backfill the denormalized ``pinned_message_ids`` array on conversations.
+
+get_starred_messages only reads conversations whose ``pinned_message_ids`` is
+non-empty; pin_message maintains it from now on. Run this once so messages
+pinned before the array existed keep showing up.
+
+Run from the api directory:
+    python scripts/backfill_pinned_message_ids.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path so we can import from app
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.config.loggers import general_logger as logger  # noqa: E402
+from app.db.mongodb.collections import conversations_collection  # noqa: E402
+from app.db.mongodb.mongodb import init_mongodb  # noqa: E402
+
+
+async def backfill_pinned_message_ids() -> int:
+    """Rebuild ``pinned_message_ids`` from the embedded messages' pinned flags."""
+    result = await conversations_collection.update_many(
+        {"messages.pinned": True},
+        [
+            {
+                "$set": {
+                    "pinned_message_ids": {
+                        "$map": {
+                            "input": {
+                                "$filter": {
+                                    "input": "$messages",
+                                    "cond": {"$eq": ["$$this.pinned", True]},
+                                }
+                            },
+                            "in": "$$this.message_id",
+                        }
+                    }
+                }
+            }
+        ],
+    )
+    return result.modified_count
+
+
+async def main():
+    init_mongodb()
+
+    modified = await backfill_pinned_message_ids()
+    logger.info(f"Backfilled pinned_message_ids on {modified} conversations")
+    print(f"Backfilled pinned_message_ids on {modified} conversations")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
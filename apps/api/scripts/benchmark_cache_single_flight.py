@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Measure upstream calls made by Cacheable under concurrent load.
+
+Starts a local fake provider that counts requests and answers after a fixed
+delay, then runs several worker processes, each issuing concurrent calls to a
+Cacheable-wrapped function that fetches from it. Compares:
+
+- plain:          Cacheable as before, cold key
+- single_flight:  single_flight=True, cold key
+- stale:          single_flight=True with stale_ttl, entry past its ttl
+
+Requires REDIS_URL (cross-process single-flight and stale entries live in
+Redis). Run from the api directory:
+    python scripts/benchmark_cache_single_flight.py [--processes 4] [--concurrency 25]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+# Add the backend directory to Python path so we can import from app
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.db.redis import delete_cache  # noqa: E402
+from app.decorators.caching import Cacheable  # noqa: E402
+
+# Short ttl so the stale scenario can let an entry expire
+TTL = 1
+STALE_TTL = 60
+
+
+class FakeProvider:
+    """Local HTTP server that counts requests and answers after ``delay``."""
+
+    def __init__(self, delay: float) -> None:
+        self.hits = 0
+        lock = threading.Lock()
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with lock:
+                    provider.hits += 1
+                time.sleep(delay)
+                body = b'{"results": ["fake"]}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+async def _fetch(url: str, query: str) -> dict:
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, params={"q": query})
+        return response.json()
+
+
+@Cacheable(key_pattern="benchmark:plain:{query}", ttl=TTL)
+async def plain_search(url: str, query: str) -> dict:
+    return await _fetch(url, query)
+
+
+@Cacheable(key_pattern="benchmark:single_flight:{query}", ttl=TTL, single_flight=True)
+async def single_flight_search(url: str, query: str) -> dict:
+    return await _fetch(url, query)
+
+
+@Cacheable(
+    key_pattern="benchmark:stale:{query}",
+    ttl=TTL,
+    single_flight=True,
+    stale_ttl=STALE_TTL,
+)
+async def stale_search(url: str, query: str) -> dict:
+    return await _fetch(url, query)
+
+
+SCENARIOS = {
+    "plain": plain_search,
+    "single_flight": single_flight_search,
+    "stale": stale_search,
+}
+
+
+def run_worker(scenario: str, url: str, query: str, concurrency: int) -> list[float]:
+    """Issue ``concurrency`` concurrent calls; returns per-call latency in ms."""
+
+    async def timed_call() -> float:
+        start = time.perf_counter()
+        await SCENARIOS[scenario](url, query)
+        return (time.perf_counter() - start) * 1000
+
+    async def main() -> list[float]:
+        latencies = await asyncio.gather(*(timed_call() for _ in range(concurrency)))
+        # Let background refreshes finish before the process exits
+        await asyncio.sleep(1)
+        return list(latencies)
+
+    return asyncio.run(main())
+
+
+async def cleanup(query: str) -> None:
+    for scenario in SCENARIOS:
+        await delete_cache(f"benchmark:{scenario}:{query}*")
+
+
+def main(processes: int, concurrency: int, delay: float) -> None:
+    provider = FakeProvider(delay)
+    query = uuid.uuid4().hex[:8]
+    print(
+        f"{processes} processes x {concurrency} concurrent calls, "
+        f"provider delay {delay}s"
+    )
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for scenario in SCENARIOS:
+            if scenario == "stale":
+                # Populate the entry, then let it go stale
+                pool.submit(run_worker, scenario, provider.url, query, 1).result()
+                time.sleep(TTL + 0.5)
+
+            provider.hits = 0
+            futures = [
+                pool.submit(run_worker, scenario, provider.url, query, concurrency)
+                for _ in range(processes)
+            ]
+            latencies = sorted(ms for f in futures for ms in f.result())
+            print(
+                f"{scenario:<14} upstream_calls={provider.hits:<4} "
+                f"latency p50={statistics.median(latencies):7.1f}ms "
+                f"max={latencies[-1]:7.1f}ms"
+            )
+
+    asyncio.run(cleanup(query))
+    provider.server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=25)
+    parser.add_argument("--delay", type=float, default=0.5)
+    args = parser.parse_args()
+    main(args.processes, args.concurrency, args.delay)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark near-duplicate email detection used in profile extraction.
+
+Builds synthetic inboxes of templated platform notifications (with varying
+names, numbers and URLs, light edits, and some one-off messages) and runs
+both the previous pairwise SequenceMatcher scan and the current
+``_deduplicate_emails`` on them, reporting runtime and whether the kept
+emails agree.
+
+The pairwise scan is quadratic, so larger inboxes such as 10000 are opt-in
+via --sizes.
+
+Run from the api directory:
+    python scripts/benchmark_email_dedup.py [--sizes 100 1000 10000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List
+
+# Add the backend directory to Python path so we can import from app
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.agents.memory.profile_extractor import _deduplicate_emails  # noqa: E402
+from app.constants.general import DEDUPLICATION_SIMILARITY_THRESHOLD  # noqa: E402
+
+WORDS = (
+    "activity account added alert another approved assigned branch build "
+    "changes checks comment commit connection contribution deploy discussion "
+    "event failed feature follow invitation issue job latest mention merged "
+    "message milestone network notification opened post profile project pull "
+    "release reply repository request review security settings shared star "
+    "started status subscribed summary team thread update viewed weekly"
+).split()
+NAMES = ["alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi"]
+TEMPLATE_COUNT = 60
+UNIQUE_FRACTION = 0.01
+EDIT_FRACTION = 0.3
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def build_inbox(size: int, seed: int = 7) -> List[Dict]:
+    """Synthetic platform emails: mostly filled-in templates, some one-offs."""
+    rng = random.Random(seed)
+    templates = [
+        " ".join(
+            _sentence(rng, rng.randint(6, 12)) + " {name} {number} {url}."
+            for _ in range(rng.randint(1, 3))
+        )
+        for _ in range(TEMPLATE_COUNT)
+    ]
+
+    emails = []
+    for i in range(size):
+        if rng.random() < UNIQUE_FRACTION:
+            text = _sentence(rng, rng.randint(15, 60))
+        else:
+            text = rng.choice(templates).format(
+                name=rng.choice(NAMES),
+                number=rng.randint(1, 99999),
+                url=f"https://example.com/{rng.randint(1, 10**6)}",
+            )
+            if rng.random() < EDIT_FRACTION:
+                # A light edit: swap one word for another
+                words = text.split()
+                words[rng.randrange(len(words))] = rng.choice(WORDS)
+                text = " ".join(words)
+        emails.append({"id": str(i), "messageText": text})
+    return emails
+
+
+def pairwise_deduplicate(emails: List[Dict]) -> List[Dict]:
+    """The previous implementation: compare against every kept email."""
+
+    def normalize_content(text: str) -> str:
+        text = re.sub(r"\d+", "", text)
+        text = re.sub(r"https?://\S+", "", text)
+        text = re.sub(r"\S+@\S+", "", text)
+        text = re.sub(r"\s+", " ", text)
+        text = re.sub(r"[^\w\s]", "", text)
+        return text.strip().lower()
+
+    unique_emails = []
+    normalized_bodies: List[str] = []
+    for email in emails:
+        content = email.get("messageText", "").strip()
+        if not content:
+            continue
+        normalized = normalize_content(content)
+        if not normalized:
+            continue
+        if not any(
+            SequenceMatcher(None, normalized, existing).ratio()
+            >= DEDUPLICATION_SIMILARITY_THRESHOLD
+            for existing in normalized_bodies
+        ):
+            normalized_bodies.append(normalized)
+            unique_emails.append(email)
+    return unique_emails if unique_emails else emails
+
+
+def main(sizes: List[int]) -> None:
+    for size in sizes:
+        emails = build_inbox(size)
+
+        start = time.perf_counter()
+        expected = pairwise_deduplicate(emails)
+        pairwise_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = _deduplicate_emails(emails)
+        indexed_time = time.perf_counter() - start
+
+        expected_ids = {email["id"] for email in expected}
+        actual_ids = {email["id"] for email in actual}
+        print(
+            f"n={size:<6} kept pairwise={len(expected_ids):<5} "
+            f"indexed={len(actual_ids):<5} "
+            f"missed_duplicates={len(actual_ids - expected_ids):<3} "
+            f"extra_drops={len(expected_ids - actual_ids):<3} "
+            f"pairwise={pairwise_time:8.2f}s indexed={indexed_time:6.2f}s "
+            f"speedup={pairwise_time / indexed_time:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+    main(args.sizes)
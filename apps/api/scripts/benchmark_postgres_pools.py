@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Load-test the SQLAlchemy Postgres pool at several sizes.
+
+Runs ``--concurrency`` tasks that each repeatedly check out a connection and
+run a short query (``pg_sleep`` standing in for a checkpoint read/write) on an
+engine built like ``init_postgresql_engine``, once per pool size. Reports
+throughput, time spent waiting for a connection and query latency, showing
+where throughput saturates and pool wait starts to dominate latency.
+
+Requires POSTGRES_URL. Run from the api directory:
+    python scripts/benchmark_postgres_pools.py [--sizes 2 5 10 20 40] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Add the backend directory to Python path so we can import from app
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.config.settings import settings  # noqa: E402
+from app.db.pool_metrics import TimedAsyncAdaptedQueuePool  # noqa: E402
+
+
+def p95(values: list[float]) -> float:
+    values = sorted(values)
+    return values[int(len(values) * 0.95) - 1] if len(values) > 1 else values[0]
+
+
+async def run(
+    url: str, pool_size: int, concurrency: int, duration: float, query_ms: float
+) -> None:
+    engine = create_async_engine(
+        url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    waits: list[float] = []
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                async with engine.connect() as connection:
+                    acquired = time.perf_counter()
+                    await connection.execute(
+                        text("SELECT pg_sleep(:seconds)"), {"seconds": query_ms / 1000}
+                    )
+            except Exception:
+                errors += 1
+                continue
+            end = time.perf_counter()
+            waits.append((acquired - start) * 1000)
+            latencies.append((end - start) * 1000)
+
+    # Open the pool before timing
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    await engine.dispose()
+
+    if not latencies:
+        print(f"pool_size={pool_size:<4} no successful queries, errors={errors}")
+        return
+
+    wait_share = sum(waits) / sum(latencies)
+    print(
+        f"pool_size={pool_size:<4} throughput={len(latencies) / duration:8.1f} q/s  "
+        f"wait p50={statistics.median(waits):7.1f}ms p95={p95(waits):7.1f}ms  "
+        f"latency p95={p95(latencies):7.1f}ms  wait_share={wait_share:5.0%}  "
+        f"errors={errors}"
+    )
+
+
+async def main(
+    sizes: list[int], concurrency: int, duration: float, query_ms: float
+) -> None:
+    if not settings.POSTGRES_URL:
+        sys.exit("POSTGRES_URL is not set")
+    url = settings.POSTGRES_URL.replace("postgresql://", "postgresql+asyncpg://")
+
+    print(
+        f"{concurrency} concurrent clients, {query_ms}ms queries, "
+        f"{duration}s per pool size"
+    )
+    for pool_size in sizes:
+        await run(url, pool_size, concurrency, duration, query_ms)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 5, 10, 20, 40])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--query-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.concurrency, args.duration, args.query_ms))
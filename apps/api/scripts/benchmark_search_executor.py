@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark blocking provider SDK calls vs. bounded executors.
+
+Starts a local fake provider that answers after a fixed delay and issues
+concurrent ``fetch_tavily_search`` and ``fetch_with_firecrawl`` calls against
+it. The SDK clients are replaced with stand-ins that make the same kind of
+synchronous HTTP call to the fake provider, and Cacheable is bypassed so every
+call reaches it. Compares running the SDK call inline in ``async def`` code
+(the old behaviour) with the current ``run_blocking`` on a bounded executor,
+reporting wall time, throughput and event-loop lag measured by a heartbeat
+task.
+
+Run from the api directory:
+    python scripts/benchmark_search_executor.py [--requests 16] [--delay 0.2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import requests
+
+# Add the backend directory to Python path so we can import from app
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.utils import search_utils  # noqa: E402
+from app.utils.executor_utils import create_bounded_executor, run_blocking  # noqa: E402
+
+HEARTBEAT_INTERVAL = 0.01
+
+
+def start_fake_provider(delay: float) -> ThreadingHTTPServer:
+    """Serve a JSON response after ``delay`` seconds on a random local port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(delay)
+            body = b'{"results": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append((time.perf_counter() - start - HEARTBEAT_INTERVAL) * 1000)
+
+
+class FakeTavilyClient:
+    """Stands in for TavilyClient, searching the fake provider synchronously."""
+
+    def __init__(self, session: requests.Session, url: str) -> None:
+        self.session = session
+        self.url = url
+
+    def search(self, **params) -> dict:
+        return self.session.get(self.url, params=params, timeout=10).json()
+
+
+class FakeFirecrawlClient:
+    """Stands in for FirecrawlApp, scraping the fake provider synchronously."""
+
+    def __init__(self, session: requests.Session, url: str) -> None:
+        self.session = session
+        self.url = url
+
+    def scrape(self, url: str, **params) -> SimpleNamespace:
+        response = self.session.get(self.url, params={"url": url}, timeout=10)
+        return SimpleNamespace(markdown=response.text)
+
+
+async def run_inline(executor, func, *args, timeout=None):
+    """The old behaviour: call the SDK directly on the event loop."""
+    return func(*args)
+
+
+async def run_scenario(name: str, search, count: int) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(search() for _ in range(count)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+    lags.sort()
+    p95 = lags[int(len(lags) * 0.95) - 1] if len(lags) > 1 else lags[0]
+    print(
+        f"{name:<20} wall={elapsed:6.2f}s  throughput={count / elapsed:6.1f} req/s  "
+        f"loop_lag max={lags[-1]:7.1f}ms p95={p95:7.1f}ms "
+        f"median={statistics.median(lags):6.1f}ms"
+    )
+
+
+async def main(count: int, delay: float, workers: int) -> None:
+    server = start_fake_provider(delay)
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    session = requests.Session()
+
+    search_utils._tavily_client = FakeTavilyClient(session, url)
+    search_utils._firecrawl_client = FakeFirecrawlClient(session, url)
+    search_utils._tavily_executor = create_bounded_executor("tavily", workers)
+    search_utils._firecrawl_executor = create_bounded_executor("firecrawl", workers)
+
+    # Skip Cacheable so every call reaches the provider
+    fetch_tavily_search = search_utils.fetch_tavily_search.__wrapped__
+    fetch_with_firecrawl = search_utils.fetch_with_firecrawl.__wrapped__
+
+    async def tavily_search():
+        return await fetch_tavily_search(uuid.uuid4().hex, 5)
+
+    async def firecrawl_fetch():
+        return await fetch_with_firecrawl(f"https://example.com/{uuid.uuid4().hex}")
+
+    print(f"{count} concurrent calls, provider delay {delay}s, {workers} workers")
+    for mode, runner in (("before", run_inline), ("after", run_blocking)):
+        search_utils.run_blocking = runner
+        await run_scenario(f"tavily {mode}", tavily_search, count)
+        await run_scenario(f"firecrawl {mode}", firecrawl_fetch, count)
+
+    search_utils._tavily_executor.shutdown()
+    search_utils._firecrawl_executor.shutdown()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.delay, args.workers))
@@ -0,0 +1,56 @@
+"""
+Pytest fixtures for agent tests.
+
+Provides:
+- checkpoint_pool: psycopg pool on a throwaway schema with the LangGraph
+  checkpoint tables, like the pool CheckpointerManager opens
+
+Requires a Postgres database in TEST_POSTGRES_URL; tests using these fixtures
+are skipped without one.
+
+Usage:
+    TEST_POSTGRES_URL=postgresql://localhost/postgres pytest tests/agents -v
+"""
+
+import os
+import uuid
+from typing import AsyncIterator
+
+import psycopg
+import pytest
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg_pool import AsyncConnectionPool
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+async def checkpoint_pool() -> AsyncIterator[AsyncConnectionPool]:
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    schema = f"test_checkpoints_{uuid.uuid4().hex[:12]}"
+    async with await psycopg.AsyncConnection.connect(
+        TEST_POSTGRES_URL, autocommit=True
+    ) as conn:
+        await conn.execute(f'CREATE SCHEMA "{schema}"')
+
+    pool = AsyncConnectionPool(
+        conninfo=TEST_POSTGRES_URL,
+        kwargs={
+            "autocommit": True,
+            "prepare_threshold": 0,
+            "options": f"-c search_path={schema}",
+        },
+        open=False,
+    )
+    await pool.open(wait=True)
+    await AsyncPostgresSaver(conn=pool).setup()  # type: ignore[call-arg]
+    try:
+        yield pool
+    finally:
+        await pool.close()
+        async with await psycopg.AsyncConnection.connect(
+            TEST_POSTGRES_URL, autocommit=True
+        ) as conn:
+            await conn.execute(f'DROP SCHEMA "{schema}" CASCADE')
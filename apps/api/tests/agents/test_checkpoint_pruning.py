@@ -0,0 +1,189 @@
+"""
+Tests for pruning old LangGraph checkpoints (prune_checkpoints).
+
+Synthetic conversation threads are produced by running a small graph on the
+Postgres checkpointer, so the tables hold what real runs write.
+
+Usage:
+    TEST_POSTGRES_URL=postgresql://localhost/postgres \
+        pytest tests/agents/test_checkpoint_pruning.py -v
+"""
+
+import operator
+from typing import Annotated, Dict, List, TypedDict
+
+import pytest
+from app.agents.core.graph_builder.checkpoint_pruning import prune_checkpoints
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.graph import END, START, StateGraph
+
+TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+
+class ConversationState(TypedDict):
+    messages: Annotated[List[str], operator.add]
+    turns: int
+
+
+def respond(state: ConversationState) -> Dict:
+    return {"messages": [f"reply {len(state['messages'])}"]}
+
+
+def count_turn(state: ConversationState) -> Dict:
+    return {"turns": state.get("turns", 0) + 1}
+
+
+def build_graph(pool):
+    builder = StateGraph(ConversationState)
+    builder.add_node("respond", respond)
+    builder.add_node("count_turn", count_turn)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", "count_turn")
+    builder.add_edge("count_turn", END)
+    return builder.compile(checkpointer=AsyncPostgresSaver(conn=pool))  # type: ignore[call-arg]
+
+
+def config(thread_id: str) -> Dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+async def chat(graph, thread_id: str, turns: int) -> None:
+    for turn in range(turns):
+        await graph.ainvoke({"messages": [f"user {turn}"]}, config(thread_id))
+
+
+async def count_rows(pool) -> Dict[str, int]:
+    counts = {}
+    async with pool.connection() as conn:
+        for table in TABLES:
+            cursor = await conn.execute(f"SELECT count(*) FROM {table}")
+            counts[table] = (await cursor.fetchone())[0]
+    return counts
+
+
+async def checkpoints_per_thread(pool) -> Dict[str, int]:
+    async with pool.connection() as conn:
+        cursor = await conn.execute(
+            "SELECT thread_id, count(*) FROM checkpoints GROUP BY thread_id"
+        )
+        return dict(await cursor.fetchall())
+
+
+async def test_keeps_latest_checkpoints_and_state(checkpoint_pool):
+    graph = build_graph(checkpoint_pool)
+    threads = [f"thread-{i}" for i in range(5)]
+    for thread_id in threads:
+        await chat(graph, thread_id, turns=6)
+    await chat(graph, "short-thread", turns=1)
+
+    states = {t: await graph.aget_state(config(t)) for t in threads}
+    # One turn writes no more checkpoints than are kept
+    short_before = (await checkpoints_per_thread(checkpoint_pool))["short-thread"]
+    assert short_before <= 4
+    before = await count_rows(checkpoint_pool)
+
+    result = await prune_checkpoints(
+        checkpoint_pool, keep_latest=4, thread_batch_size=2
+    )
+
+    after = await count_rows(checkpoint_pool)
+    per_thread = await checkpoints_per_thread(checkpoint_pool)
+    assert all(per_thread[t] == 4 for t in threads)
+    assert per_thread["short-thread"] == short_before
+    assert result.threads == len(threads) + 1
+    assert result.checkpoints == before["checkpoints"] - after["checkpoints"]
+    assert result.writes == before["checkpoint_writes"] - after["checkpoint_writes"]
+    assert result.blobs == before["checkpoint_blobs"] - after["checkpoint_blobs"]
+    assert result.writes > 0 and result.blobs > 0
+
+    for thread_id in threads:
+        state = await graph.aget_state(config(thread_id))
+        assert state.values == states[thread_id].values
+        assert state.values["turns"] == 6
+
+
+async def test_leaves_no_orphans(checkpoint_pool):
+    graph = build_graph(checkpoint_pool)
+    for thread_id in ("a", "b"):
+        await chat(graph, thread_id, turns=5)
+
+    await prune_checkpoints(checkpoint_pool, keep_latest=1)
+
+    async with checkpoint_pool.connection() as conn:
+        cursor = await conn.execute(
+            """
+            SELECT count(*) FROM checkpoint_writes w
+            WHERE NOT EXISTS (
+                SELECT 1 FROM checkpoints c
+                WHERE c.thread_id = w.thread_id
+                    AND c.checkpoint_ns = w.checkpoint_ns
+                    AND c.checkpoint_id = w.checkpoint_id
+            )
+            """
+        )
+        assert (await cursor.fetchone())[0] == 0
+
+        cursor = await conn.execute(
+            """
+            SELECT count(*) FROM checkpoint_blobs b
+            WHERE NOT EXISTS (
+                SELECT 1 FROM checkpoints c
+                WHERE c.thread_id = b.thread_id
+                    AND c.checkpoint_ns = b.checkpoint_ns
+                    AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+            )
+            """
+        )
+        assert (await cursor.fetchone())[0] == 0
+
+
+async def test_conversation_continues_after_pruning(checkpoint_pool):
+    graph = build_graph(checkpoint_pool)
+    await chat(graph, "thread", turns=4)
+
+    await prune_checkpoints(checkpoint_pool, keep_latest=1)
+    await chat(graph, "thread", turns=1)
+
+    state = await graph.aget_state(config("thread"))
+    assert state.values["turns"] == 5
+    assert len(state.values["messages"]) == 10
+
+
+async def test_second_run_reclaims_nothing(checkpoint_pool):
+    graph = build_graph(checkpoint_pool)
+    await chat(graph, "thread", turns=4)
+
+    await prune_checkpoints(checkpoint_pool, keep_latest=2)
+    result = await prune_checkpoints(checkpoint_pool, keep_latest=2)
+
+    assert result.rows == 0
+
+
+async def test_keeps_blobs_newer_than_every_checkpoint(checkpoint_pool):
+    graph = build_graph(checkpoint_pool)
+    await chat(graph, "thread", turns=3)
+
+    # A blob written for a checkpoint that isn't committed yet
+    async with checkpoint_pool.connection() as conn:
+        await conn.execute(
+            """
+            INSERT INTO checkpoint_blobs
+                (thread_id, checkpoint_ns, channel, version, type, blob)
+            VALUES ('thread', '', 'messages', %s, 'empty', NULL)
+            """,
+            ("9" * 32 + ".0",),
+        )
+
+    await prune_checkpoints(checkpoint_pool, keep_latest=1)
+
+    async with checkpoint_pool.connection() as conn:
+        cursor = await conn.execute(
+            "SELECT count(*) FROM checkpoint_blobs WHERE version = %s",
+            ("9" * 32 + ".0",),
+        )
+        assert (await cursor.fetchone())[0] == 1
+
+
+async def test_rejects_keeping_no_checkpoints(checkpoint_pool):
+    with pytest.raises(ValueError):
+        await prune_checkpoints(checkpoint_pool, keep_latest=0)
@@ -0,0 +1,322 @@
+"""
+Pytest fixtures for service tests.
+
+Provides:
+- fake_mem0: In-memory stand-in for the Mem0 AsyncMemoryClient that counts calls
+- memory_service: A fresh MemoryService wired to fake_mem0
+- fake_redis: In-memory stand-in for the Redis commands the memory buffer uses
+- memory_buffer: A MemoryWriteBuffer on fake_redis that stores through memory_service
+- file_contents: In-memory stand-in for the file_contents collection, wired into
+  file_content_service
+- content_embeddings: Records the embedding deletes file_content_service makes
+"""
+
+import asyncio
+import copy
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pytest
+from app.services import file_content_service, memory_buffer_service
+from app.services.memory_buffer_service import MemoryWriteBuffer
+from app.services.memory_service import MemoryService
+from pymongo.errors import DuplicateKeyError
+
+
+class FakeMem0Client:
+    """Records memories in memory and counts remote calls."""
+
+    def __init__(self, latency: float = 0.01) -> None:
+        self.latency = latency
+        self.memories: List[str] = []
+        self.search_calls = 0
+        self.add_calls = 0
+        self.added_batches: List[List[Dict[str, str]]] = []
+        self.fail_adds = False
+
+    async def search(
+        self,
+        query: str,
+        filters: Dict[str, Any],
+        limit: int = 5,
+        rerank: bool = False,
+        threshold: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        self.search_calls += 1
+        await asyncio.sleep(self.latency)
+        return {
+            "results": [
+                {
+                    "id": f"mem-{index}",
+                    "memory": memory,
+                    "user_id": filters["user_id"],
+                    "score": 0.9,
+                }
+                for index, memory in enumerate(self.memories[:limit])
+            ]
+        }
+
+    async def add(self, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        self.add_calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail_adds:
+            raise RuntimeError("mem0 unavailable")
+        self.added_batches.append(list(messages))
+        self.memories.extend(message["content"] for message in messages)
+        return {
+            "results": [
+                {
+                    "message": "Memory processing has been queued",
+                    "event_id": f"event-{self.add_calls}",
+                    "status": "PENDING",
+                }
+            ]
+        }
+
+
+class FakeRedis:
+    """Strings, lists and sorted sets in memory; expiry is not modelled."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+
+    async def set(
+        self,
+        key: str,
+        value: str,
+        nx: bool = False,
+        ex: Optional[int] = None,
+        get: bool = False,
+    ) -> Any:
+        previous = self.data.get(key)
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return previous if get else True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.data)
+
+    async def rename(self, key: str, new_key: str) -> bool:
+        self.data[new_key] = self.data.pop(key)
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def rpush(self, key: str, *values: str) -> int:
+        items = self.data.setdefault(key, [])
+        items.extend(values)
+        return len(items)
+
+    async def lrange(self, key: str, start: int, end: int) -> List[str]:
+        items = self.data.get(key, [])
+        return items[start : None if end == -1 else end + 1]
+
+    async def ltrim(self, key: str, start: int, end: int) -> bool:
+        items = self.data.get(key, [])
+        trimmed = items[start : None if end == -1 else end + 1]
+        if trimmed:
+            self.data[key] = trimmed
+        else:
+            self.data.pop(key, None)
+        return True
+
+    async def zadd(self, key: str, mapping: Dict[str, float], nx: bool = False) -> int:
+        scores = self.data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if nx and member in scores:
+                continue
+            added += member not in scores
+            scores[member] = score
+        return added
+
+    async def zrem(self, key: str, *members: str) -> int:
+        scores = self.data.get(key, {})
+        removed = sum(scores.pop(member, None) is not None for member in members)
+        if not scores:
+            self.data.pop(key, None)
+        return removed
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min: Any,
+        max: Any,
+        start: int = 0,
+        num: Optional[int] = None,
+    ) -> List[str]:
+        low = float(min)
+        high = float(max)
+        members = sorted(
+            (score, member)
+            for member, score in self.data.get(key, {}).items()
+            if low <= score <= high
+        )
+        selected = [member for _, member in members][start:]
+        return selected if num is None else selected[:num]
+
+
+def _matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    for field, condition in query.items():
+        value = document.get(field)
+        if isinstance(condition, dict):
+            if "$lte" in condition and not (
+                value is not None and value <= condition["$lte"]
+            ):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _set_path(document: Dict[str, Any], path: str, value: Any) -> None:
+    *parents, field = path.split(".")
+    for parent in parents:
+        document = document.setdefault(parent, {})
+    document[field] = copy.deepcopy(value)
+
+
+def _unset_path(document: Dict[str, Any], path: str) -> None:
+    *parents, field = path.split(".")
+    for parent in parents:
+        document = document.get(parent, {})
+    document.pop(field, None)
+
+
+class FakeFileContents:
+    """
+    The file_contents operations file_content_service uses, each applied
+    atomically like MongoDB does.
+
+    Hooks let tests interleave other calls at the points where a real
+    deployment could race: ``on_upsert`` runs before an upsert (and may create
+    the record, to simulate a concurrent insert) and ``before_delete`` before
+    the garbage collecting delete.
+    """
+
+    def __init__(self) -> None:
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.on_upsert: Optional[Callable[[], Awaitable[None]]] = None
+        self.before_delete: Optional[Callable[[], Awaitable[None]]] = None
+
+    async def find_one(self, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        for document in self.docs.values():
+            if _matches(document, query):
+                return copy.deepcopy(document)
+        return None
+
+    async def find_one_and_update(
+        self,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+        return_document: Any = None,
+    ) -> Optional[Dict[str, Any]]:
+        if upsert and self.on_upsert:
+            hook, self.on_upsert = self.on_upsert, None
+            existed = query["_id"] in self.docs
+            await hook()
+            if not existed and query["_id"] in self.docs:
+                raise DuplicateKeyError("E11000 duplicate key error")
+
+        document = self.docs.get(query["_id"])
+        if document is None:
+            if not upsert:
+                return None
+            document = self.docs[query["_id"]] = {"_id": query["_id"]}
+            for path, value in update.get("$setOnInsert", {}).items():
+                _set_path(document, path, value)
+        for path, value in update.get("$inc", {}).items():
+            document[path] = document.get(path, 0) + value
+        return copy.deepcopy(document)
+
+    async def update_one(
+        self, query: Dict[str, Any], update: Dict[str, Any]
+    ) -> SimpleNamespace:
+        document = await self.find_one(query)
+        if document is None:
+            return SimpleNamespace(matched_count=0)
+        document = self.docs[document["_id"]]
+        for path, value in update.get("$set", {}).items():
+            _set_path(document, path, value)
+        for path in update.get("$unset", {}):
+            _unset_path(document, path)
+        return SimpleNamespace(matched_count=1)
+
+    async def delete_one(self, query: Dict[str, Any]) -> SimpleNamespace:
+        if self.before_delete:
+            hook, self.before_delete = self.before_delete, None
+            await hook()
+        document = await self.find_one(query)
+        if document is None:
+            return SimpleNamespace(deleted_count=0)
+        del self.docs[document["_id"]]
+        return SimpleNamespace(deleted_count=1)
+
+
+class FakeContentEmbeddings:
+    """Records the ``where`` filters embeddings are deleted with."""
+
+    def __init__(self) -> None:
+        self.deleted: List[Dict[str, Any]] = []
+
+    async def adelete(self, where: Dict[str, Any]) -> None:
+        self.deleted.append(where)
+
+
+@pytest.fixture
+def fake_mem0() -> FakeMem0Client:
+    return FakeMem0Client()
+
+
+@pytest.fixture
+def memory_service(fake_mem0: FakeMem0Client, monkeypatch) -> MemoryService:
+    service = MemoryService()
+
+    async def get_client() -> FakeMem0Client:
+        return fake_mem0
+
+    monkeypatch.setattr(service, "_get_client", get_client)
+    return service
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def memory_buffer(
+    fake_redis: FakeRedis, memory_service: MemoryService, monkeypatch
+) -> MemoryWriteBuffer:
+    monkeypatch.setattr(memory_buffer_service, "memory_service", memory_service)
+    return MemoryWriteBuffer(redis=fake_redis)
+
+
+@pytest.fixture
+def file_contents(monkeypatch) -> FakeFileContents:
+    contents = FakeFileContents()
+    monkeypatch.setattr(file_content_service, "file_contents_collection", contents)
+    return contents
+
+
+@pytest.fixture
+def content_embeddings(monkeypatch) -> FakeContentEmbeddings:
+    embeddings = FakeContentEmbeddings()
+
+    async def get_langchain_client(collection_name: str) -> FakeContentEmbeddings:
+        assert collection_name == file_content_service.CONTENT_EMBEDDINGS_COLLECTION
+        return embeddings
+
+    monkeypatch.setattr(
+        file_content_service.ChromaClient,
+        "get_langchain_client",
+        staticmethod(get_langchain_client),
+    )
+    return embeddings
@@ -0,0 +1,121 @@
+"""
+Tests for reference counting of a user's shared upload contents (file_content_service).
+
+Usage:
+    pytest tests/services/test_file_content_refcount.py -v
+"""
+
+from app.models.files_models import FileIngestionStage, FileStatus
+from app.services.file_content_service import (
+    acquire_content,
+    content_key,
+    release_content,
+)
+
+USER_ID = "user-1"
+SHA256 = "a" * 64
+CONTENT_HASH = content_key(USER_ID, SHA256)
+
+
+async def acquire(user_id: str = USER_ID) -> dict:
+    return await acquire_content(user_id, SHA256, "application/pdf", 1024)
+
+
+async def test_duplicate_uploads_share_one_content(file_contents):
+    first = await acquire()
+    second = await acquire()
+
+    assert second["_id"] == CONTENT_HASH
+    assert second["artifact_id"] == first["artifact_id"]
+    assert second["refcount"] == 2
+    assert second["status"] == FileStatus.PROCESSING
+    assert list(file_contents.docs) == [CONTENT_HASH]
+
+
+async def test_users_never_share_content(file_contents):
+    own = await acquire()
+    other = await acquire("user-2")
+
+    assert other["_id"] == content_key("user-2", SHA256) != own["_id"]
+    assert other["artifact_id"] != own["artifact_id"]
+    assert other["refcount"] == own["refcount"] == 1
+
+
+async def test_content_is_collected_on_last_release(file_contents, content_embeddings):
+    content = await acquire()
+    await acquire()
+
+    await release_content(CONTENT_HASH)
+    assert file_contents.docs[CONTENT_HASH]["refcount"] == 1
+    assert content_embeddings.deleted == []
+
+    await release_content(CONTENT_HASH)
+    assert CONTENT_HASH not in file_contents.docs
+    assert content_embeddings.deleted == [{"artifact_id": content["artifact_id"]}]
+
+
+async def test_upload_during_last_release_keeps_content(
+    file_contents, content_embeddings
+):
+    content = await acquire()
+    # A new upload takes a reference after the count reached zero but before
+    # the record is deleted
+    file_contents.before_delete = acquire
+
+    await release_content(CONTENT_HASH)
+
+    assert file_contents.docs[CONTENT_HASH]["refcount"] == 1
+    assert file_contents.docs[CONTENT_HASH]["artifact_id"] == content["artifact_id"]
+    assert content_embeddings.deleted == []
+
+
+async def test_concurrent_first_uploads_both_take_a_reference(file_contents):
+    # Another upload inserts the record between our lookup and our insert
+    file_contents.on_upsert = acquire
+
+    content = await acquire()
+
+    assert content["refcount"] == 2
+    assert file_contents.docs[CONTENT_HASH]["refcount"] == 2
+
+
+async def test_failed_content_is_reset_by_a_new_upload(file_contents):
+    await acquire()
+    file_contents.docs[CONTENT_HASH].update(
+        status=FileStatus.FAILED,
+        ingestion={
+            "stage": FileIngestionStage.SUMMARIZE,
+            "resumes": 3,
+            "error": "summarize: rate limited",
+        },
+    )
+
+    content = await acquire()
+
+    stored = file_contents.docs[CONTENT_HASH]
+    assert content["status"] == stored["status"] == FileStatus.PROCESSING
+    assert stored["refcount"] == 2
+    # Ingestion resumes at the stage that failed
+    assert stored["ingestion"]["stage"] == FileIngestionStage.SUMMARIZE
+    assert stored["ingestion"]["resumes"] == 0
+    assert "error" not in stored["ingestion"]
+
+
+async def test_recreated_content_gets_a_new_artifact(file_contents, content_embeddings):
+    collected = await acquire()
+    await release_content(CONTENT_HASH)
+
+    recreated = await acquire()
+
+    assert recreated["artifact_id"] != collected["artifact_id"]
+    assert recreated["refcount"] == 1
+    assert content_embeddings.deleted == [{"artifact_id": collected["artifact_id"]}]
+
+
+async def test_releasing_a_missing_content_is_a_no_op(
+    file_contents, content_embeddings
+):
+    await release_content(CONTENT_HASH)
+
+    assert file_contents.docs == {}
+    assert content_embeddings.deleted == []
@@ -0,0 +1,120 @@
+"""
+Tests for the short-lived Mem0 search cache in MemoryService.
+
+Usage:
+    pytest tests/services/test_memory_search_cache.py -v
+"""
+
+import asyncio
+
+from app.services import memory_service as memory_service_module
+
+USER_ID = "user-1"
+
+
+async def test_repeated_search_is_served_from_cache(memory_service, fake_mem0):
+    fake_mem0.memories = ["likes tea"]
+
+    first = await memory_service.search_memories("What do I drink?", USER_ID)
+    second = await memory_service.search_memories("  what do i DRINK  ", USER_ID)
+
+    assert fake_mem0.search_calls == 1
+    assert [m.content for m in second.memories] == ["likes tea"]
+    assert second is first
+
+
+async def test_concurrent_searches_are_coalesced(memory_service, fake_mem0):
+    results = await asyncio.gather(
+        *(memory_service.search_memories("favourite food", USER_ID) for _ in range(10))
+    )
+
+    assert fake_mem0.search_calls == 1
+    assert all(result is results[0] for result in results)
+
+
+async def test_cache_is_per_user_and_per_parameters(memory_service, fake_mem0):
+    await memory_service.search_memories("food", USER_ID)
+    await memory_service.search_memories("food", "user-2")
+    await memory_service.search_memories("food", USER_ID, limit=10)
+    await memory_service.search_memories("food", USER_ID, threshold=0.5)
+
+    assert fake_mem0.search_calls == 4
+
+
+async def test_store_memory_invalidates_user_searches(memory_service, fake_mem0):
+    assert not (await memory_service.search_memories("drinks", USER_ID)).memories
+
+    await memory_service.store_memory("likes coffee", USER_ID)
+    result = await memory_service.search_memories("drinks", USER_ID)
+
+    assert fake_mem0.search_calls == 2
+    assert [m.content for m in result.memories] == ["likes coffee"]
+
+
+async def test_store_memory_batch_invalidates_user_searches(memory_service, fake_mem0):
+    await memory_service.search_memories("drinks", USER_ID)
+    await memory_service.search_memories("drinks", "user-2")
+
+    await memory_service.store_memory_batch(
+        [{"role": "user", "content": "likes coffee"}], user_id=USER_ID
+    )
+    await memory_service.search_memories("drinks", USER_ID)
+    await memory_service.search_memories("drinks", "user-2")
+
+    # Only the writing user's cache is invalidated
+    assert fake_mem0.search_calls == 3
+
+
+async def test_failed_write_still_invalidates(memory_service, fake_mem0):
+    await memory_service.search_memories("drinks", USER_ID)
+    fake_mem0.fail_adds = True
+
+    assert await memory_service.store_memory("likes coffee", USER_ID) is None
+    await memory_service.search_memories("drinks", USER_ID)
+
+    assert fake_mem0.search_calls == 2
+
+
+async def test_search_in_flight_during_write_is_not_cached(memory_service, fake_mem0):
+    fake_mem0.latency = 0.05
+    in_flight = asyncio.create_task(memory_service.search_memories("drinks", USER_ID))
+    await asyncio.sleep(0.01)
+
+    await memory_service.store_memory("likes coffee", USER_ID)
+    await in_flight
+    result = await memory_service.search_memories("drinks", USER_ID)
+
+    assert fake_mem0.search_calls == 2
+    assert [m.content for m in result.memories] == ["likes coffee"]
+
+
+async def test_entries_expire(memory_service, fake_mem0, monkeypatch):
+    monkeypatch.setattr(memory_service_module, "MEMORY_SEARCH_CACHE_TTL", 0)
+
+    await memory_service.search_memories("drinks", USER_ID)
+    await memory_service.search_memories("drinks", USER_ID)
+
+    assert fake_mem0.search_calls == 2
+
+
+async def test_failed_search_is_not_cached(memory_service, fake_mem0, monkeypatch):
+    async def failing_search(**kwargs):
+        fake_mem0.search_calls += 1
+        raise RuntimeError("mem0 unavailable")
+
+    monkeypatch.setattr(fake_mem0, "search", failing_search)
+
+    assert (await memory_service.search_memories("drinks", USER_ID)).memories == []
+    await memory_service.search_memories("drinks", USER_ID)
+
+    assert fake_mem0.search_calls == 2
+
+
+async def test_cache_is_bounded(memory_service, fake_mem0, monkeypatch):
+    size = 3
+    monkeypatch.setattr(memory_service_module, "MEMORY_SEARCH_CACHE_MAX_SIZE", size)
+
+    for index in range(size + 2):
+        await memory_service.search_memories(f"query {index}", USER_ID)
+
+    assert len(memory_service._search_cache) == size
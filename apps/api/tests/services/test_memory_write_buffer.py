@@ -0,0 +1,148 @@
+"""
+Tests for write-behind buffering of chat memories (MemoryWriteBuffer).
+
+Usage:
+    pytest tests/services/test_memory_write_buffer.py -v
+"""
+
+import asyncio
+import time
+
+from app.constants.memory import (
+    MEMORY_BUFFER_MAX_AGE,
+    MEMORY_BUFFER_MAX_CONCURRENT_FLUSHES,
+    MEMORY_BUFFER_MAX_MESSAGES,
+)
+from app.services.memory_buffer_service import DUE_KEY, MemoryWriteBuffer
+
+USER_ID = "user-1"
+CONVERSATION_ID = "conversation-1"
+
+
+def stored_contents(fake_mem0) -> list:
+    return [
+        message["content"] for batch in fake_mem0.added_batches for message in batch
+    ]
+
+
+async def test_messages_are_stored_in_batches(memory_buffer, fake_mem0):
+    messages = [f"message {i}" for i in range(MEMORY_BUFFER_MAX_MESSAGES * 5)]
+
+    for message in messages:
+        assert await memory_buffer.append(USER_ID, message, CONVERSATION_ID)
+        await asyncio.sleep(0)
+    await memory_buffer.close()
+    await memory_buffer.flush(USER_ID, CONVERSATION_ID)
+
+    assert fake_mem0.add_calls <= 5
+    assert stored_contents(fake_mem0) == messages
+
+
+async def test_small_buffer_waits_for_its_age(memory_buffer, fake_mem0, fake_redis):
+    await memory_buffer.append(USER_ID, "likes tea", CONVERSATION_ID)
+    await memory_buffer.close()
+
+    assert await memory_buffer.sweep() == 0
+    assert fake_mem0.add_calls == 0
+
+    assert await memory_buffer.sweep(now=time.time() + MEMORY_BUFFER_MAX_AGE) == 1
+    assert stored_contents(fake_mem0) == ["likes tea"]
+    assert DUE_KEY not in fake_redis.data
+
+
+async def test_switching_conversation_flushes_the_previous_one(
+    memory_buffer, fake_mem0
+):
+    await memory_buffer.append(USER_ID, "likes tea", CONVERSATION_ID)
+    await memory_buffer.append(USER_ID, "lives in Paris", "conversation-2")
+    await memory_buffer.close()
+
+    assert stored_contents(fake_mem0) == ["likes tea"]
+
+
+async def test_failed_flush_keeps_messages_for_retry(
+    memory_buffer, fake_mem0, fake_redis
+):
+    fake_mem0.fail_adds = True
+    for i in range(3):
+        await memory_buffer.append(USER_ID, f"message {i}", CONVERSATION_ID)
+
+    assert await memory_buffer.flush(USER_ID, CONVERSATION_ID) == 0
+    assert fake_redis.data[DUE_KEY][f"{USER_ID}:{CONVERSATION_ID}"] > time.time()
+
+    fake_mem0.fail_adds = False
+    await memory_buffer.append(USER_ID, "message 3", CONVERSATION_ID)
+    assert await memory_buffer.sweep(now=time.time() + MEMORY_BUFFER_MAX_AGE) == 4
+
+    # The batch that was in flight goes first, then messages queued since
+    assert fake_mem0.added_batches == [
+        [{"role": "user", "content": f"message {i}"} for i in range(3)],
+        [{"role": "user", "content": "message 3"}],
+    ]
+    buffer_key = f"memory_buffer:{USER_ID}:{CONVERSATION_ID}"
+    assert buffer_key not in fake_redis.data
+    assert f"{buffer_key}:inflight" not in fake_redis.data
+    assert DUE_KEY not in fake_redis.data
+
+
+async def test_messages_survive_a_crash_mid_flush(
+    memory_buffer, memory_service, fake_mem0, fake_redis
+):
+    fake_mem0.latency = 1
+    for i in range(3):
+        await memory_buffer.append(USER_ID, f"message {i}", CONVERSATION_ID)
+
+    # Crash while Mem0 is handling the batch; the lease outlives the process
+    flush = asyncio.create_task(memory_buffer.flush(USER_ID, CONVERSATION_ID))
+    await asyncio.sleep(0.1)
+    flush.cancel()
+    await asyncio.gather(flush, return_exceptions=True)
+    fake_redis.data[f"memory_buffer:lease:{USER_ID}:{CONVERSATION_ID}"] = "1"
+    fake_mem0.added_batches.clear()
+    fake_mem0.latency = 0
+
+    # A restarted process leaves the buffer alone until the lease expires
+    restarted = MemoryWriteBuffer(redis=fake_redis)
+    later = time.time() + MEMORY_BUFFER_MAX_AGE
+    assert await restarted.sweep(now=later) == 0
+
+    del fake_redis.data[f"memory_buffer:lease:{USER_ID}:{CONVERSATION_ID}"]
+    assert await restarted.sweep(now=later) == 3
+    assert stored_contents(fake_mem0) == [f"message {i}" for i in range(3)]
+
+
+async def test_slow_backend_gets_fewer_larger_batches(memory_buffer, fake_mem0):
+    fake_mem0.latency = 0.2
+    users = [f"user-{i}" for i in range(MEMORY_BUFFER_MAX_CONCURRENT_FLUSHES)]
+    # Occupy every flush slot
+    for user_id in users:
+        for i in range(MEMORY_BUFFER_MAX_MESSAGES):
+            await memory_buffer.append(user_id, f"{i}", CONVERSATION_ID)
+    await asyncio.sleep(0)
+
+    # Crossing the size threshold while slots are busy doesn't queue flushes
+    for i in range(MEMORY_BUFFER_MAX_MESSAGES * 3):
+        await memory_buffer.append(USER_ID, f"late {i}", CONVERSATION_ID)
+    await memory_buffer.close()
+    await memory_buffer.flush(USER_ID, CONVERSATION_ID)
+
+    late_batches = [
+        batch
+        for batch in fake_mem0.added_batches
+        if batch[0]["content"].startswith("late")
+    ]
+    assert len(late_batches) == 1
+    assert len(late_batches[0]) == MEMORY_BUFFER_MAX_MESSAGES * 3
+
+
+async def test_falls_back_to_direct_store_without_redis(
+    memory_service, fake_mem0, monkeypatch
+):
+    from app.services import memory_buffer_service
+
+    monkeypatch.setattr(memory_buffer_service, "memory_service", memory_service)
+    monkeypatch.setattr(memory_buffer_service.redis_cache, "redis", None)
+    buffer = MemoryWriteBuffer()
+
+    assert await buffer.append(USER_ID, "likes tea", CONVERSATION_ID)
+    assert fake_mem0.add_calls == 1
@@ -17,6 +17,8 @@ export interface FileUploadResponse {
   url?: string;
   description?: string;
   message?: string;
+  // "processing" until indexed; poll GET /{fileId}/status for the outcome
+  status?: "processing" | "indexed" | "failed";
 }
 
 export interface GenerateImageResponse {
@@ -47,6 +49,9 @@ export interface ConversationWithMessages {
   id: string;
   title: string;
   messages: MessageType[];
+  // Present only when messages were requested with a limit
+  message_count?: number;
+  messages_offset?: number;
 }
 
 export interface FetchConversationsResponse {
@@ -60,6 +65,9 @@ export interface FetchConversationsResponse {
 export interface ConversationSyncItem {
   conversation_id: string;
   last_updated?: string;
+  // Newest message the client has; the server then returns only later ones,
+  // plus earlier ones changed since last_updated (as updated_messages)
+  last_message_id?: string;
 }
 
 export const chatApi = {
@@ -90,6 +98,11 @@ export const chatApi = {
       createdAt: string;
       updatedAt?: string;
       messages: MessageType[];
+      message_count: number;
+      // Index of the first returned message; 0 means the full list was sent
+      messages_offset: number;
+      // Messages before messages_offset changed in place (e.g. pinned)
+      updated_messages?: MessageType[];
     }[];
   }> => {
     return apiService.post(
@@ -53,12 +53,15 @@ const mergeMessageLists = (
 const mapApiMessagesToStored = (
   messages: MessageType[],
   conversationId: string,
+  // Position of the first message in the full conversation (delta syncs)
+  offset = 0,
 ): IMessage[] =>
   messages.map((message, index) => {
     const createdAt = message.date ? new Date(message.date) : new Date();
     const role = mapMessageRole(message.type);
     const messageId =
-      message.message_id || `${conversationId}-${index}-${createdAt.getTime()}`;
+      message.message_id ||
+      `${conversationId}-${offset + index}-${createdAt.getTime()}`;
 
     return {
       id: messageId,
@@ -76,6 +79,7 @@ const mapApiMessagesToStored = (
       workflowId: message.selectedWorkflow?.id ?? null,
       follow_up_actions: message.follow_up_actions,
       image_data: message.image_data,
+      pinned: message.pinned,
       isConvoSystemGenerated: message.isConvoSystemGenerated,
       memory_data: message.memory_data,
       tool_data: message.tool_data,
@@ -105,6 +109,27 @@ const toTimestamp = (timestamp?: string): number => {
   return Number.isNaN(parsed.getTime()) ? 0 : parsed.getTime();
 };
 
+/**
+ * Newest locally stored message that came from the backend, used as the
+ * delta-sync anchor so only messages after it are fetched.
+ */
+const getLastSyncedMessageId = async (
+  conversationId: string,
+): Promise<string | undefined> => {
+  const messages = await db.getMessagesForConversation(conversationId);
+  for (let i = messages.length - 1; i >= 0; i--) {
+    const message = messages[i];
+    if (
+      message.messageId &&
+      !message.optimistic &&
+      message.status === "sent"
+    ) {
+      return message.messageId;
+    }
+  }
+  return undefined;
+};
+
 const identifyStaleConversations = (
   localConversations: IConversation[],
   remoteConversations: Conversation[],
@@ -226,6 +251,17 @@ export const batchSyncConversations = async (): Promise<void> => {
       return;
     }
 
+    // Conversations we already have only need messages after the newest one
+    await Promise.all(
+      staleItems.map(async (item) => {
+        if (item.last_updated) {
+          item.last_message_id = await getLastSyncedMessageId(
+            item.conversation_id,
+          );
+        }
+      }),
+    );
+
     const { conversations: freshConversations } =
       await chatApi.batchSyncConversations(staleItems);
 
@@ -255,14 +291,24 @@ export const batchSyncConversations = async (): Promise<void> => {
             : new Date(conversation.createdAt),
         };
 
-        const remoteMessages = mapApiMessagesToStored(messages, conversationId);
+        // Earlier messages changed in place all have a message_id, so their
+        // position doesn't matter
+        const updatedMessages = conversation.updated_messages ?? [];
+        const remoteMessages = [
+          ...mapApiMessagesToStored(updatedMessages, conversationId),
+          ...mapApiMessagesToStored(
+            messages,
+            conversationId,
+            conversation.messages_offset,
+          ),
+        ];
         const localMessages =
           await db.getMessagesForConversation(conversationId);
         const mergedMessages = mergeMessageLists(localMessages, remoteMessages);
 
         await Promise.allSettled([
           db.putConversation(mappedConversation),
-          messages.length > 0
+          remoteMessages.length > 0
             ? db.syncMessages(conversationId, mergedMessages)
             : Promise.resolve(),
         ]);
@@ -531,6 +531,7 @@ export interface PaginatedNotificationsResponse {
   total: number;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
 }
 
 // Hook options